@@ -22,12 +22,14 @@ Design Notes
 - All edges are directional (u → v)
 - DAG validity is enforced during edge insertion
 - Traversal utilities do not enforce DAG invariants
+- String vertex identifiers are interned on mutation
 - No I/O or persistence logic exists in this module
 ------------------------------------------------------------------------------------
 """
 
+import sys
 from collections import deque
-from typing import Any, List, Set
+from typing import Any, List, Optional, Set
 
 
 # ------------------------------------------------------------------
@@ -43,24 +45,40 @@ def insert_vertex(graph: dict, vertex: Any) -> None:
     :param vertex: Hashable vertex identifier
     :return: None
     """
+    vertex = _intern(vertex)
+
     if vertex not in graph:
         graph[vertex] = []
 
 
-def insert_edge(graph: dict, from_vertex: Any, to_vertex: Any) -> None:
+def insert_edge(
+        graph: dict,
+        from_vertex: Any,
+        to_vertex: Any,
+        checked: Optional[Set[Any]] = None,
+        rec_stack: Optional[Set[Any]] = None
+) -> None:
     """
     Insert a directed edge (from_vertex → to_vertex).
 
     Vertices are auto-created if missing.
     If the edge introduces a cycle, it is rolled back to
-    preserve the DAG invariant.
+    preserve the DAG invariant. The cycle check is skipped when
+    from_vertex is newly created or to_vertex has no outgoing edges.
 
     :param graph: Directed adjacency list
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
+    :param checked: Optional reusable scratch set for cycle detection
+    :param rec_stack: Optional reusable scratch set for cycle detection
     :return: None
     """
-    if from_vertex not in graph:
+    from_vertex = _intern(from_vertex)
+    to_vertex = _intern(to_vertex)
+
+    # A freshly created source has no incoming edges
+    is_new_source = from_vertex not in graph
+    if is_new_source:
         graph[from_vertex] = []
 
     if to_vertex not in graph:
@@ -69,10 +87,16 @@ def insert_edge(graph: dict, from_vertex: Any, to_vertex: Any) -> None:
     if to_vertex in graph[from_vertex]:
         return
 
+    # Edges out of a source or into a sink can never close a cycle
+    # (self-loops excepted)
+    if from_vertex != to_vertex and (is_new_source or not graph[to_vertex]):
+        graph[from_vertex].append(to_vertex)
+        return
+
     graph[from_vertex].append(to_vertex)
 
     # Enforce DAG invariant
-    if not is_dag(graph):
+    if not is_dag(graph, checked, rec_stack):
         graph[from_vertex].remove(to_vertex)
 
 
@@ -86,6 +110,8 @@ def remove_vertex(graph: dict, vertex: Any) -> None:
     :param vertex: Vertex to remove
     :return: None
     """
+    vertex = _intern(vertex)
+
     if vertex not in graph:
         return
 
@@ -112,6 +138,9 @@ def remove_edge(graph: dict, from_vertex: Any, to_vertex: Any) -> None:
     :param to_vertex: Destination vertex
     :return: None
     """
+    from_vertex = _intern(from_vertex)
+    to_vertex = _intern(to_vertex)
+
     if from_vertex in graph and to_vertex in graph[from_vertex]:
         graph[from_vertex].remove(to_vertex)
 
@@ -119,14 +148,20 @@ def remove_edge(graph: dict, from_vertex: Any, to_vertex: Any) -> None:
 # ------------------------------------------------------------------
 # DAG Properties
 # ------------------------------------------------------------------
-def is_dag(graph: dict) -> bool:
+def is_dag(
+        graph: dict,
+        checked: Optional[Set[Any]] = None,
+        rec_stack: Optional[Set[Any]] = None
+) -> bool:
     """
     Determine whether the graph is acyclic.
 
     :param graph: Directed adjacency list
+    :param checked: Optional reusable scratch set for cycle detection
+    :param rec_stack: Optional reusable scratch set for cycle detection
     :return: True if graph is a DAG, otherwise False
     """
-    return not detect_cycle(graph)
+    return not detect_cycle(graph, checked, rec_stack)
 
 
 def kahn_topological_sort(graph: dict) -> List[Any]:
@@ -195,7 +230,11 @@ def dfs_topological_sort(graph: dict, start_vertex: Any) -> List[Any]:
 # ------------------------------------------------------------------
 # Cycle Detection
 # ------------------------------------------------------------------
-def detect_cycle(graph: dict) -> bool:
+def detect_cycle(
+        graph: dict,
+        checked: Optional[Set[Any]] = None,
+        rec_stack: Optional[Set[Any]] = None
+) -> bool:
     """
     Detect whether a directed graph contains a cycle.
 
@@ -203,15 +242,28 @@ def detect_cycle(graph: dict) -> bool:
     A cycle exists if a vertex is revisited while still
     present in the current DFS path.
 
+    Callers performing many checks (e.g. repeated edge insertion)
+    may pass scratch sets to be cleared and reused instead of
+    allocating fresh ones on every call.
+
     :param graph: Directed adjacency list
+    :param checked: Optional reusable scratch set for explored vertices
+    :param rec_stack: Optional reusable scratch set for the DFS path
     :return: True if a cycle exists, otherwise False
     """
-    visited = set()
-    rec_stack = set()
+    if checked is None:
+        checked = set()
+    else:
+        checked.clear()
+
+    if rec_stack is None:
+        rec_stack = set()
+    else:
+        rec_stack.clear()
 
     for vertex in graph:
-        if vertex not in visited:
-            if _detect_cycle_dfs(graph, vertex, visited, rec_stack):
+        if vertex not in checked:
+            if _detect_cycle_dfs(graph, vertex, checked, rec_stack):
                 return True
     return False
 
@@ -219,29 +271,34 @@ def detect_cycle(graph: dict) -> bool:
 def _detect_cycle_dfs(
         graph: dict,
         vertex: Any,
-        visited: Set[Any],
+        checked: Set[Any],
         rec_stack: Set[Any]
 ) -> bool:
     """
     Recursive helper for directed cycle detection.
 
+    Vertices whose subtree has been fully explored are moved into
+    `checked` and skipped outright, so shared subtrees reached via
+    many paths are only walked once.
+
     :param graph: Directed adjacency list
     :param vertex: Current vertex
-    :param visited: Fully explored vertices
+    :param checked: Fully explored, cycle-free vertices
     :param rec_stack: Current DFS recursion path
     :return: True if a cycle is detected, otherwise False
     """
-    visited.add(vertex)
     rec_stack.add(vertex)
 
     for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            if _detect_cycle_dfs(graph, neighbor, visited, rec_stack):
-                return True
-        elif neighbor in rec_stack:
+        if neighbor in checked:
+            continue
+        if neighbor in rec_stack:
+            return True
+        if _detect_cycle_dfs(graph, neighbor, checked, rec_stack):
             return True
 
     rec_stack.remove(vertex)
+    checked.add(vertex)
     return False
 
 
@@ -315,3 +372,20 @@ def print_graph(graph: dict) -> None:
         print(f"\t{vertex} → {neighbors}")
 
     print("=" * width)
+
+
+# ------------------------------------------------------------------
+# Internal Helpers
+# ------------------------------------------------------------------
+def _intern(vertex: Any) -> Any:
+    """
+    Intern string vertex identifiers.
+
+    Equal strings then share a single object, so dictionary and list
+    lookups can short-circuit on identity instead of comparing characters.
+    Non-string vertices are returned unchanged.
+
+    :param vertex: Hashable vertex identifier
+    :return: Interned identifier
+    """
+    return sys.intern(vertex) if type(vertex) is str else vertex
@@ -23,7 +23,8 @@ class Graph:
     """
     Directed Acyclic Graph (DAG) data container.
 
-    Stores adjacency list state only.
+    Stores adjacency list state only, plus scratch buffers reused
+    by cycle detection during edge insertion.
     """
 
     def __init__(self):
@@ -31,6 +32,8 @@ class Graph:
         Initialize an empty DAG.
         """
         self.graph = {}
+        self._scratch_checked = set()
+        self._scratch_stack = set()
 
 # ------------------------------------------------------------------
 # Core Operations
@@ -45,7 +48,13 @@ class Graph:
 
         Must not introduce a cycle.
         """
-        return operations.insert_edge(self.graph, from_vertex, to_vertex)
+        return operations.insert_edge(
+            self.graph,
+            from_vertex,
+            to_vertex,
+            self._scratch_checked,
+            self._scratch_stack
+        )
 
     def remove_vertex(self, vertex):
         """Remove a vertex and all incident edges."""
@@ -96,10 +96,13 @@ def main() -> None:
     print(f"BFS (Recursive) from A : {graph.bfs_recursive('A')}")
     print(f"DFS (Iterative) from A : {graph.dfs_iterative('A')}")
     print(f"DFS (Recursive) from A : {graph.dfs_recursive('A')}")
+    print(f"BFS (CSR) from A       : {graph.bfs_csr('A')}")
+    print(f"DFS (CSR) from A       : {graph.dfs_csr('A')}")
     print("-" * 60)
 
     print(" Graph Properties ".center(60, "-"))
     print(f"Cycle Detected : {graph.detect_cycle()}")
+    print(f"Cycle (CSR)    : {graph.detect_cycle_csr()}")
     print("-" * 60)
 
     print(" Mutation Tests ".center(60, "-"))
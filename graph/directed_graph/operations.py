@@ -14,11 +14,14 @@ Responsibilities
 - Implement vertex and edge insert/remove operations
 - Implement BFS and DFS (iterative and recursive)
 - Implement cycle detection for directed graphs
+- Build a read-only CSR (Compressed Sparse Row) snapshot for analytic traversals
 ------------------------------------------------------------------------------------
 Public Functions
 ------------------------------------------------------------------------------------
+- build_in_adj
 - insert_vertex
 - insert_edge
+- bulk_insert_edges
 - remove_vertex
 - remove_edge
 - bfs_iterative
@@ -26,84 +29,179 @@ Public Functions
 - dfs_iterative
 - dfs_recursive
 - detect_cycle
+- index_vertex
+- unindex_vertex
+- rcm_order
+- freeze
+- bfs_csr
+- dfs_csr
+- detect_cycle_csr
 - print_graph
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
 - Functions operate on adjacency-list dictionary (`Graph.graph`)
+- Neighbors are stored as insertion-ordered sets (dict keys mapped to None),
+  giving O(1) edge lookup and removal with stable traversal order
 - Edges are directional (u → v)
+- The reverse adjacency list (`Graph.in_adj`) is built lazily on first
+  use; once built, mutations keep it in sync so incoming edges can be
+  found without scanning every vertex. Mutators accept `None` for it and
+  then only touch the forward adjacency list
 - Traversal follows outgoing edges only
+- Both BFS variants share one level-synchronous loop that expands a whole
+  frontier list per pass instead of popping a queue per vertex
+- A symbol table (`Graph._index_of` / `Graph._labels`) gives every vertex a
+  dense integer id so CSR kernels can use byte-array visited masks
+- CSR snapshots index vertices 0..V-1 and store all neighbor runs in one
+  contiguous integer array; they are not updated by later mutations
+- `Graph` is imported for type checking only, so importing this module
+  from `schemas.py` does not create a runtime import cycle
 - No I/O or persistence logic exists in this module
 ------------------------------------------------------------------------------------
 """
+from __future__ import annotations
+
+import sys
+from array import array
 from collections import deque
-from typing import Any, List, Set
-from schemas import Graph
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from graph.directed_graph.schemas import Graph
+
+# DFS vertex colors used by cycle detection
+_WHITE, _GRAY, _BLACK = 0, 1, 2
 
 
 # --------------------------------------------------------------------------
 # Core Operations
 # --------------------------------------------------------------------------
-def insert_vertex(graph: Graph, vertex: Any) -> None:
+def build_in_adj(graph: Graph) -> Dict[Any, dict]:
+    """
+    Build the reverse adjacency list in one pass over all edges.
+
+    :param graph: Adjacency list (Graph.graph)
+    :return: Mapping of each vertex to its incoming neighbors
+    """
+    in_adj = {vertex: {} for vertex in graph}
+
+    for vertex, neighbors in graph.items():
+        for neighbor in neighbors:
+            in_adj[neighbor][vertex] = None
+
+    return in_adj
+
+
+def insert_vertex(graph: Graph, in_adj: Optional[dict], vertex: Any) -> None:
     """
     Add a vertex to the directed graph.
 
     :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param vertex: Vertex identifier
     :return: None
     """
     if _vertex_exists(graph, vertex):
         return
 
-    graph[vertex] = []
+    graph[vertex] = {}
+    if in_adj is not None:
+        in_adj[vertex] = {}
 
 
-def insert_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
+def insert_edge(graph: Graph, in_adj: Optional[dict], from_vertex: Any, to_vertex: Any) -> None:
     """
     Add a directed edge (from_vertex → to_vertex).
 
     :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
     :return: None
     """
-    if not _vertex_exists(graph, from_vertex):
-        graph[from_vertex] = []
-    if not _vertex_exists(graph, to_vertex):
-        graph[to_vertex] = []
+    insert_vertex(graph, in_adj, from_vertex)
+    insert_vertex(graph, in_adj, to_vertex)
 
     if _edge_exists(graph, from_vertex, to_vertex):
-       return
+        return
+
+    graph[from_vertex][to_vertex] = None
+    if in_adj is not None:
+        in_adj[to_vertex][from_vertex] = None
+
 
-    graph[from_vertex].append(to_vertex)
+def bulk_insert_edges(graph: Graph, in_adj: Optional[dict], edges: Iterable[Tuple[Any, Any]]) -> None:
+    """
+    Add many directed edges in a single pass.
 
+    Skips the per-edge vertex and duplicate checks of `insert_edge`:
+    missing endpoints are created with `setdefault`, and duplicates
+    collapse on their own because neighbors are stored as dict keys.
+    Prefer this over repeated `insert_edge` calls when loading large
+    edge lists.
 
-def remove_vertex(graph: Graph, vertex: Any) -> None:
+    :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
+    :param edges: Iterable of (from_vertex, to_vertex) pairs
+    :return: None
+    """
+    setdefault = graph.setdefault
+
+    if in_adj is None:
+        for from_vertex, to_vertex in edges:
+            setdefault(from_vertex, {})[to_vertex] = None
+            setdefault(to_vertex, {})
+        return
+
+    in_setdefault = in_adj.setdefault
+    for from_vertex, to_vertex in edges:
+        setdefault(from_vertex, {})[to_vertex] = None
+        setdefault(to_vertex, {})
+        in_setdefault(from_vertex, {})
+        in_setdefault(to_vertex, {})[from_vertex] = None
+
+
+def remove_vertex(graph: Graph, in_adj: Optional[dict], vertex: Any) -> None:
     """
     Remove a vertex and all incoming and outgoing edges.
 
+    Incoming edges are located through the reverse adjacency list when
+    it is available, so only the vertex's actual neighbors are touched;
+    otherwise every adjacency list is scanned.
+
     :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param vertex: Vertex to remove
     :return: None
     """
     if not _vertex_exists(graph, vertex):
         return
 
+    if in_adj is None:
+        for neighbors in graph.values():
+            neighbors.pop(vertex, None)
+        del graph[vertex]
+        return
+
     # outgoing edges
-    graph[vertex].clear()
+    for neighbor in graph[vertex]:
+        del in_adj[neighbor][vertex]
 
     # incoming edges
-    for vtx in graph:
-        if vertex in graph[vtx]:
-            remove_edge(graph, vtx, vertex)
+    for vtx in in_adj[vertex]:
+        del graph[vtx][vertex]
 
     del graph[vertex]
+    del in_adj[vertex]
 
-def remove_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
+
+def remove_edge(graph: Graph, in_adj: Optional[dict], from_vertex: Any, to_vertex: Any) -> None:
     """
     Remove a directed edge (from_vertex → to_vertex).
 
     :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
     :return: None
@@ -111,7 +209,9 @@ def remove_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
     if not _edge_exists(graph, from_vertex, to_vertex):
         return
 
-    graph[from_vertex].remove(to_vertex)
+    del graph[from_vertex][to_vertex]
+    if in_adj is not None:
+        del in_adj[to_vertex][from_vertex]
 
 
 # ----------------------------------------------------------------------
@@ -125,54 +225,31 @@ def bfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
     :param start_vertex: Starting vertex
     :return: BFS traversal order
     """
-    visited = []
-    neighbor_queue = deque()
-    current = start_vertex
-
-    while True:
-        if current not in visited:
-            visited.append(current)
-
-        for neighbor in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_queue:
-                neighbor_queue.append(neighbor)
-
-
-        if not neighbor_queue:
-            break
-
-        current = neighbor_queue.popleft()
-
-    return visited
+    return _bfs_levels(graph, [start_vertex], [], set())
 
 
 def bfs_recursive(
         graph: Graph,
         level_vertices: List[Any],
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive (level-based) Breadth-First Search (BFS).
 
+    Shares the level-synchronous loop of `bfs_iterative`, so deep
+    graphs do not hit Python's recursion limit.
+
     :param graph: Adjacency list (Graph.graph)
     :param level_vertices: Current BFS frontier
-    :param visited: List of visited vertices
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: BFS traversal order
     """
-    if not level_vertices:
-        return visited
-
-    next_level = []
-
-    for vertex in level_vertices:
-        if vertex not in visited:
-            visited.append(vertex)
-
-        for neighbor in graph[vertex]:
-            if neighbor not in visited:
-                next_level.append(neighbor)
+    if visited_set is None:
+        visited_set = set(visited)
 
-    return bfs_recursive(graph, next_level, visited)
+    return _bfs_levels(graph, level_vertices, visited, visited_set)
 
 
 def dfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
@@ -183,47 +260,68 @@ def dfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
     :param start_vertex: Starting vertex
     :return: DFS traversal order
     """
-    visited = []
+    visited = set()
+    order = []
     neighbor_stack = []
+    pending = set()
     current = start_vertex
 
     while True:
         if current not in visited:
-            visited.append(current)
+            visited.add(current)
+            order.append(current)
 
         for neighbor in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_stack:
+            if neighbor not in visited and neighbor not in pending:
+                pending.add(neighbor)
                 neighbor_stack.append(neighbor)
 
         if not neighbor_stack:
             break
 
         current = neighbor_stack.pop()
+        pending.discard(current)
 
-    return visited
+    return order
 
 
 def dfs_recursive(
         graph: Graph,
         vertex: Any,
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive Depth-First Search (DFS).
 
+    Implemented with an explicit stack, so deep graphs do not
+    hit Python's recursion limit.
+
     :param graph: Adjacency list (Graph.graph)
     :param vertex: Current vertex
-    :param visited: List of visited vertices
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: DFS traversal order
     """
-    if not vertex:
-        return visited
+    if visited_set is None:
+        visited_set = set(visited)
 
+    visited_set.add(vertex)
     visited.append(vertex)
 
-    for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            dfs_recursive(graph, neighbor, visited)
+    # Explicit stack of neighbor iterators mirrors the recursive call
+    # stack, preserving recursive visiting order without Python frames
+    stack = [iter(graph[vertex])]
+
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited_set:
+                visited_set.add(neighbor)
+                visited.append(neighbor)
+                stack.append(iter(graph[neighbor]))
+                break
+        else:
+            stack.pop()
 
     return visited
 
@@ -234,22 +332,302 @@ def detect_cycle(graph: Graph) -> bool:
     """
     Detect whether a directed graph contains a cycle.
 
-    Uses Depth-First Search (DFS) with recursion-stack tracking.
-    A cycle is detected if a vertex is encountered that is already
-    present in the current recursion stack.
+    Uses iterative Depth-First Search (DFS) with vertex coloring:
+    WHITE (unvisited), GRAY (on the current DFS path) and BLACK
+    (fully explored). A cycle is detected when an edge leads to a
+    GRAY vertex.
 
     :param graph: Adjacency list (Graph.graph)
     :return: True if a cycle exists, otherwise False
     """
-    visited = set()
-    rec_stack = set()
+    color = dict.fromkeys(graph, _WHITE)
 
     for vertex in graph:
-        if vertex not in visited:
-            if _detect_cycle_dfs(graph, vertex, visited, rec_stack):
+        if color[vertex] != _WHITE:
+            continue
+
+        color[vertex] = _GRAY
+        stack = [(vertex, iter(graph[vertex]))]
+
+        while stack:
+            current, neighbors = stack[-1]
+
+            for neighbor in neighbors:
+                state = color[neighbor]
+                if state == _GRAY:
+                    return True
+                if state == _WHITE:
+                    color[neighbor] = _GRAY
+                    stack.append((neighbor, iter(graph[neighbor])))
+                    break
+            else:
+                color[current] = _BLACK
+                stack.pop()
+
+    return False
+
+# ----------------------------------------------------------------------
+# CSR (Frozen) Representation
+# ----------------------------------------------------------------------
+def index_vertex(index_of: Dict[Any, int], labels: List[Any], vertex: Any) -> int:
+    """
+    Assign a dense integer id to a vertex if it does not have one yet.
+
+    :param index_of: Vertex → integer id symbol table
+    :param labels: Integer id → vertex table
+    :param vertex: Vertex identifier
+    :return: Integer id of the vertex
+    """
+    index = index_of.get(vertex)
+    if index is None:
+        index = len(labels)
+        index_of[vertex] = index
+        labels.append(vertex)
+    return index
+
+
+def unindex_vertex(index_of: Dict[Any, int], labels: List[Any], vertex: Any) -> None:
+    """
+    Release a vertex's integer id, keeping ids dense.
+
+    The vertex holding the highest id is moved into the freed slot.
+
+    :param index_of: Vertex → integer id symbol table
+    :param labels: Integer id → vertex table
+    :param vertex: Vertex identifier
+    :return: None
+    """
+    index = index_of.pop(vertex, None)
+    if index is None:
+        return
+
+    last = labels.pop()
+    if index < len(labels):
+        labels[index] = last
+        index_of[last] = index
+
+
+def rcm_order(graph: Graph, in_adj: dict) -> List[Any]:
+    """
+    Compute a Reverse Cuthill–McKee (RCM) vertex ordering.
+
+    Edge direction is ignored: each vertex's degree counts incoming and
+    outgoing edges. Each component is explored breadth-first from its
+    lowest-degree vertex, neighbors in ascending degree order, and the
+    final sequence is reversed. Vertices adjacent in the graph end up
+    close together in the ordering, which improves memory locality of
+    a CSR snapshot built from it.
+
+    :param graph: Adjacency list (Graph.graph)
+    :param in_adj: Reverse adjacency list (Graph.in_adj)
+    :return: Vertices in RCM order
+    """
+    degree = {vertex: len(graph[vertex]) + len(in_adj[vertex]) for vertex in graph}
+    visited = set()
+    order = []
+
+    for seed in sorted(graph, key=degree.__getitem__):
+        if seed in visited:
+            continue
+
+        visited.add(seed)
+        queue = deque([seed])
+
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+
+            neighbors = dict.fromkeys(graph[current])
+            neighbors.update(dict.fromkeys(in_adj[current]))
+            unvisited = [neighbor for neighbor in neighbors if neighbor not in visited]
+
+            for neighbor in sorted(unvisited, key=degree.__getitem__):
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+    order.reverse()
+    return order
+
+
+def freeze(
+        graph: Graph,
+        vertex_order: Optional[List[Any]] = None,
+        index_of: Optional[Dict[Any, int]] = None
+) -> Tuple[Dict[Any, int], array, array]:
+    """
+    Build a Compressed Sparse Row (CSR) snapshot of the graph.
+
+    Vertices are numbered 0..V-1 in the order given by `vertex_order`:
+    the Graph passes its symbol table (insertion order until a vertex is
+    removed) or `rcm_order`. Without it, adjacency-list insertion order
+    is used.
+    The outgoing neighbors of vertex `i` are
+    `indices[indptr[i]:indptr[i + 1]]`.
+
+    :param graph: Adjacency list (Graph.graph)
+    :param vertex_order: Optional permutation of all vertices
+    :param index_of: Optional prebuilt inverse of `vertex_order`
+    :return: (vertex → index map, indptr array, indices array)
+    """
+    if vertex_order is None:
+        vertex_order = graph
+
+    if index_of is None:
+        index_of = {vertex: index for index, vertex in enumerate(vertex_order)}
+    indptr = array("i", [0])
+    indices = array("i")
+
+    for vertex in vertex_order:
+        indices.extend([index_of[neighbor] for neighbor in graph[vertex]])
+        indptr.append(len(indices))
+
+    return index_of, indptr, indices
+
+
+def bfs_csr(indptr: array, indices: array, source: int) -> List[int]:
+    """
+    Perform Breadth-First Search (BFS) over a CSR snapshot.
+
+    Works on integer vertex indices only, using a byte-per-vertex
+    visited mask and two preallocated frontier buffers that are swapped
+    after each level, so no per-vertex objects are allocated.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param source: Index of the starting vertex
+    :return: BFS traversal order as vertex indices
+    """
+    vertex_count = len(indptr) - 1
+    visited = bytearray(vertex_count)
+    current_level = array("i", bytes(4 * vertex_count))
+    next_level = array("i", bytes(4 * vertex_count))
+
+    visited[source] = 1
+    current_level[0] = source
+    current_size = 1
+    order = array("i", [source])
+
+    while current_size:
+        next_size = 0
+
+        for slot in range(current_size):
+            current = current_level[slot]
+
+            for position in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[position]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    next_level[next_size] = neighbor
+                    next_size += 1
+
+        order.extend(next_level[:next_size])
+        current_level, next_level = next_level, current_level
+        current_size = next_size
+
+    return order.tolist()
+
+
+def dfs_csr(indptr: array, indices: array, source: int) -> List[int]:
+    """
+    Perform Depth-First Search (DFS) over a CSR snapshot.
+
+    Visits vertices in the same order as `dfs_recursive`. The call stack
+    is replaced by two flat integer arrays holding each frame's vertex
+    and its next neighbor position.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param source: Index of the starting vertex
+    :return: DFS traversal order as vertex indices
+    """
+    vertex_count = len(indptr) - 1
+    visited = bytearray(vertex_count)
+    order = array("i", bytes(4 * vertex_count))
+    stack_vertex = array("i", bytes(4 * vertex_count))
+    stack_position = array("i", bytes(4 * vertex_count))
+
+    visited[source] = 1
+    order[0] = source
+    visit_count = 1
+    stack_vertex[0] = source
+    stack_position[0] = indptr[source]
+    depth = 1
+
+    while depth:
+        top = depth - 1
+        current = stack_vertex[top]
+        position = stack_position[top]
+        end = indptr[current + 1]
+
+        while position < end and visited[indices[position]]:
+            position += 1
+
+        if position == end:
+            depth -= 1
+            continue
+
+        neighbor = indices[position]
+        stack_position[top] = position + 1
+        visited[neighbor] = 1
+        order[visit_count] = neighbor
+        visit_count += 1
+        stack_vertex[depth] = neighbor
+        stack_position[depth] = indptr[neighbor]
+        depth += 1
+
+    return order[:visit_count].tolist()
+
+
+def detect_cycle_csr(indptr: array, indices: array) -> bool:
+    """
+    Detect whether a CSR snapshot contains a directed cycle.
+
+    Uses the same WHITE/GRAY/BLACK coloring as `detect_cycle`, stored
+    in a byte-per-vertex array, with an explicit integer stack.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :return: True if a cycle exists, otherwise False
+    """
+    vertex_count = len(indptr) - 1
+    color = bytearray(vertex_count)
+    stack_vertex = array("i", bytes(4 * vertex_count))
+    stack_position = array("i", bytes(4 * vertex_count))
+
+    for root in range(vertex_count):
+        if color[root] != _WHITE:
+            continue
+
+        color[root] = _GRAY
+        stack_vertex[0] = root
+        stack_position[0] = indptr[root]
+        depth = 1
+
+        while depth:
+            top = depth - 1
+            current = stack_vertex[top]
+            position = stack_position[top]
+
+            if position == indptr[current + 1]:
+                color[current] = _BLACK
+                depth -= 1
+                continue
+
+            neighbor = indices[position]
+            stack_position[top] = position + 1
+            state = color[neighbor]
+
+            if state == _GRAY:
                 return True
+            if state == _WHITE:
+                color[neighbor] = _GRAY
+                stack_vertex[depth] = neighbor
+                stack_position[depth] = indptr[neighbor]
+                depth += 1
+
     return False
 
+
 # ----------------------------------------------------------------------
 # Utilities
 # ----------------------------------------------------------------------
@@ -265,15 +643,58 @@ def print_graph(graph: Graph) -> None:
     header = title.center(width, '=')
     footer = "=" * width
 
-    print(header)
+    lines = [header]
     for vertex, neighbors in graph.items():
-        print(f"\tGraph [{vertex}] → [{', '.join([str(n) for n in neighbors])}]")
-    print(footer)
+        lines.append(f"\tGraph [{vertex}] → [{', '.join(map(str, neighbors))}]")
+    lines.append(footer)
+
+    # Emit the whole listing with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ----------------------------------------------------------------------
 # Internal Helpers
 # ----------------------------------------------------------------------
+def _bfs_levels(
+        graph: Graph,
+        level_vertices: List[Any],
+        visited: List[Any],
+        visited_set: Set[Any]
+) -> List[Any]:
+    """
+    Level-synchronous BFS shared by `bfs_iterative` and `bfs_recursive`.
+
+    Each pass expands one whole frontier list into the next, marking
+    vertices visited on discovery, so every vertex is appended to a
+    frontier at most once and no per-vertex queue operations are needed.
+
+    :param graph: Adjacency list (Graph.graph)
+    :param level_vertices: Initial frontier
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited`
+    :return: BFS traversal order
+    """
+    level = []
+    for vertex in level_vertices:
+        if vertex not in visited_set:
+            visited_set.add(vertex)
+            level.append(vertex)
+
+    while level:
+        visited.extend(level)
+        next_level = []
+
+        for vertex in level:
+            for neighbor in graph[vertex]:
+                if neighbor not in visited_set:
+                    visited_set.add(neighbor)
+                    next_level.append(neighbor)
+
+        level = next_level
+
+    return visited
+
+
 def _vertex_exists(graph: Graph, vertex: Any) -> bool:
     """
     Check if a vertex exists in the graph.
@@ -295,37 +716,3 @@ def _edge_exists(graph: Graph, from_vertex: Any, to_vertex: Any) -> bool:
     :return: True if edge exists, otherwise False
     """
     return to_vertex in graph[from_vertex]
-
-def _detect_cycle_dfs(
-        graph: Graph,
-        vertex: Any,
-        visited: Set[Any],
-        rec_stack: Set[Any]
-) -> bool:
-    """
-    Recursive helper for directed cycle detection.
-
-    Performs DFS from the given vertex while tracking the current
-    recursion path using a recursion stack.
-
-    :param graph: Adjacency list (Graph.graph)
-    :param vertex: Current vertex in DFS
-    :param visited: Set of fully visited vertices
-    :param rec_stack: Set of vertices in the current DFS path
-    :return: True if a cycle is detected, otherwise False
-    """
-    if vertex is None:
-        return False
-
-    visited.add(vertex)
-    rec_stack.add(vertex)
-
-    for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            if _detect_cycle_dfs(graph, neighbor, visited, rec_stack):
-                return True
-        elif neighbor in rec_stack:
-            return True
-
-    rec_stack.remove(vertex)
-    return False
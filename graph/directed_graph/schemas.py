@@ -19,6 +19,8 @@ Responsibilities
 ------------------------------------------------------------------------------------
 - Define the Graph container structure
 - Hold directed adjacency list state
+- Hold reverse (incoming) adjacency list state, built on demand
+- Cache derived structures (CSR snapshot, RCM order) until the next mutation
 ------------------------------------------------------------------------------------
 Public Classes
 ------------------------------------------------------------------------------------
@@ -32,6 +34,8 @@ Design Notes
 ------------------------------------------------------------------------------------
 """
 
+from itertools import islice
+
 from graph.directed_graph import operations
 
 # ------------------------------------------------------------------
@@ -45,15 +49,53 @@ class Graph:
     (insert, delete, traversal, analysis) to external operations.
     """
 
+    # Construction-path operations bound once at class creation, so each
+    # call resolves through one attribute lookup instead of a module
+    # global plus an attribute lookup
+    _index_vertex = staticmethod(operations.index_vertex)
+    _insert_vertex = staticmethod(operations.insert_vertex)
+    _insert_edge = staticmethod(operations.insert_edge)
+
     def __init__(self):
         """
         Initialize an empty directed graph.
 
         Creates an empty adjacency list where:
         - Keys represent vertices
-        - Values represent outgoing neighbors
+        - Values represent outgoing neighbors, stored as an insertion-ordered
+          set (dict keys mapped to None)
+
+        The reverse adjacency list (`in_adj`) mapping each vertex to its
+        incoming neighbors starts as None: it is built on first use and
+        kept in sync by operations from then on, so construction-only
+        workloads never pay for it. A symbol table assigns each vertex a
+        dense integer id.
         """
         self.graph = {}
+        self.in_adj = None
+        self._index_of = {}
+        self._labels = []
+        self._rcm_order = None
+        self._csr = None
+
+    def _ensure_in_adj(self):
+        """
+        Build the reverse adjacency list if it does not exist yet.
+
+        :return: Reverse adjacency list
+        """
+        if self.in_adj is None:
+            self.in_adj = operations.build_in_adj(self.graph)
+        return self.in_adj
+
+    def _invalidate(self):
+        """
+        Drop cached structures derived from the adjacency list.
+
+        :return: None
+        """
+        self._rcm_order = None
+        self._csr = None
 
 # ------------------------------------------------------------------
 # Core Operations
@@ -65,7 +107,9 @@ class Graph:
         :param vertex: Unique vertex identifier
         :return: None
         """
-        return operations.insert_vertex(self.graph, vertex)
+        self._invalidate()
+        self._index_vertex(self._index_of, self._labels, vertex)
+        return self._insert_vertex(self.graph, self.in_adj, vertex)
 
     def insert_edge(self, from_vertex, to_vertex):
         """
@@ -75,7 +119,26 @@ class Graph:
         :param to_vertex: Destination vertex
         :return: None
         """
-        return operations.insert_edge(self.graph, from_vertex, to_vertex)
+        self._invalidate()
+        self._index_vertex(self._index_of, self._labels, from_vertex)
+        self._index_vertex(self._index_of, self._labels, to_vertex)
+        return self._insert_edge(self.graph, self.in_adj, from_vertex, to_vertex)
+
+    def bulk_insert_edges(self, edges):
+        """
+        Add many directed edges in a single pass.
+
+        Callers loading large edge lists should prefer this over
+        repeated `insert_edge` calls.
+
+        :param edges: Iterable of (from_vertex, to_vertex) pairs
+        :return: None
+        """
+        self._invalidate()
+        vertex_count = len(self.graph)
+        operations.bulk_insert_edges(self.graph, self.in_adj, edges)
+        for vertex in islice(self.graph, vertex_count, None):
+            self._index_vertex(self._index_of, self._labels, vertex)
 
     def remove_vertex(self, vertex):
         """
@@ -84,7 +147,9 @@ class Graph:
         :param vertex: Vertex to remove
         :return: None
         """
-        return operations.remove_vertex(self.graph, vertex)
+        self._invalidate()
+        operations.unindex_vertex(self._index_of, self._labels, vertex)
+        return operations.remove_vertex(self.graph, self._ensure_in_adj(), vertex)
 
     def remove_edge(self, from_vertex, to_vertex):
         """
@@ -94,7 +159,8 @@ class Graph:
         :param to_vertex: Destination vertex
         :return: None
         """
-        return operations.remove_edge(self.graph, from_vertex, to_vertex)
+        self._invalidate()
+        return operations.remove_edge(self.graph, self.in_adj, from_vertex, to_vertex)
 
 # ------------------------------------------------------------------
 # Traversals
@@ -115,7 +181,7 @@ class Graph:
         :param start_vertex: Starting vertex
         :return: BFS traversal order
         """
-        return operations.bfs_recursive(self.graph, start_vertex, [])
+        return operations.bfs_recursive(self.graph, [start_vertex], [])
 
     def dfs_iterative(self, start_vertex):
         """
@@ -130,9 +196,14 @@ class Graph:
         """
         Perform recursive Depth-First Search (DFS).
 
+        Falsy vertex ids such as 0 or "" are valid; only None is
+        rejected, returning an empty traversal.
+
         :param start_vertex: Starting vertex
         :return: DFS traversal order
         """
+        if start_vertex is None:
+            return []
         return operations.dfs_recursive(self.graph, start_vertex, [])
 
 # ------------------------------------------------------------------
@@ -142,10 +213,81 @@ class Graph:
         """
         Detect whether the directed graph contains a cycle.
 
+        When a CSR snapshot is already cached, the check runs over it:
+        the outer loop then walks integer ids with a byte-array color
+        mask instead of hashing every vertex.
+
         :return: True if cycle exists, otherwise False
         """
+        if self._csr is not None:
+            return self.detect_cycle_csr()
         return operations.detect_cycle(self.graph)
 
+# ------------------------------------------------------------------
+# CSR (Frozen) Representation
+# ------------------------------------------------------------------
+    def freeze(self, reorder=False):
+        """
+        Build a read-only CSR snapshot of the current graph.
+
+        The default snapshot numbers vertices in symbol-table order
+        (insertion order until a vertex is removed); it is built on first
+        use and cached until the next mutation.
+
+        :param reorder: Number vertices in Reverse Cuthill–McKee order
+        :return: (vertex → index map, indptr array, indices array)
+        """
+        if not reorder:
+            if self._csr is None:
+                self._csr = operations.freeze(self.graph, self._labels, self._index_of)
+            return self._csr
+
+        return operations.freeze(self.graph, self.rcm_order())
+
+    def rcm_order(self):
+        """
+        Return the Reverse Cuthill–McKee vertex ordering.
+
+        The ordering is computed on first use and cached until the
+        next mutation.
+
+        :return: Vertices in RCM order
+        """
+        if self._rcm_order is None:
+            self._rcm_order = operations.rcm_order(self.graph, self._ensure_in_adj())
+        return self._rcm_order
+
+    def bfs_csr(self, start_vertex):
+        """
+        Perform Breadth-First Search (BFS) over a CSR snapshot.
+
+        :param start_vertex: Starting vertex
+        :return: BFS traversal order
+        """
+        index_of, indptr, indices = self.freeze()
+        order = operations.bfs_csr(indptr, indices, index_of[start_vertex])
+        return [self._labels[index] for index in order]
+
+    def dfs_csr(self, start_vertex):
+        """
+        Perform Depth-First Search (DFS) over a CSR snapshot.
+
+        :param start_vertex: Starting vertex
+        :return: DFS traversal order
+        """
+        index_of, indptr, indices = self.freeze()
+        order = operations.dfs_csr(indptr, indices, index_of[start_vertex])
+        return [self._labels[index] for index in order]
+
+    def detect_cycle_csr(self):
+        """
+        Detect whether the directed graph contains a cycle using a CSR snapshot.
+
+        :return: True if cycle exists, otherwise False
+        """
+        _, indptr, indices = self.freeze()
+        return operations.detect_cycle_csr(indptr, indices)
+
 # ------------------------------------------------------------------
 # Utilities
 # ------------------------------------------------------------------
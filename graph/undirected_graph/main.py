@@ -95,6 +95,9 @@ def main() -> None:
     print(f"BFS (Recursive) from A : {graph.bfs_recursive('A')}")
     print(f"DFS (Iterative) from A : {graph.dfs_iterative('A')}")
     print(f"DFS (Recursive) from A : {graph.dfs_recursive('A')}")
+    print(f"BFS (CSR) from A       : {graph.bfs_iterative_csr('A')}")
+    print(f"BFS distances from A   : {graph.bfs_distances_csr('A')}")
+    print(f"BFS tree from A        : {graph.bfs_tree_csr('A')}")
     print("-" * 60)
 
     print(" Graph Properties ".center(60, "-"))
@@ -14,12 +14,14 @@ Responsibilities
 - Implement BFS and DFS (iterative and recursive)
 - Implement connected components logic
 - Implement cycle detection for undirected graphs
+- Build a read-only CSR (Compressed Sparse Row) snapshot for analytic traversals
 
 ------------------------------------------------------------------------------------
 Public Functions
 ------------------------------------------------------------------------------------
 - insert_vertex
 - insert_edge
+- insert_edges
 - remove_vertex
 - remove_edge
 - bfs_iterative
@@ -29,34 +31,62 @@ Public Functions
 - get_connected_components
 - detect_cycle_iterative
 - detect_cycle_recursive
+- to_csr
+- bfs_iterative_csr
+- bfs_distances_csr
+- bfs_tree_csr
 - print_graph
 
 ------------------------------------------------------------------------------------
 Dependencies
 ------------------------------------------------------------------------------------
-- schemas.Graph
+- None at runtime; functions take the plain `Graph.graph` dictionary,
+  typed as `Adjacency`
 
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
 - All functions operate on the adjacency-list dictionary (`Graph.graph`)
   passed explicitly from the Graph container
+- Neighbors are stored as insertion-ordered sets (dict keys mapped to None),
+  giving O(1) edge lookup and removal with stable traversal order
 - Graph schema is treated as a data container only
+- Traversals keep visited state in a set (deduplication) and the output
+  order in a separate list; callers pass both to the recursive variants
 - Traversal order is not guaranteed or enforced
+- CSR snapshots relabel vertices to 0..V-1 (sorted labels where possible)
+  and store every sorted neighbor run in one contiguous integer array;
+  they are not updated by later mutations
+- Every function carries concrete container annotations, so the module
+  can be compiled standalone (e.g. with mypyc) without importing schemas
 - No I/O or persistence logic exists in this module
 ------------------------------------------------------------------------------------
 """
 
+from __future__ import annotations
+
+import sys
+from array import array
 from collections import deque
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Tuple
+
+# Concrete type of `Graph.graph`: vertex -> insertion-ordered neighbor set
+Adjacency = Dict[Any, Dict[Any, None]]
+
+# DFS vertex colors used by cycle detection
+_WHITE, _GRAY, _BLACK = 0, 1, 2
 
-from schemas import Graph
+# Direction-optimizing CSR BFS thresholds (Beamer et al.): switch to pull
+# once the frontier's edges exceed 1/_PULL_ALPHA of the unexplored edges,
+# and back to push once it holds fewer than 1/_PUSH_BETA of all vertices
+_PULL_ALPHA = 14
+_PUSH_BETA = 24
 
 
 # --------------------------------------------------------------------------
 # Core Operations
 # --------------------------------------------------------------------------
-def insert_vertex(graph: Graph, vertex: Any) -> None:
+def insert_vertex(graph: Adjacency, vertex: Any) -> None:
     """
     Add a vertex to the graph.
 
@@ -65,10 +95,10 @@ def insert_vertex(graph: Graph, vertex: Any) -> None:
     :return: None
     """
     if not _vertex_exists(graph, vertex):
-        graph[vertex] = []
+        graph[vertex] = {}
 
 
-def insert_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
+def insert_edge(graph: Adjacency, from_vertex: Any, to_vertex: Any) -> None:
     """
     Add an undirected edge between two vertices.
 
@@ -79,37 +109,47 @@ def insert_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
     :param to_vertex: Destination vertex
     :return: None
     """
-    if not _vertex_exists(graph, from_vertex):
-        graph[from_vertex] = []
+    # Re-adding an existing neighbor key is a no-op, so no existence
+    # checks are needed
+    graph.setdefault(from_vertex, {})[to_vertex] = None
+    graph.setdefault(to_vertex, {})[from_vertex] = None
 
-    if not _vertex_exists(graph, to_vertex):
-        graph[to_vertex] = []
 
-    if not _edge_exists(graph, from_vertex, to_vertex):
-        graph[from_vertex].append(to_vertex)
+def insert_edges(graph: Adjacency, pairs: Iterable[Tuple[Any, Any]]) -> None:
+    """
+    Add many undirected edges in a single pass.
+
+    Equivalent to calling `insert_edge` for each pair, but with the
+    dictionary method bound once for the whole batch.
+
+    :param graph: Adjacency list (Graph.graph)
+    :param pairs: Iterable of (from_vertex, to_vertex) pairs
+    :return: None
+    """
+    setdefault = graph.setdefault
 
-    if not _edge_exists(graph, to_vertex, from_vertex):
-        graph[to_vertex].append(from_vertex)
+    for from_vertex, to_vertex in pairs:
+        setdefault(from_vertex, {})[to_vertex] = None
+        setdefault(to_vertex, {})[from_vertex] = None
 
 
-def remove_vertex(graph: Graph, vertex: Any) -> None:
+def remove_vertex(graph: Adjacency, vertex: Any) -> None:
     """
     Remove a vertex and all its incident edges from the graph.
 
+    Only the vertex's own neighbors are touched; no full scan is needed
+    because every edge is stored on both endpoints.
+
     :param graph: Adjacency list (Graph.graph)
     :param vertex: Vertex to remove
     :return: None
     """
-    neighbors = list(graph[vertex])  # FIX: safe copy
-
-    for neighbor in neighbors:
-        if _edge_exists(graph, neighbor, vertex):
-            graph[neighbor].remove(vertex)
-
-    del graph[vertex]
+    for neighbor in graph.pop(vertex, ()):
+        if neighbor != vertex:
+            del graph[neighbor][vertex]
 
 
-def remove_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
+def remove_edge(graph: Adjacency, from_vertex: Any, to_vertex: Any) -> None:
     """
     Remove an undirected edge between two vertices.
 
@@ -118,17 +158,17 @@ def remove_edge(graph: Graph, from_vertex: Any, to_vertex: Any) -> None:
     :param to_vertex: Other endpoint of the edge
     :return: None
     """
-    if from_vertex in graph and to_vertex in graph[from_vertex]:
-        graph[from_vertex].remove(to_vertex)
+    if from_vertex in graph:
+        graph[from_vertex].pop(to_vertex, None)
 
-    if to_vertex in graph and from_vertex in graph[to_vertex]:
-        graph[to_vertex].remove(from_vertex)
+    if to_vertex in graph:
+        graph[to_vertex].pop(from_vertex, None)
 
 
 # ----------------------------------------------------------------------
 # BFS Traversal
 # ----------------------------------------------------------------------
-def bfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
+def bfs_iterative(graph: Adjacency, start_vertex: Any) -> List[Any]:
     """
     Perform iterative Breadth-First Search (BFS).
 
@@ -136,203 +176,383 @@ def bfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
     :param start_vertex: Starting vertex
     :return: BFS traversal order
     """
-    visited = []
-    neighbor_queue = deque()
-    current = start_vertex
-
-    while True:
-        if current not in visited:
-            visited.append(current)
-
-        for neighbor in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_queue:
-                neighbor_queue.append(neighbor)
-
-        if not neighbor_queue:
-            break
-
-        current = neighbor_queue.popleft()
+    visited = {start_vertex}
+    order = [start_vertex]
+    neighbor_queue = deque([start_vertex])
+
+    # Bound methods cached as locals keep attribute lookups out of the
+    # per-edge loop
+    mark_visited = visited.add
+    record = order.append
+    enqueue = neighbor_queue.append
+    dequeue = neighbor_queue.popleft
+
+    # Vertices are marked visited when enqueued, so the queue never
+    # holds duplicates and needs no membership scan
+    while neighbor_queue:
+        for neighbor in graph[dequeue()]:
+            if neighbor not in visited:
+                mark_visited(neighbor)
+                record(neighbor)
+                enqueue(neighbor)
 
-    return visited
+    return order
 
 
 def bfs_recursive(
-        graph: Graph,
+        graph: Adjacency,
         level_vertices: List[Any],
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive (level-based) Breadth-First Search (BFS).
 
+    Implemented as a level-by-level loop, so deep graphs do not
+    hit Python's recursion limit.
+
     :param graph: Adjacency list (Graph.graph)
     :param level_vertices: Current BFS frontier
-    :param visited: List of visited vertices
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: BFS traversal order
     """
-    if not level_vertices:
-        return visited
-
-    next_level = []
+    if visited_set is None:
+        visited_set = set(visited)
 
+    level = []
     for vertex in level_vertices:
-        if vertex not in visited:
-            visited.append(vertex)
-
-        for neighbor in graph[vertex]:
-            if neighbor not in visited:
-                next_level.append(neighbor)
+        if vertex not in visited_set:
+            visited_set.add(vertex)
+            level.append(vertex)
+
+    # Each pass of the loop processes one level, replacing the
+    # per-level recursive call. Vertices are marked on discovery, so a
+    # level list never holds duplicates, just like the deque in
+    # `bfs_iterative`
+    while level:
+        visited.extend(level)
+        next_level = []
+
+        for vertex in level:
+            for neighbor in graph[vertex]:
+                if neighbor not in visited_set:
+                    visited_set.add(neighbor)
+                    next_level.append(neighbor)
+
+        level = next_level
 
-    return bfs_recursive(graph, next_level, visited)
+    return visited
 
 
 # ----------------------------------------------------------------------
 # DFS Traversals
 # ----------------------------------------------------------------------
-def dfs_iterative(graph: Graph, start_vertex: Any) -> List[Any]:
+def dfs_iterative(graph: Adjacency, start_vertex: Any) -> List[Any]:
     """
     Perform iterative Depth-First Search (DFS).
 
+    Each stack frame is a neighbor iterator that is advanced one step at
+    a time, so the stack holds at most one frame per vertex on the
+    current path instead of one entry per discovered edge.
+
     :param graph: Adjacency list (Graph.graph)
     :param start_vertex: Starting vertex
     :return: DFS traversal order
     """
-    visited = []
-    neighbor_stack = []
-    current = start_vertex
-
-    while True:
-        if current not in visited:
-            visited.append(current)
-
-        for neighbor in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_stack:
-                neighbor_stack.append(neighbor)
-
-        if not neighbor_stack:
-            break
-
-        current = neighbor_stack.pop()
-
-    return visited
+    return _dfs_from(graph, start_vertex, [], set())
 
 
 def dfs_recursive(
-        graph: Graph,
+        graph: Adjacency,
         vertex: Any,
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive Depth-First Search (DFS).
 
+    Implemented with an explicit stack, so deep graphs do not
+    hit Python's recursion limit.
+
     :param graph: Adjacency list (Graph.graph)
     :param vertex: Current vertex
-    :param visited: List of visited vertices
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: DFS traversal order
     """
     if vertex is None:
         return visited
 
-    visited.append(vertex)
-
-    for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            dfs_recursive(graph, neighbor, visited)
+    if visited_set is None:
+        visited_set = set(visited)
 
-    return visited
+    return _dfs_from(graph, vertex, visited, visited_set)
 
 
 # ----------------------------------------------------------------------
 # Graph State Operations
 # ----------------------------------------------------------------------
-def get_connected_components(graph: Graph) -> int:
+def get_connected_components(graph: Adjacency) -> int:
     """
     Compute the number of connected components in the graph.
 
+    Uses a disjoint-set (Union-Find) forest with path compression and
+    union by rank: every successful union merges two components, so
+    the count is the number of vertices minus the number of merges.
+
     :param graph: Adjacency list (Graph.graph)
     :return: Number of connected components
     """
-    all_vertices = graph.keys()
-    covered = list(all_vertices)
-    connected_count = 0
+    parent = {vertex: vertex for vertex in graph}
+    rank = dict.fromkeys(graph, 0)
+    merges = 0
 
-    while covered:
-        visited = bfs_recursive(graph, [covered[0]], [])
-
-        for vertex in visited:
-            covered.remove(vertex)
-
-        connected_count += 1
+    for vertex, neighbors in graph.items():
+        for neighbor in neighbors:
+            if _union(parent, rank, vertex, neighbor):
+                merges += 1
 
-    return connected_count
+    return len(graph) - merges
 
 
-def detect_cycle_iterative(graph: Graph, start_vertex: Any) -> bool:
+def detect_cycle_iterative(
+        graph: Adjacency,
+        start_vertex: Any,
+        acyclic: Optional[Set[Any]] = None
+) -> bool:
     """
     Detect whether the graph contains a cycle using iterative DFS.
 
+    Vertices are colored WHITE (unvisited, the default), GRAY (on the
+    current DFS path) and BLACK (fully explored). The explicit stack
+    holds (vertex, parent, neighbor iterator) entries; reaching a GRAY
+    neighbor other than the parent closes a cycle.
+
+    When `acyclic` is given it memoizes vertices whose component is
+    already known to be cycle-free: a start vertex found there returns
+    immediately, and a walk that finds no cycle adds its whole component.
+
     :param graph: Adjacency list (Graph.graph)
     :param start_vertex: Starting vertex
+    :param acyclic: Optional memo of vertices in cycle-free components
     :return: True if a cycle exists, otherwise False
     """
-    visited = []
-    stack = [(start_vertex, None)]
-
-    while stack:
-        current, parent = stack.pop()
+    if acyclic is not None and start_vertex in acyclic:
+        return False
 
-        if current not in visited:
-            visited.append(current)
+    color = {start_vertex: _GRAY}
+    stack = [(start_vertex, None, iter(graph[start_vertex]))]
 
-        for neighbor in graph[current]:
-            if neighbor not in visited:
-                stack.append((neighbor, current))
-            elif neighbor != parent:
+    while stack:
+        current, parent, neighbors = stack[-1]
+
+        for neighbor in neighbors:
+            state = color.get(neighbor, _WHITE)
+            if state == _WHITE:
+                color[neighbor] = _GRAY
+                stack.append((neighbor, current, iter(graph[neighbor])))
+                break
+            if state == _GRAY and neighbor != parent:
                 return True
+        else:
+            color[current] = _BLACK
+            stack.pop()
+
+    if acyclic is not None:
+        acyclic.update(color)
 
     return False
 
 
 def detect_cycle_recursive(
-        graph: Graph,
-        vertex: Any,
-        parent: Any = None,
-        visited: List[Any] = None
+        graph: Adjacency,
+        start_vertex: Any,
+        acyclic: Optional[Set[Any]] = None
 ) -> bool:
     """
-    Detect whether the graph contains a cycle using recursive DFS.
+    Detect whether the graph contains a cycle using DFS.
+
+    Retained for API compatibility; delegates to the iterative
+    implementation to avoid recursion-depth limits.
 
     :param graph: Adjacency list (Graph.graph)
-    :param vertex: Current vertex
-    :param parent: Parent vertex in DFS tree
-    :param visited: List of visited vertices
+    :param start_vertex: Starting vertex
+    :param acyclic: Optional memo of vertices in cycle-free components
     :return: True if a cycle exists, otherwise False
     """
-    if visited is None:
-        visited = []
+    return detect_cycle_iterative(graph, start_vertex, acyclic)
 
-    if vertex is None:
-        return False
 
-    visited.append(vertex)
+# ----------------------------------------------------------------------
+# CSR (Frozen) Representation
+# ----------------------------------------------------------------------
+def to_csr(graph: Adjacency) -> Tuple[Dict[Any, int], array, array]:
+    """
+    Build a Compressed Sparse Row (CSR) snapshot of the graph.
 
-    for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            if detect_cycle_recursive(graph, neighbor, vertex, visited):
-                return True
-        elif neighbor != parent:
-            return True
+    Vertices are relabelled to 0..V-1 in sorted label order, falling
+    back to insertion order when labels are not mutually comparable.
+    The neighbors of vertex `i` are `indices[indptr[i]:indptr[i + 1]]`,
+    sorted by id; each undirected edge appears once in the run of each
+    endpoint. Sorted runs allow merge-based set intersection.
 
-    return False
+    :param graph: Adjacency list (Graph.graph)
+    :return: (vertex → index map, indptr array, indices array)
+    """
+    try:
+        labels = sorted(graph)
+    except TypeError:
+        labels = list(graph)
+
+    vertex_index = {vertex: index for index, vertex in enumerate(labels)}
+    indptr = array("i", [0])
+    indices = array("i")
+
+    for vertex in labels:
+        indices.extend(sorted([vertex_index[neighbor] for neighbor in graph[vertex]]))
+        indptr.append(len(indices))
+
+    return vertex_index, indptr, indices
+
+
+def bfs_iterative_csr(indptr: array, indices: array, source: int) -> List[int]:
+    """
+    Perform iterative Breadth-First Search (BFS) over a CSR snapshot.
+
+    Works on integer vertex indices only, using a byte-per-vertex
+    visited mask and a preallocated array queue with head/tail
+    positions. BFS order is enqueue order, so the queue doubles as the
+    output buffer: it is sized to V up front and sliced at `tail`, and
+    the traversal never grows a list.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param source: Index of the starting vertex
+    :return: BFS traversal order as vertex indices
+    """
+    vertex_count = len(indptr) - 1
+    visited = bytearray(vertex_count)
+    queue = array("i", bytes(4 * vertex_count))
+
+    visited[source] = 1
+    queue[0] = source
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue[tail] = neighbor
+                tail += 1
+
+    return queue[:tail].tolist()
+
+
+def bfs_distances_csr(indptr: array, indices: array, source: int) -> array:
+    """
+    Compute BFS hop distances from a source over a CSR snapshot.
+
+    The distance array doubles as the visited mask (-1 means unreached),
+    and the queue is a preallocated array with head/tail positions, so
+    the loop touches only flat integer buffers.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param source: Index of the starting vertex
+    :return: Distance per vertex index, -1 for unreachable vertices
+    """
+    vertex_count = len(indptr) - 1
+    distance = array("i", [-1]) * vertex_count
+    queue = array("i", bytes(4 * vertex_count))
+
+    distance[source] = 0
+    queue[0] = source
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        next_distance = distance[current] + 1
+
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if distance[neighbor] < 0:
+                distance[neighbor] = next_distance
+                queue[tail] = neighbor
+                tail += 1
+
+    return distance
+
+
+def bfs_tree_csr(indptr: array, indices: array, source: int) -> Tuple[array, array]:
+    """
+    Build a BFS tree (distances and parents) over a CSR snapshot.
+
+    Level-synchronous: each pass expands the whole current frontier into
+    a fresh next-frontier array, so one level's work is independent of
+    the order its frontier entries are processed in.
+
+    Direction-optimizing: sparse frontiers are kept as an index list and
+    pushed to their neighbors. When the frontier's outgoing edges exceed
+    1/_PULL_ALPHA of the edges still unexplored, the frontier becomes a
+    byte-per-vertex mask and each unvisited vertex pulls from it instead,
+    stopping at its first neighbor in the frontier. Pulling continues
+    until the frontier shrinks below 1/_PUSH_BETA of all vertices.
+    Distances are identical either way; the parent picked for a pulled
+    vertex may differ from the push order, but is always a valid BFS
+    parent.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param source: Index of the starting vertex
+    :return: (distance array, parent array); -1 marks unreachable
+             vertices and the source's parent
+    """
+    vertex_count = len(indptr) - 1
+    distance = array("i", [-1]) * vertex_count
+    parent = array("i", [-1]) * vertex_count
+
+    distance[source] = 0
+    frontier = array("i", [source])
+    frontier_edges = indptr[source + 1] - indptr[source]
+    unexplored_edges = len(indices) - frontier_edges
+    pulling = False
+    level = 0
+
+    while frontier:
+        level += 1
+
+        if pulling:
+            pulling = len(frontier) * _PUSH_BETA >= vertex_count
+        else:
+            pulling = frontier_edges * _PULL_ALPHA > unexplored_edges
+
+        if pulling:
+            frontier = _bfs_pull_level(indptr, indices, frontier, distance, parent, level)
+        else:
+            frontier = _bfs_push_level(indptr, indices, frontier, distance, parent, level)
+
+        frontier_edges = sum([indptr[vertex + 1] - indptr[vertex] for vertex in frontier])
+        unexplored_edges -= frontier_edges
+
+    return distance, parent
 
 
 # ----------------------------------------------------------------------
 # Utilities
 # ----------------------------------------------------------------------
-def print_graph(graph: Graph) -> None:
+def print_graph(graph: Adjacency, file: Optional[TextIO] = None) -> None:
     """
     Print the adjacency list representation of the graph.
 
+    The listing is assembled with a single join over a generator and
+    emitted with one write call.
+
     :param graph: Adjacency list (Graph.graph)
+    :param file: Output stream (defaults to sys.stdout)
     :return: None
     """
     width = 50
@@ -340,33 +560,186 @@ def print_graph(graph: Graph) -> None:
     header = title.center(width, '=')
     footer = "=" * width
 
-    print(header)
-    for vertex, neighbors in graph.items():
-        print(f"\tGraph [{vertex}] → [{', '.join([str(n) for n in neighbors])}]")
-    print(footer)
+    body = "\n".join(
+        f"\tGraph [{vertex}] → [{', '.join(map(str, neighbors))}]"
+        for vertex, neighbors in graph.items()
+    )
+    listing = f"{header}\n{body}\n{footer}\n" if body else f"{header}\n{footer}\n"
+
+    (sys.stdout if file is None else file).write(listing)
 
 
 # ----------------------------------------------------------------------
 # Internal Helpers
 # ----------------------------------------------------------------------
-def _vertex_exists(graph: Graph, vertex: Any) -> bool:
+def _dfs_from(graph: Adjacency, vertex: Any, visited: List[Any], visited_set: Set[Any]) -> List[Any]:
     """
-    Check if a vertex exists in the graph.
+    Depth-first walk shared by `dfs_iterative` and `dfs_recursive`.
+
+    An explicit stack of neighbor iterators mirrors the recursive call
+    stack, preserving recursive visiting order without Python frames.
 
     :param graph: Adjacency list (Graph.graph)
+    :param vertex: Starting vertex
+    :param visited: List of visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited`
+    :return: DFS traversal order
+    """
+    if vertex in visited_set:
+        return visited
+
+    stack = [iter(graph[vertex])]
+
+    # Bound methods cached as locals keep attribute lookups out of the
+    # per-edge loop
+    mark_visited = visited_set.add
+    record = visited.append
+    push = stack.append
+    pop = stack.pop
+
+    mark_visited(vertex)
+    record(vertex)
+
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited_set:
+                mark_visited(neighbor)
+                record(neighbor)
+                push(iter(graph[neighbor]))
+                break
+        else:
+            pop()
+
+    return visited
+
+
+def _bfs_push_level(
+        indptr: array,
+        indices: array,
+        frontier: array,
+        distance: array,
+        parent: array,
+        level: int
+) -> array:
+    """
+    Expand a sparse BFS frontier by scanning each frontier vertex's neighbors.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param frontier: Vertex indices discovered at the previous level
+    :param distance: Distance array, updated in place (-1 = unvisited)
+    :param parent: Parent array, updated in place
+    :param level: Distance assigned to newly discovered vertices
+    :return: Next frontier as vertex indices
+    """
+    next_frontier = array("i")
+    push = next_frontier.append
+
+    for current in frontier:
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if distance[neighbor] < 0:
+                distance[neighbor] = level
+                parent[neighbor] = current
+                push(neighbor)
+
+    return next_frontier
+
+
+def _bfs_pull_level(
+        indptr: array,
+        indices: array,
+        frontier: array,
+        distance: array,
+        parent: array,
+        level: int
+) -> array:
+    """
+    Expand a dense BFS frontier by letting unvisited vertices search for it.
+
+    The frontier is converted to a byte-per-vertex mask, so membership is
+    a single index; each unvisited vertex stops at its first neighbor in
+    the frontier. Relies on edges being stored on both endpoints.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param frontier: Vertex indices discovered at the previous level
+    :param distance: Distance array, updated in place (-1 = unvisited)
+    :param parent: Parent array, updated in place
+    :param level: Distance assigned to newly discovered vertices
+    :return: Next frontier as vertex indices
+    """
+    in_frontier = bytearray(len(distance))
+    for vertex in frontier:
+        in_frontier[vertex] = 1
+
+    next_frontier = array("i")
+    push = next_frontier.append
+
+    for vertex in range(len(distance)):
+        if distance[vertex] >= 0:
+            continue
+
+        for neighbor in indices[indptr[vertex]:indptr[vertex + 1]]:
+            if in_frontier[neighbor]:
+                distance[vertex] = level
+                parent[vertex] = neighbor
+                push(vertex)
+                break
+
+    return next_frontier
+
+
+def _find_root(parent: Dict[Any, Any], vertex: Any) -> Any:
+    """
+    Find the representative of a vertex's set, compressing the path.
+
+    :param parent: Union-Find parent pointers
     :param vertex: Vertex identifier
-    :return: True if vertex exists, otherwise False
+    :return: Root vertex of the set
     """
-    return vertex in graph
+    root = vertex
+    while parent[root] != root:
+        root = parent[root]
+
+    # Second pass points every vertex on the path straight at the root
+    while parent[vertex] != root:
+        parent[vertex], vertex = root, parent[vertex]
 
+    return root
 
-def _edge_exists(graph: Graph, from_vertex: Any, to_vertex: Any) -> bool:
+
+def _union(parent: Dict[Any, Any], rank: Dict[Any, int], first: Any, second: Any) -> bool:
+    """
+    Merge the sets containing two vertices, attaching by rank.
+
+    :param parent: Union-Find parent pointers
+    :param rank: Upper bound on each root's tree height
+    :param first: First vertex
+    :param second: Second vertex
+    :return: True if the sets were distinct and got merged, otherwise False
     """
-    Check if an edge exists in the graph.
+    first_root = _find_root(parent, first)
+    second_root = _find_root(parent, second)
+
+    if first_root == second_root:
+        return False
+
+    if rank[first_root] < rank[second_root]:
+        first_root, second_root = second_root, first_root
+
+    parent[second_root] = first_root
+    if rank[first_root] == rank[second_root]:
+        rank[first_root] += 1
+
+    return True
+
+
+def _vertex_exists(graph: Adjacency, vertex: Any) -> bool:
+    """
+    Check if a vertex exists in the graph.
 
     :param graph: Adjacency list (Graph.graph)
-    :param from_vertex: Source vertex
-    :param to_vertex: Destination vertex
-    :return: True if edge exists, otherwise False
+    :param vertex: Vertex identifier
+    :return: True if vertex exists, otherwise False
     """
-    return to_vertex in graph[from_vertex]
+    return vertex in graph
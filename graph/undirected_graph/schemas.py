@@ -19,10 +19,12 @@ Responsibilities
 ------------------------------------------------------------------------------------
 - Define the Graph container structure
 - Hold adjacency list state
+- Define the read-only FrozenGraph (CSR) snapshot container
 ------------------------------------------------------------------------------------
 Public Classes
 ------------------------------------------------------------------------------------
 - Graph
+- FrozenGraph
 ------------------------------------------------------------------------------------
 Internal / Helper Classes
 ------------------------------------------------------------------------------------
@@ -34,6 +36,8 @@ Design Notes
 - All algorithms and mutations are implemented externally
 - This module acts as a thin façade over operations
 - Traversal order is not enforced at schema level
+- FrozenGraph exposes the same traversal names as Graph, so callers can
+  pass either one; FrozenGraph takes the integer-indexed CSR fast path
 ------------------------------------------------------------------------------------
 """
 
@@ -54,9 +58,29 @@ class Graph:
 
         Creates an empty adjacency list where:
         - Keys represent vertices
-        - Values represent neighboring vertices
+        - Values represent neighboring vertices, stored as an insertion-ordered
+          set (dict keys mapped to None)
+
+        Also creates a memo of vertices whose component is known to be
+        cycle-free. Only inserting an edge can create a cycle, so only
+        `insert_edge` clears it.
+
+        `_csr` and `_frozen` cache the snapshots built by `to_csr` and
+        `freeze` until the next mutation.
         """
         self.graph = {}
+        self._acyclic = set()
+        self._csr = None
+        self._frozen = None
+
+    def _invalidate(self):
+        """
+        Drop cached structures derived from the adjacency list.
+
+        :return: None
+        """
+        self._csr = None
+        self._frozen = None
 
     # ------------------------------------------------------------------
     # Core Operations
@@ -71,6 +95,7 @@ class Graph:
         :type vertex: Any hashable type
         :return: None
         """
+        self._invalidate()
         return operations.insert_vertex(self.graph, vertex)
 
     def insert_edge(self, from_vertex, to_vertex):
@@ -86,8 +111,25 @@ class Graph:
         :type to_vertex: Any hashable type
         :return: None
         """
+        self._acyclic.clear()
+        self._invalidate()
         return operations.insert_edge(self.graph, from_vertex, to_vertex)
 
+    def insert_edges(self, pairs):
+        """
+        Add many undirected edges in a single pass.
+
+        Delegates to operations.insert_edges.
+        Missing vertices are auto-created.
+
+        :param pairs: (from_vertex, to_vertex) pairs
+        :type pairs: Iterable of tuples
+        :return: None
+        """
+        self._acyclic.clear()
+        self._invalidate()
+        return operations.insert_edges(self.graph, pairs)
+
     def remove_vertex(self, vertex):
         """
         Remove a vertex and all its incident edges.
@@ -98,6 +140,7 @@ class Graph:
         :type vertex: Any hashable type
         :return: None
         """
+        self._invalidate()
         return operations.remove_vertex(self.graph, vertex)
 
     def remove_edge(self, from_vertex, to_vertex):
@@ -112,6 +155,7 @@ class Graph:
         :type to_vertex: Any hashable type
         :return: None
         """
+        self._invalidate()
         return operations.remove_edge(self.graph, from_vertex, to_vertex)
 
     # ------------------------------------------------------------------
@@ -135,14 +179,15 @@ class Graph:
         Perform recursive (level-based) Breadth-First Search (BFS).
 
         Delegates to operations.bfs_recursive.
-        Internally manages traversal state.
+        Internally manages traversal state: an empty list for the output
+        order and an empty set for O(1) visited checks.
 
         :param start_vertex: Starting vertex for traversal
         :type start_vertex: Any hashable type
         :return: BFS traversal order
         :rtype: list
         """
-        return operations.bfs_recursive(self.graph, [start_vertex], [])
+        return operations.bfs_recursive(self.graph, [start_vertex], [], set())
 
     # ------------------------------------------------------------------
     # DFS Traversals
@@ -165,14 +210,15 @@ class Graph:
         Perform recursive Depth-First Search (DFS).
 
         Delegates to operations.dfs_recursive.
-        Internally manages traversal state.
+        Internally manages traversal state: an empty list for the output
+        order and an empty set for O(1) visited checks.
 
         :param start_vertex: Starting vertex for traversal
         :type start_vertex: Any hashable type
         :return: DFS traversal order
         :rtype: list
         """
-        return operations.dfs_recursive(self.graph, start_vertex, [])
+        return operations.dfs_recursive(self.graph, start_vertex, [], set())
 
     # ------------------------------------------------------------------
     # Graph State Operations
@@ -199,7 +245,7 @@ class Graph:
         :return: True if a cycle exists, otherwise False
         :rtype: bool
         """
-        return operations.detect_cycle_iterative(self.graph, start_vertex)
+        return operations.detect_cycle_iterative(self.graph, start_vertex, self._acyclic)
 
     def detect_cycle_recursive(self, start_vertex):
         """
@@ -212,17 +258,176 @@ class Graph:
         :return: True if a cycle exists, otherwise False
         :rtype: bool
         """
-        return operations.detect_cycle_recursive(self.graph, start_vertex)
+        return operations.detect_cycle_recursive(self.graph, start_vertex, self._acyclic)
+
+    # ------------------------------------------------------------------
+    # CSR (Frozen) Representation
+    # ------------------------------------------------------------------
+    def to_csr(self):
+        """
+        Return the read-only CSR snapshot of the graph, building it if needed.
+
+        Delegates to operations.to_csr. The snapshot is cached until the
+        next mutation, so repeated queries pay for the conversion once.
+
+        :return: (vertex → index map, indptr array, indices array)
+        :rtype: tuple
+        """
+        if self._csr is None:
+            self._csr = operations.to_csr(self.graph)
+        return self._csr
+
+    def freeze(self):
+        """
+        Return the read-only FrozenGraph snapshot of the graph.
+
+        The relabelling is paid once; the same FrozenGraph is returned
+        until a mutation drops it. A FrozenGraph already handed out is not
+        updated by later mutations.
+
+        :return: FrozenGraph over the current adjacency list
+        :rtype: FrozenGraph
+        """
+        if self._frozen is None:
+            self._frozen = FrozenGraph(*self.to_csr())
+        return self._frozen
+
+    def bfs_iterative_csr(self, start_vertex):
+        """
+        Perform iterative Breadth-First Search (BFS) over a CSR snapshot.
+
+        Delegates to FrozenGraph.bfs_iterative.
+
+        :param start_vertex: Starting vertex for traversal
+        :type start_vertex: Any hashable type
+        :return: BFS traversal order
+        :rtype: list
+        """
+        return self.freeze().bfs_iterative(start_vertex)
+
+    def bfs_distances_csr(self, start_vertex):
+        """
+        Compute BFS hop distances from a vertex over a CSR snapshot.
+
+        Delegates to FrozenGraph.bfs_distances.
+
+        :param start_vertex: Starting vertex for traversal
+        :type start_vertex: Any hashable type
+        :return: Mapping of each reachable vertex to its hop distance
+        :rtype: dict
+        """
+        return self.freeze().bfs_distances(start_vertex)
+
+    def bfs_tree_csr(self, start_vertex):
+        """
+        Build a BFS tree from a vertex over a CSR snapshot.
+
+        Delegates to FrozenGraph.bfs_tree.
+
+        :param start_vertex: Root vertex of the tree
+        :type start_vertex: Any hashable type
+        :return: Mapping of each reachable vertex to its BFS parent
+                 (None for the root)
+        :rtype: dict
+        """
+        return self.freeze().bfs_tree(start_vertex)
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
-    def print_graph(self):
+    def print_graph(self, file=None):
         """
         Print the adjacency list representation of the graph.
 
         Delegates to operations.print_graph.
 
+        :param file: Output stream (defaults to sys.stdout)
+        :type file: TextIO
         :return: None
         """
-        return operations.print_graph(self.graph)
+        return operations.print_graph(self.graph, file)
+
+
+class FrozenGraph:
+    """
+    Read-only Compressed Sparse Row (CSR) snapshot of a Graph.
+
+    Vertices are relabelled to dense integer ids 0..V-1; `labels` maps
+    ids back to the original vertex identifiers. Traversals run on the
+    integer arrays and translate results back to labels.
+    """
+
+    def __init__(self, vertex_index, indptr, indices):
+        """
+        Wrap the output of operations.to_csr.
+
+        :param vertex_index: Mapping of vertex label to integer id
+        :type vertex_index: dict
+        :param indptr: CSR row pointer array
+        :type indptr: array
+        :param indices: CSR neighbor index array
+        :type indices: array
+        """
+        self.vertex_index = vertex_index
+        self.labels = list(vertex_index)
+        self.indptr = indptr
+        self.indices = indices
+
+    def bfs_iterative(self, start_vertex):
+        """
+        Perform iterative Breadth-First Search (BFS).
+
+        Delegates to operations.bfs_iterative_csr.
+
+        :param start_vertex: Starting vertex for traversal
+        :type start_vertex: Any hashable type
+        :return: BFS traversal order
+        :rtype: list
+        """
+        labels = self.labels
+        order = operations.bfs_iterative_csr(
+            self.indptr, self.indices, self.vertex_index[start_vertex]
+        )
+        return [labels[index] for index in order]
+
+    def bfs_distances(self, start_vertex):
+        """
+        Compute BFS hop distances from a vertex.
+
+        Delegates to operations.bfs_distances_csr.
+
+        :param start_vertex: Starting vertex for traversal
+        :type start_vertex: Any hashable type
+        :return: Mapping of each reachable vertex to its hop distance
+        :rtype: dict
+        """
+        distance = operations.bfs_distances_csr(
+            self.indptr, self.indices, self.vertex_index[start_vertex]
+        )
+        return {
+            label: distance[index]
+            for index, label in enumerate(self.labels)
+            if distance[index] >= 0
+        }
+
+    def bfs_tree(self, start_vertex):
+        """
+        Build a BFS tree rooted at a vertex.
+
+        Delegates to operations.bfs_tree_csr.
+
+        :param start_vertex: Root vertex of the tree
+        :type start_vertex: Any hashable type
+        :return: Mapping of each reachable vertex to its BFS parent
+                 (None for the root)
+        :rtype: dict
+        """
+        labels = self.labels
+        distance, parent = operations.bfs_tree_csr(
+            self.indptr, self.indices, self.vertex_index[start_vertex]
+        )
+        return {
+            labels[index]: labels[parent[index]] if parent[index] >= 0 else None
+            for index in range(len(labels))
+            if distance[index] >= 0
+        }
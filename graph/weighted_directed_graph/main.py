@@ -74,7 +74,7 @@ def main() -> None:
 
     This function:
     - Builds a test graph
-    - Prints graph structure
+    - Prints graph structure and properties
     - Runs BFS and DFS traversals (direction-aware)
     - Tests path-cost computation
     - Runs shortest-path algorithm
@@ -90,6 +90,13 @@ def main() -> None:
     graph.print_graph()
     print("-" * 60)
 
+    print(" Graph Properties ".center(60, "-"))
+    print(f"Vertices    : {graph.vertex_count()}")
+    print(f"Edges       : {graph.edge_count()}")
+    print(f"Out-Degrees : {graph.out_degrees()}")
+    print(f"Topological : {graph.kahn_topological_sort()}")
+    print("-" * 60)
+
     print(" Traversals (Direction-Aware) ".center(60, "-"))
     print(f"BFS (Iterative) from A : {graph.bfs_iterative('A')}")
     print(f"BFS (Recursive) from A : {graph.bfs_recursive('A')}")
@@ -106,6 +113,7 @@ def main() -> None:
     print(" Shortest Path (Dijkstra) ".center(60, "-"))
     distance, previous = graph.shortest_path_dijkstra("A")
     print(f"Distances from A : {distance}")
+    print(f"Distances (Dial) : {graph.shortest_path_dial('A')[0]}")
 
     destination = "D"
     shortest_path = graph.shortest_path_to("A", destination)
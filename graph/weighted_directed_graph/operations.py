@@ -13,40 +13,97 @@ Responsibilities
 ------------------------------------------------------------------------------------
 - Implement vertex and edge insert/remove operations
 - Implement BFS and DFS (iterative and recursive)
+- Provide lazy BFS and DFS generators for early-exit queries
 - Implement weight-aware algorithms (path cost, shortest paths)
+- Implement topological ordering (Kahn’s algorithm)
 
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
 - All functions operate on adjacency-list dictionary (`Graph.graph`)
-- Adjacency list format: vertex -> List[(neighbor, weight)]
+- Adjacency list format: vertex -> Dict[neighbor, weight]
+- Edge insert, update, lookup and removal are single O(1) dict operations
+- The reverse adjacency list (`Graph.in_adj`) is built lazily on first
+  use; once built, mutations keep it in sync so `remove_vertex` touches
+  only the vertex's predecessors instead of scanning every vertex.
+  Mutators accept `None` for it and then only touch the forward
+  adjacency list
 - Traversals follow **edge direction**
+- Traversals track visited vertices in a set and keep the output order
+  in a separate list
+- Weighted CSR snapshots (`freeze`) number vertices with dense integer
+  ids, so `shortest_path_dijkstra_csr` keeps distances and predecessors
+  in flat lists and pushes (distance, int) pairs on its heap
+- SciPy is an optional dependency: when it is installed,
+  `shortest_path_dijkstra_sparse` runs Dijkstra in compiled code on a
+  sparse matrix built from the CSR snapshot
+- Numba is an optional dependency: when it is installed,
+  `shortest_path_dijkstra_jit` runs a compiled Dijkstra kernel over
+  typed copies of the CSR arrays
 - Graph schema is treated as a data container only
 ------------------------------------------------------------------------------------
 """
 
 import heapq
+from array import array
 from collections import deque
-from typing import Any, List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Iterator, Set, Tuple, Optional
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+except ImportError:  # SciPy is optional
+    csr_matrix = None
+    csgraph_dijkstra = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional
+    np = None
+    njit = None
 
 
 # --------------------------------------------------------------------------
 # Core Operations
 # --------------------------------------------------------------------------
-def insert_vertex(graph: Dict[Any, List[Tuple[Any, Any]]], vertex: Any) -> None:
+def build_in_adj(graph: Dict[Any, Dict[Any, Any]]) -> Dict[Any, Dict[Any, None]]:
+    """
+    Build the reverse adjacency list in one pass over all edges.
+
+    :param graph: Adjacency list representation of the graph
+    :return: Mapping of each vertex to its incoming neighbors
+    """
+    in_adj = {vertex: {} for vertex in graph}
+
+    for vertex, neighbors in graph.items():
+        for neighbor in neighbors:
+            in_adj[neighbor][vertex] = None
+
+    return in_adj
+
+
+def insert_vertex(
+        graph: Dict[Any, Dict[Any, Any]],
+        in_adj: Optional[Dict[Any, Dict[Any, None]]],
+        vertex: Any
+) -> None:
     """
     Add a vertex to the graph if it does not already exist.
 
     :param graph: Adjacency list representation of the graph
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param vertex: Vertex identifier
     :return: None
     """
-    if vertex not in graph:
-        graph[vertex] = []
+    graph.setdefault(vertex, {})
+    if in_adj is not None:
+        in_adj.setdefault(vertex, {})
 
 
 def insert_edge(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
+        in_adj: Optional[Dict[Any, Dict[Any, None]]],
         from_vertex: Any,
         to_vertex: Any,
         weight: Any
@@ -55,30 +112,24 @@ def insert_edge(
     Add or update a directed weighted edge (u → v).
 
     :param graph: Adjacency list representation of the graph
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
     :param weight: Weight associated with the edge
     :return: None
     """
-    if from_vertex not in graph:
-        graph[from_vertex] = []
-
-    if to_vertex not in graph:
-        graph[to_vertex] = []
-
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            if wgt == weight:
-                return
-            graph[from_vertex].remove((vtx, wgt))
-            graph[from_vertex].append((to_vertex, weight))
-            return
+    neighbors = graph.setdefault(from_vertex, {})
+    graph.setdefault(to_vertex, {})
+    neighbors[to_vertex] = weight
 
-    graph[from_vertex].append((to_vertex, weight))
+    if in_adj is not None:
+        in_adj.setdefault(from_vertex, {})
+        in_adj.setdefault(to_vertex, {})[from_vertex] = None
 
 
 def update_edge_weight(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
+        in_adj: Optional[Dict[Any, Dict[Any, None]]],
         from_vertex: Any,
         to_vertex: Any,
         weight: Any
@@ -87,6 +138,7 @@ def update_edge_weight(
     Update the weight of an existing directed edge.
 
     :param graph: Adjacency list representation of the graph
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
     :param weight: New weight
@@ -95,19 +147,13 @@ def update_edge_weight(
     if from_vertex not in graph or to_vertex not in graph:
         return
 
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            if wgt == weight:
-                return
-            graph[from_vertex].remove((vtx, wgt))
-            graph[from_vertex].append((to_vertex, weight))
-            return
-
-    graph[from_vertex].append((to_vertex, weight))
+    graph[from_vertex][to_vertex] = weight
+    if in_adj is not None:
+        in_adj[to_vertex][from_vertex] = None
 
 
 def get_edge_weight(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         from_vertex: Any,
         to_vertex: Any
 ) -> Optional[Any]:
@@ -119,42 +165,54 @@ def get_edge_weight(
     :param to_vertex: Destination vertex
     :return: Edge weight if present, otherwise None
     """
-    if from_vertex not in graph:
+    neighbors = graph.get(from_vertex)
+    if neighbors is None:
         return None
 
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            return wgt
-
-    return None
+    return neighbors.get(to_vertex)
 
 
 def remove_vertex(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
+        in_adj: Optional[Dict[Any, Dict[Any, None]]],
         vertex: Any
 ) -> None:
     """
     Remove a vertex and all its incident edges (incoming and outgoing).
 
+    Incoming edges are located through the reverse adjacency list when
+    it is available, so only the vertex's actual neighbors are touched;
+    otherwise every adjacency list is scanned.
+
     :param graph: Adjacency list representation
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param vertex: Vertex to remove
     :return: None
     """
     if vertex not in graph:
         return
 
+    if in_adj is None:
+        # Remove outgoing edges
+        del graph[vertex]
+
+        # Remove incoming edges
+        for neighbors in graph.values():
+            neighbors.pop(vertex, None)
+        return
+
     # Remove outgoing edges
-    del graph[vertex]
+    for neighbor in graph.pop(vertex):
+        del in_adj[neighbor][vertex]
 
     # Remove incoming edges
-    for vtx in graph:
-        graph[vtx] = [
-            (n, w) for n, w in graph[vtx] if n != vertex
-        ]
+    for predecessor in in_adj.pop(vertex):
+        del graph[predecessor][vertex]
 
 
 def remove_edge(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
+        in_adj: Optional[Dict[Any, Dict[Any, None]]],
         from_vertex: Any,
         to_vertex: Any
 ) -> None:
@@ -162,124 +220,260 @@ def remove_edge(
     Remove a directed edge (u → v).
 
     :param graph: Adjacency list representation
+    :param in_adj: Reverse adjacency list (Graph.in_adj), or None if not built
     :param from_vertex: Source vertex
     :param to_vertex: Destination vertex
     :return: None
     """
-    if from_vertex in graph:
-        graph[from_vertex] = [
-            (n, w) for n, w in graph[from_vertex] if n != to_vertex
-        ]
+    neighbors = graph.get(from_vertex)
+    if neighbors is None or to_vertex not in neighbors:
+        return
+
+    del neighbors[to_vertex]
+    if in_adj is not None:
+        del in_adj[to_vertex][from_vertex]
+
+
+# ----------------------------------------------------------------------
+# Graph Properties
+# ----------------------------------------------------------------------
+def vertex_count(graph: Dict[Any, Dict[Any, Any]]) -> int:
+    """
+    Return the number of vertices.
+
+    :param graph: Adjacency list representation
+    :return: Vertex count
+    """
+    return len(graph)
+
+
+def edge_count(graph: Dict[Any, Dict[Any, Any]]) -> int:
+    """
+    Return the number of directed edges.
+
+    :param graph: Adjacency list representation
+    :return: Edge count
+    """
+    return sum(map(len, graph.values()))
+
+
+def out_degrees(graph: Dict[Any, Dict[Any, Any]]) -> Dict[Any, int]:
+    """
+    Return the out-degree of every vertex.
+
+    :param graph: Adjacency list representation
+    :return: Mapping of vertex to number of outgoing edges
+    """
+    return {vertex: len(neighbors) for vertex, neighbors in graph.items()}
+
+
+def kahn_topological_sort(graph: Dict[Any, Dict[Any, Any]]) -> List[Any]:
+    """
+    Perform topological sorting using Kahn’s algorithm.
+
+    Vertices are emitted once their indegree drops to zero, so each
+    vertex and edge is processed exactly once (O(V + E)). If the graph
+    contains a cycle, vertices on or reachable from it are left out.
+
+    :param graph: Adjacency list representation
+    :return: List of vertices in topological order
+    """
+    indegree_map = dict.fromkeys(graph, 0)
+
+    for neighbors in graph.values():
+        for vertex in neighbors:
+            indegree_map[vertex] += 1
+
+    process_queue = deque(vertex for vertex, indegree in indegree_map.items() if indegree == 0)
+    sort_output = []
+
+    while process_queue:
+        current = process_queue.popleft()
+        sort_output.append(current)
+
+        for neighbor in graph[current]:
+            indegree_map[neighbor] -= 1
+            if indegree_map[neighbor] == 0:
+                process_queue.append(neighbor)
+
+    return sort_output
 
 
 # ----------------------------------------------------------------------
 # BFS Traversal (direction-aware, weight-agnostic)
 # ----------------------------------------------------------------------
-def bfs_iterative(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+def bfs_iter(
+        graph: Dict[Any, Dict[Any, Any]],
         start_vertex: Any
-) -> List[Any]:
+) -> Iterator[Any]:
     """
-    Perform iterative Breadth-First Search (BFS) following edge direction.
+    Lazily yield vertices in Breadth-First Search (BFS) order.
+
+    Vertices are produced as they are discovered, so a caller that stops
+    early (e.g. once a target is found) does no further work.
 
     :param graph: Adjacency list representation
     :param start_vertex: Starting vertex
-    :return: BFS traversal order
+    :return: Iterator over vertices in BFS order
     """
-    visited = []
+    visited = {start_vertex}
     queue = deque([start_vertex])
+    yield start_vertex
 
+    # Vertices are marked visited when enqueued, so the queue never
+    # holds duplicates and needs no membership scan
     while queue:
         current = queue.popleft()
-        if current not in visited:
-            visited.append(current)
 
-            for neighbor, _ in graph.get(current, []):
-                if neighbor not in visited and neighbor not in queue:
-                    queue.append(neighbor)
+        for neighbor in graph.get(current, ()):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor
+                queue.append(neighbor)
+
 
-    return visited
+def bfs_iterative(
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any
+) -> List[Any]:
+    """
+    Perform iterative Breadth-First Search (BFS) following edge direction.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :return: BFS traversal order
+    """
+    return list(bfs_iter(graph, start_vertex))
 
 
 def bfs_recursive(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         level_vertices: List[Any],
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive BFS (level-based) following edge direction.
 
+    Implemented as a level-by-level loop, so deep graphs do not
+    hit Python's recursion limit. Vertices are marked on discovery,
+    so each level list holds every vertex at most once.
+
     :param graph: Adjacency list representation
     :param level_vertices: Current BFS frontier
-    :param visited: Visited vertices
+    :param visited: Visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: BFS traversal order
     """
-    if not level_vertices:
-        return visited
-
-    next_level = []
+    if visited_set is None:
+        visited_set = set(visited)
 
+    level = []
     for vertex in level_vertices:
-        if vertex not in visited:
-            visited.append(vertex)
+        if vertex not in visited_set:
+            visited_set.add(vertex)
+            level.append(vertex)
 
-        for neighbor, _ in graph.get(vertex, []):
-            if neighbor not in visited:
-                next_level.append(neighbor)
+    # Each pass of the loop processes one level, replacing the
+    # per-level recursive call
+    while level:
+        visited.extend(level)
+        next_level = []
 
-    return bfs_recursive(graph, next_level, visited)
+        for vertex in level:
+            for neighbor in graph.get(vertex, ()):
+                if neighbor not in visited_set:
+                    visited_set.add(neighbor)
+                    next_level.append(neighbor)
+
+        level = next_level
+
+    return visited
 
 
 # ----------------------------------------------------------------------
 # DFS Traversals (direction-aware, weight-agnostic)
 # ----------------------------------------------------------------------
-def dfs_iterative(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+def dfs_iter(
+        graph: Dict[Any, Dict[Any, Any]],
         start_vertex: Any
-) -> List[Any]:
+) -> Iterator[Any]:
     """
-    Perform iterative Depth-First Search (DFS) following edge direction.
+    Lazily yield vertices in iterative Depth-First Search (DFS) order.
+
+    Yields the same sequence `dfs_iterative` returns, one vertex at a
+    time, so a caller that stops early does no further work.
 
     :param graph: Adjacency list representation
     :param start_vertex: Starting vertex
-    :return: DFS traversal order
+    :return: Iterator over vertices in DFS order
     """
-    visited = []
+    visited = set()
     stack = [start_vertex]
 
     while stack:
         current = stack.pop()
         if current not in visited:
-            visited.append(current)
+            visited.add(current)
+            yield current
 
-            for neighbor, _ in graph.get(current, []):
+            for neighbor in graph.get(current, ()):
                 if neighbor not in visited:
                     stack.append(neighbor)
 
-    return visited
+
+def dfs_iterative(
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any
+) -> List[Any]:
+    """
+    Perform iterative Depth-First Search (DFS) following edge direction.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :return: DFS traversal order
+    """
+    return list(dfs_iter(graph, start_vertex))
 
 
 def dfs_recursive(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         vertex: Any,
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive Depth-First Search (DFS) following edge direction.
 
+    Implemented with an explicit stack of neighbor iterators that mirrors
+    the recursive call stack, preserving recursive visiting order
+    without Python frames or recursion-depth limits.
+
     :param graph: Adjacency list representation
     :param vertex: Current vertex
-    :param visited: Visited vertices
+    :param visited: Visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: DFS traversal order
     """
-    if vertex is None or vertex in visited:
+    if visited_set is None:
+        visited_set = set(visited)
+
+    if vertex is None or vertex in visited_set:
         return visited
 
+    visited_set.add(vertex)
     visited.append(vertex)
+    stack = [iter(graph.get(vertex, ()))]
 
-    for neighbor, _ in graph.get(vertex, []):
-        if neighbor not in visited:
-            dfs_recursive(graph, neighbor, visited)
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited_set:
+                visited_set.add(neighbor)
+                visited.append(neighbor)
+                stack.append(iter(graph.get(neighbor, ())))
+                break
+        else:
+            stack.pop()
 
     return visited
 
@@ -288,7 +482,7 @@ def dfs_recursive(
 # Weight-Aware Algorithms
 # ----------------------------------------------------------------------
 def get_path_cost(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         path: List[Any]
 ) -> Optional[Any]:
     """
@@ -300,11 +494,13 @@ def get_path_cost(
     """
     total_cost = 0
 
-    for index in range(len(path) - 1):
-        from_vertex = path[index]
-        to_vertex = path[index + 1]
+    # Direct adjacency lookups: O(1) per hop, no helper call per edge
+    for from_vertex, to_vertex in zip(path, path[1:]):
+        neighbors = graph.get(from_vertex)
+        if neighbors is None:
+            return None
 
-        weight = get_edge_weight(graph, from_vertex, to_vertex)
+        weight = neighbors.get(to_vertex)
         if weight is None:
             return None
 
@@ -313,44 +509,258 @@ def get_path_cost(
     return total_cost
 
 
+def _sift_up(heap: List[Any], position: Dict[Any, int], key: Dict[Any, Any], index: int) -> None:
+    """
+    Move the vertex at `index` up an indexed min-heap until ordered.
+
+    :param heap: Heap of vertices
+    :param position: Vertex → index in `heap`
+    :param key: Vertex → priority
+    :param index: Index of the vertex to move
+    :return: None
+    """
+    vertex = heap[index]
+    vertex_key = key[vertex]
+
+    while index > 0:
+        parent_index = (index - 1) >> 1
+        parent = heap[parent_index]
+        if key[parent] <= vertex_key:
+            break
+        heap[index] = parent
+        position[parent] = index
+        index = parent_index
+
+    heap[index] = vertex
+    position[vertex] = index
+
+
+def _sift_down(heap: List[Any], position: Dict[Any, int], key: Dict[Any, Any], index: int) -> None:
+    """
+    Move the vertex at `index` down an indexed min-heap until ordered.
+
+    :param heap: Heap of vertices
+    :param position: Vertex → index in `heap`
+    :param key: Vertex → priority
+    :param index: Index of the vertex to move
+    :return: None
+    """
+    size = len(heap)
+    vertex = heap[index]
+    vertex_key = key[vertex]
+
+    while True:
+        child_index = 2 * index + 1
+        if child_index >= size:
+            break
+        if child_index + 1 < size and key[heap[child_index + 1]] < key[heap[child_index]]:
+            child_index += 1
+        child = heap[child_index]
+        if key[child] >= vertex_key:
+            break
+        heap[index] = child
+        position[child] = index
+        index = child_index
+
+    heap[index] = vertex
+    position[vertex] = index
+
+
+def _shortest_path_dijkstra_indexed(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        target: Optional[Any]
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Dijkstra's algorithm on an indexed binary heap with decrease-key.
+
+    Each vertex is in the heap at most once; an improved distance moves
+    its existing entry up instead of pushing a duplicate, so the heap
+    never exceeds V entries and no stale entries are popped.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :param target: Optional vertex at which to stop early
+    :return: Distance map and predecessor map
+    """
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
+
+    distance[source] = 0
+    heap = [source]
+    position = {source: 0}
+
+    while heap:
+        current_vertex = heap[0]
+        last = heap.pop()
+        del position[current_vertex]
+        if heap:
+            heap[0] = last
+            _sift_down(heap, position, distance, 0)
+
+        if current_vertex == target:
+            break
+
+        neighbors = graph.get(current_vertex)
+        if neighbors is None:
+            continue
+
+        current_distance = distance[current_vertex]
+        for neighbor, weight in neighbors.items():
+            alt_distance = current_distance + weight
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current_vertex
+
+                index = position.get(neighbor)
+                if index is None:
+                    index = len(heap)
+                    heap.append(neighbor)
+                _sift_up(heap, position, distance, index)
+
+    return distance, previous
+
+
 def shortest_path_dijkstra(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
-        source: Any
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        target: Optional[Any] = None,
+        decrease_key: bool = False
 ) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
     """
     Compute shortest paths from source using Dijkstra's algorithm.
 
+    Uses a binary heap (`heapq`) with lazy deletion: instead of a
+    decrease-key, an improved distance pushes a new entry, and entries
+    whose distance is stale when popped are skipped. Runs in
+    O((V + E) log V), with up to E heap entries.
+
+    With `decrease_key` set, an indexed binary heap is used instead:
+    each vertex has at most one entry, which is moved up in place when
+    its distance improves, keeping the heap at most V entries. This
+    saves memory on dense graphs with many relaxations.
+
+    When `target` is given the search stops as soon as the target is
+    popped, since its distance is final at that point. Only the target
+    and vertices popped before it are then guaranteed to hold final
+    distances and predecessors.
+
     :param graph: Adjacency list representation
     :param source: Source vertex
+    :param target: Optional vertex at which to stop early
+    :param decrease_key: Use the indexed heap with decrease-key
     :return: Distance map and predecessor map
     """
-    distance = {vertex: float("inf") for vertex in graph}
-    previous = {vertex: None for vertex in graph}
+    if decrease_key:
+        return _shortest_path_dijkstra_indexed(graph, source, target)
+
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
 
     distance[source] = 0
     priority_queue = [(0, source)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
 
     while priority_queue:
-        current_distance, current_vertex = heapq.heappop(priority_queue)
+        current_distance, current_vertex = heappop(priority_queue)
 
+        # Stale entry: a shorter distance was pushed after this one
         if current_distance > distance[current_vertex]:
             continue
 
-        for neighbor, weight in graph.get(current_vertex, []):
-            alt_distance = distance[current_vertex] + weight
+        if current_vertex == target:
+            break
+
+        neighbors = graph.get(current_vertex)
+        if neighbors is None:
+            continue
+
+        for neighbor, weight in neighbors.items():
+            alt_distance = current_distance + weight
 
             if alt_distance < distance[neighbor]:
                 distance[neighbor] = alt_distance
                 previous[neighbor] = current_vertex
-                heapq.heappush(priority_queue, (alt_distance, neighbor))
+                heappush(priority_queue, (alt_distance, neighbor))
+
+    return distance, previous
+
+
+def shortest_path_dial(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Compute shortest paths from source using Dial's bucket queue.
+
+    Suited to small non-negative integer weights. Vertices wait in
+    buckets indexed by tentative distance; with maximum weight C only
+    C + 1 buckets are ever live, so they are reused circularly. Each
+    push and pop is a plain list operation with no log factor, giving
+    O(V * C + E) overall. Entries whose distance improved after they
+    were queued are skipped when popped.
+
+    Falls back to `shortest_path_dijkstra` if any weight is not a
+    non-negative integer.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :return: Distance map and predecessor map
+    """
+    max_weight = 0
+    for neighbors in graph.values():
+        for weight in neighbors.values():
+            if not isinstance(weight, int) or weight < 0:
+                return shortest_path_dijkstra(graph, source)
+            if weight > max_weight:
+                max_weight = weight
+
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
+
+    distance[source] = 0
+    bucket_count = max_weight + 1
+    buckets = [[] for _ in range(bucket_count)]
+    buckets[0].append(source)
+    pending = 1
+    current_distance = 0
+
+    while pending:
+        bucket = buckets[current_distance % bucket_count]
+
+        while bucket:
+            current_vertex = bucket.pop()
+            pending -= 1
+
+            # Stale entry: the vertex was queued again at a shorter distance
+            if distance[current_vertex] != current_distance:
+                continue
+
+            neighbors = graph.get(current_vertex)
+            if neighbors is None:
+                continue
+
+            for neighbor, weight in neighbors.items():
+                alt_distance = current_distance + weight
+
+                if alt_distance < distance[neighbor]:
+                    distance[neighbor] = alt_distance
+                    previous[neighbor] = current_vertex
+                    buckets[alt_distance % bucket_count].append(neighbor)
+                    pending += 1
+
+        current_distance += 1
 
     return distance, previous
 
 
 def shortest_path_to(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         source: Any,
-        destination: Any
+        destination: Any,
+        previous: Optional[Dict[Any, Optional[Any]]] = None
 ) -> List[Any]:
     """
     Reconstruct shortest directed path between two vertices.
@@ -358,9 +768,14 @@ def shortest_path_to(
     :param graph: Adjacency list representation
     :param source: Source vertex
     :param destination: Destination vertex
+    :param previous: Predecessor map from a completed Dijkstra run from
+        `source`; when given, the search is skipped and only the path
+        is reconstructed
     :return: Shortest path as list of vertices
     """
-    _, previous = shortest_path_dijkstra(graph, source)
+    if previous is None:
+        _, previous = shortest_path_dijkstra(graph, source, destination)
+
     path = []
     current = destination
 
@@ -372,10 +787,298 @@ def shortest_path_to(
     return path if path and path[0] == source else []
 
 
+# ----------------------------------------------------------------------
+# CSR (Frozen) Representation
+# ----------------------------------------------------------------------
+def index_vertex(index_of: Dict[Any, int], labels: List[Any], vertex: Any) -> int:
+    """
+    Assign a dense integer id to a vertex if it does not have one yet.
+
+    :param index_of: Vertex → integer id symbol table
+    :param labels: Integer id → vertex table
+    :param vertex: Vertex identifier
+    :return: Integer id of the vertex
+    """
+    index = index_of.get(vertex)
+    if index is None:
+        index = len(labels)
+        index_of[vertex] = index
+        labels.append(vertex)
+    return index
+
+
+def unindex_vertex(index_of: Dict[Any, int], labels: List[Any], vertex: Any) -> None:
+    """
+    Release a vertex's integer id, keeping ids dense.
+
+    The vertex holding the highest id is moved into the freed slot.
+
+    :param index_of: Vertex → integer id symbol table
+    :param labels: Integer id → vertex table
+    :param vertex: Vertex identifier
+    :return: None
+    """
+    index = index_of.pop(vertex, None)
+    if index is None:
+        return
+
+    last = labels.pop()
+    if index < len(labels):
+        labels[index] = last
+        index_of[last] = index
+
+
+def freeze(
+        graph: Dict[Any, Dict[Any, Any]],
+        labels: List[Any],
+        index_of: Dict[Any, int]
+) -> Tuple[array, array, List[Any]]:
+    """
+    Build a weighted Compressed Sparse Row (CSR) snapshot of the graph.
+
+    Row `i` describes the vertex `labels[i]`: its outgoing neighbors are
+    `indices[indptr[i]:indptr[i + 1]]` and the matching edge weights are
+    the same slice of `weights`. Weights are kept in a list so they
+    retain their original numeric type.
+
+    :param graph: Adjacency list representation
+    :param labels: Integer id → vertex table covering every vertex
+    :param index_of: Vertex → integer id symbol table
+    :return: (indptr array, indices array, weights list)
+    """
+    indptr = array("i", [0])
+    indices = array("i")
+    weights = []
+
+    for vertex in labels:
+        neighbors = graph[vertex]
+        indices.extend([index_of[neighbor] for neighbor in neighbors])
+        weights.extend(neighbors.values())
+        indptr.append(len(indices))
+
+    return indptr, indices, weights
+
+
+def shortest_path_dijkstra_csr(
+        indptr: array,
+        indices: array,
+        weights: List[Any],
+        source: int,
+        target: Optional[int] = None
+) -> Tuple[List[Any], List[int]]:
+    """
+    Compute shortest paths from source over a weighted CSR snapshot.
+
+    Same algorithm as `shortest_path_dijkstra`, but vertices are dense
+    integer ids: distances and predecessors are flat lists updated by
+    index, and heap entries are (distance, int) pairs that compare
+    without touching vertex objects.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param weights: Edge weights aligned with `indices`
+    :param source: Id of the source vertex
+    :param target: Optional id at which to stop early
+    :return: Distance list and predecessor list (-1 for no predecessor)
+    """
+    vertex_count = len(indptr) - 1
+    distance = [float("inf")] * vertex_count
+    previous = [-1] * vertex_count
+
+    distance[source] = 0
+    priority_queue = [(0, source)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while priority_queue:
+        current_distance, current = heappop(priority_queue)
+
+        # Stale entry: a shorter distance was pushed after this one
+        if current_distance > distance[current]:
+            continue
+
+        if current == target:
+            break
+
+        for position in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[position]
+            alt_distance = current_distance + weights[position]
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current
+                heappush(priority_queue, (alt_distance, neighbor))
+
+    return distance, previous
+
+
+def to_sparse_matrix(indptr: array, indices: array, weights: List[Any]) -> Optional[Any]:
+    """
+    Wrap a weighted CSR snapshot in a SciPy sparse matrix.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param weights: Edge weights aligned with `indices`
+    :return: `scipy.sparse.csr_matrix`, or None if SciPy is not installed
+    """
+    if csr_matrix is None:
+        return None
+
+    vertex_count = len(indptr) - 1
+    return csr_matrix((weights, indices, indptr), shape=(vertex_count, vertex_count))
+
+
+def shortest_path_dijkstra_sparse(matrix: Any, source: int) -> Tuple[List[float], List[int]]:
+    """
+    Compute shortest paths from source with SciPy's compiled Dijkstra.
+
+    Explicitly stored zero weights count as edges. Distances are
+    returned as floats.
+
+    :param matrix: Sparse matrix from `to_sparse_matrix`
+    :param source: Id of the source vertex
+    :return: Distance list and predecessor list (-1 for no predecessor)
+    """
+    distance, previous = csgraph_dijkstra(
+        matrix, directed=True, indices=source, return_predecessors=True
+    )
+    previous[previous < 0] = -1
+    return distance.tolist(), previous.tolist()
+
+
+def _dijkstra_kernel(
+        indptr: Any,
+        indices: Any,
+        weights: Any,
+        source: int,
+        distance: Any,
+        previous: Any,
+        heap_keys: Any,
+        heap_ids: Any
+) -> None:
+    """
+    Dijkstra over CSR arrays with a hand-written binary heap.
+
+    Written for Numba's nopython mode: it only indexes flat buffers
+    allocated by the caller, and keeps the heap as two parallel arrays
+    (distance keys and vertex ids) instead of using `heapq`. Improved
+    distances push a new entry and stale entries are skipped when
+    popped, so the heap buffers need room for E + 1 entries.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param weights: Edge weights aligned with `indices`
+    :param source: Id of the source vertex
+    :param distance: Output distances, pre-filled with infinity
+    :param previous: Output predecessor ids, pre-filled with -1
+    :param heap_keys: Scratch buffer for heap distances
+    :param heap_ids: Scratch buffer for heap vertex ids
+    :return: None
+    """
+    distance[source] = 0.0
+    heap_keys[0] = 0.0
+    heap_ids[0] = source
+    size = 1
+
+    while size > 0:
+        current_distance = heap_keys[0]
+        current = heap_ids[0]
+        size -= 1
+
+        # Move the last entry to the root and sift it down
+        if size > 0:
+            key = heap_keys[size]
+            vertex = heap_ids[size]
+            position = 0
+            while True:
+                child = 2 * position + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                    child += 1
+                if heap_keys[child] >= key:
+                    break
+                heap_keys[position] = heap_keys[child]
+                heap_ids[position] = heap_ids[child]
+                position = child
+            heap_keys[position] = key
+            heap_ids[position] = vertex
+
+        # Stale entry: a shorter distance was pushed after this one
+        if current_distance > distance[current]:
+            continue
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            alt_distance = current_distance + weights[edge]
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current
+
+                # Append the new entry and sift it up
+                position = size
+                size += 1
+                while position > 0:
+                    parent = (position - 1) // 2
+                    if heap_keys[parent] <= alt_distance:
+                        break
+                    heap_keys[position] = heap_keys[parent]
+                    heap_ids[position] = heap_ids[parent]
+                    position = parent
+                heap_keys[position] = alt_distance
+                heap_ids[position] = neighbor
+
+
+_dijkstra_jit = njit(cache=True)(_dijkstra_kernel) if njit is not None else None
+
+
+def to_typed_arrays(indptr: array, indices: array, weights: List[Any]) -> Optional[Tuple[Any, Any, Any]]:
+    """
+    Copy a weighted CSR snapshot into NumPy arrays for the compiled kernel.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param weights: Edge weights aligned with `indices`
+    :return: (indptr, indices, weights) as int64/int64/float64 arrays,
+        or None if Numba is not installed
+    """
+    if _dijkstra_jit is None:
+        return None
+
+    return (
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+    )
+
+
+def shortest_path_dijkstra_jit(typed_arrays: Tuple[Any, Any, Any], source: int) -> Tuple[List[float], List[int]]:
+    """
+    Compute shortest paths from source with the Numba-compiled kernel.
+
+    The first call compiles the kernel (cached on disk); later calls
+    run at native speed. Distances are returned as floats.
+
+    :param typed_arrays: Arrays from `to_typed_arrays`
+    :param source: Id of the source vertex
+    :return: Distance list and predecessor list (-1 for no predecessor)
+    """
+    indptr, indices, weights = typed_arrays
+    vertex_count = len(indptr) - 1
+    distance = np.full(vertex_count, np.inf)
+    previous = np.full(vertex_count, -1, dtype=np.int64)
+    heap_keys = np.empty(len(indices) + 1, dtype=np.float64)
+    heap_ids = np.empty(len(indices) + 1, dtype=np.int64)
+
+    _dijkstra_jit(indptr, indices, weights, source, distance, previous, heap_keys, heap_ids)
+    return distance.tolist(), previous.tolist()
+
+
 # ----------------------------------------------------------------------
 # Utilities
 # ----------------------------------------------------------------------
-def print_graph(graph: Dict[Any, List[Tuple[Any, Any]]]) -> None:
+def print_graph(graph: Dict[Any, Dict[Any, Any]]) -> None:
     """
     Print adjacency list of directed weighted graph.
 
@@ -386,5 +1089,5 @@ def print_graph(graph: Dict[Any, List[Tuple[Any, Any]]]) -> None:
     title = " Directed Weighted Graph "
     print(title.center(width, "="))
     for vertex, neighbors in graph.items():
-        print(f"\tGraph [{vertex}] → {neighbors}")
+        print(f"\tGraph [{vertex}] → {list(neighbors.items())}")
     print("=" * width)
@@ -28,9 +28,19 @@ Public Classes
 Design Notes
 ------------------------------------------------------------------------------------
 - Graph holds state only (adjacency list)
+- Graph declares `__slots__`, so instances carry no `__dict__`
 - Adjacency list format:
-    vertex -> List[(neighbor, weight)]
+    vertex -> Dict[neighbor, weight]
 - Edges are **directed** (u → v)
+- The reverse adjacency list (`in_adj`) is built lazily on first use
+- A symbol table assigns each vertex a dense integer id; Dijkstra runs
+  on a cached CSR snapshot keyed by those ids
+- `shortest_path_dijkstra_fast` uses SciPy when it is installed and
+  falls back to the pure-Python search otherwise; likewise
+  `shortest_path_dijkstra_jit` with Numba
+- Dijkstra results are cached per source and dropped on any mutation
+- Derived properties (edge count, out-degrees) are memoized against a
+  snapshot token that every mutation increments
 ------------------------------------------------------------------------------------
 """
 
@@ -45,19 +55,122 @@ class Graph:
     (insert, delete, traversal, analysis) to external operations.
     """
 
+    __slots__ = (
+        "graph",
+        "in_adj",
+        "_index_of",
+        "_labels",
+        "_csr",
+        "_sparse",
+        "_typed_arrays",
+        "_dijkstra_cache",
+        "_snapshot_token",
+        "_memo",
+    )
+
     def __init__(self):
         """
         Initialize an empty directed weighted graph.
 
         Adjacency list format:
         {
-            A: [(B, 4), (C, 2)],
-            B: [(D, 5)],
-            C: [],
-            D: []
+            A: {B: 4, C: 2},
+            B: {D: 5},
+            C: {},
+            D: {}
         }
+
+        The reverse adjacency list (`in_adj`) mapping each vertex to its
+        incoming neighbors starts as None: it is built on first use and
+        kept in sync by operations from then on.
+
+        A symbol table assigns each vertex a dense integer id, used by
+        the CSR snapshot (`_csr`) that Dijkstra runs on. The snapshot and
+        completed Dijkstra runs, cached per source as (distance, previous),
+        are cleared by every mutating operation.
+
+        Every mutation also increments `_snapshot_token`; derived
+        properties memoized in `_memo` are recomputed only when the
+        token they were computed under is stale.
         """
         self.graph = {}
+        self.in_adj = None
+        self._index_of = {}
+        self._labels = []
+        self._csr = None
+        self._sparse = None
+        self._typed_arrays = None
+        self._dijkstra_cache = {}
+        self._snapshot_token = 0
+        self._memo = {}
+
+    def _ensure_in_adj(self):
+        """
+        Build the reverse adjacency list if it does not exist yet.
+
+        :return: Reverse adjacency list
+        """
+        if self.in_adj is None:
+            self.in_adj = operations.build_in_adj(self.graph)
+        return self.in_adj
+
+    def _invalidate(self):
+        """
+        Drop cached results derived from the adjacency list.
+
+        :return: None
+        """
+        self._csr = None
+        self._sparse = None
+        self._typed_arrays = None
+        self._dijkstra_cache.clear()
+        self._snapshot_token += 1
+
+    def _memoized(self, operation):
+        """
+        Return `operation(self.graph)`, reusing the value computed for
+        the current snapshot token if there is one.
+
+        :param operation: Read-only operation taking the adjacency list
+        :return: Result of the operation
+        """
+        entry = self._memo.get(operation)
+        if entry is not None and entry[0] == self._snapshot_token:
+            return entry[1]
+
+        value = operation(self.graph)
+        self._memo[operation] = (self._snapshot_token, value)
+        return value
+
+    def _freeze(self):
+        """
+        Return the weighted CSR snapshot, building it if needed.
+
+        :return: (indptr array, indices array, weights list)
+        """
+        if self._csr is None:
+            self._csr = operations.freeze(self.graph, self._labels, self._index_of)
+        return self._csr
+
+    def _label_paths(self, distance, previous):
+        """
+        Convert id-indexed Dijkstra results to vertex-keyed maps.
+
+        :param distance: Distance list indexed by vertex id
+        :param previous: Predecessor id list (-1 for no predecessor)
+        :return: Distance map and predecessor map
+        """
+        index_of = self._index_of
+        labels = self._labels
+        distances = {}
+        predecessors = {}
+        for vertex in self.graph:
+            index = index_of[vertex]
+            distances[vertex] = distance[index]
+            parent = previous[index]
+            predecessors[vertex] = labels[parent] if parent >= 0 else None
+
+        return distances, predecessors
 
     # ------------------------------------------------------------------
     # Core Operations
@@ -69,7 +182,9 @@ class Graph:
         :param vertex: Vertex identifier
         :return: None
         """
-        return operations.insert_vertex(self.graph, vertex)
+        self._invalidate()
+        operations.index_vertex(self._index_of, self._labels, vertex)
+        return operations.insert_vertex(self.graph, self.in_adj, vertex)
 
     def remove_vertex(self, vertex):
         """
@@ -78,7 +193,9 @@ class Graph:
         :param vertex: Vertex identifier
         :return: None
         """
-        return operations.remove_vertex(self.graph, vertex)
+        self._invalidate()
+        operations.unindex_vertex(self._index_of, self._labels, vertex)
+        return operations.remove_vertex(self.graph, self._ensure_in_adj(), vertex)
 
     def remove_edge(self, from_vertex, to_vertex):
         """
@@ -88,7 +205,8 @@ class Graph:
         :param to_vertex: Destination vertex
         :return: None
         """
-        return operations.remove_edge(self.graph, from_vertex, to_vertex)
+        self._invalidate()
+        return operations.remove_edge(self.graph, self.in_adj, from_vertex, to_vertex)
 
     # ------------------------------------------------------------------
     # Edge Operations (WEIGHTED, DIRECTED)
@@ -102,7 +220,10 @@ class Graph:
         :param weight: Edge weight
         :return: None
         """
-        return operations.insert_edge(self.graph, from_vertex, to_vertex, weight)
+        self._invalidate()
+        operations.index_vertex(self._index_of, self._labels, from_vertex)
+        operations.index_vertex(self._index_of, self._labels, to_vertex)
+        return operations.insert_edge(self.graph, self.in_adj, from_vertex, to_vertex, weight)
 
     def update_edge_weight(self, from_vertex, to_vertex, weight):
         """
@@ -113,7 +234,8 @@ class Graph:
         :param weight: New weight
         :return: None
         """
-        return operations.update_edge_weight(self.graph, from_vertex, to_vertex, weight)
+        self._invalidate()
+        return operations.update_edge_weight(self.graph, self.in_adj, from_vertex, to_vertex, weight)
 
     def get_edge_weight(self, from_vertex, to_vertex):
         """
@@ -125,6 +247,43 @@ class Graph:
         """
         return operations.get_edge_weight(self.graph, from_vertex, to_vertex)
 
+    # ------------------------------------------------------------------
+    # Graph Properties
+    # ------------------------------------------------------------------
+    def vertex_count(self):
+        """
+        Return the number of vertices.
+
+        :return: Vertex count
+        """
+        return operations.vertex_count(self.graph)
+
+    def edge_count(self):
+        """
+        Return the number of directed edges, cached until the next mutation.
+
+        :return: Edge count
+        """
+        return self._memoized(operations.edge_count)
+
+    def out_degrees(self):
+        """
+        Return the out-degree of every vertex, cached until the next mutation.
+
+        The returned map is shared and must not be modified by the caller.
+
+        :return: Mapping of vertex to number of outgoing edges
+        """
+        return self._memoized(operations.out_degrees)
+
+    def kahn_topological_sort(self):
+        """
+        Return a topological ordering of the vertices (Kahn’s algorithm).
+
+        :return: List of vertices in topological order
+        """
+        return operations.kahn_topological_sort(self.graph)
+
     # ------------------------------------------------------------------
     # Traversals (DIRECTION-AWARE, WEIGHT-AGNOSTIC)
     # ------------------------------------------------------------------
@@ -137,6 +296,15 @@ class Graph:
         """
         return operations.bfs_iterative(self.graph, start_vertex)
 
+    def bfs_iter(self, start_vertex):
+        """
+        Lazily yield vertices in BFS order following edge direction.
+
+        :param start_vertex: Starting vertex
+        :return: Iterator over vertices in BFS order
+        """
+        return operations.bfs_iter(self.graph, start_vertex)
+
     def bfs_recursive(self, start_vertex):
         """
         Perform recursive BFS following edge direction.
@@ -144,7 +312,7 @@ class Graph:
         :param start_vertex: Starting vertex
         :return: BFS traversal order
         """
-        return operations.bfs_recursive(self.graph, [start_vertex], [])
+        return operations.bfs_recursive(self.graph, [start_vertex], [], set())
 
     def dfs_iterative(self, start_vertex):
         """
@@ -155,6 +323,15 @@ class Graph:
         """
         return operations.dfs_iterative(self.graph, start_vertex)
 
+    def dfs_iter(self, start_vertex):
+        """
+        Lazily yield vertices in DFS order following edge direction.
+
+        :param start_vertex: Starting vertex
+        :return: Iterator over vertices in DFS order
+        """
+        return operations.dfs_iter(self.graph, start_vertex)
+
     def dfs_recursive(self, start_vertex):
         """
         Perform recursive DFS following edge direction.
@@ -162,7 +339,7 @@ class Graph:
         :param start_vertex: Starting vertex
         :return: DFS traversal order
         """
-        return operations.dfs_recursive(self.graph, start_vertex, [])
+        return operations.dfs_recursive(self.graph, start_vertex, [], set())
 
     # ------------------------------------------------------------------
     # Shortest Path / Weight Logic
@@ -176,24 +353,121 @@ class Graph:
         """
         return operations.get_path_cost(self.graph, path)
 
-    def shortest_path_dijkstra(self, source):
+    def shortest_path_dijkstra(self, source, target=None, decrease_key=False):
         """
         Compute shortest path distances from source using Dijkstra's algorithm.
 
+        Runs over the CSR snapshot on integer vertex ids and converts
+        the result back to vertex-keyed maps. Full runs (no target) are
+        cached per source, and a cached run also answers later calls
+        with a target. The cached maps are returned as-is and must not
+        be modified by the caller.
+
+        With `decrease_key` set, the uncached indexed-heap variant is
+        run instead, for comparison against the binary-heap search.
+
         :param source: Source vertex
+        :param target: Optional vertex at which to stop early
+        :param decrease_key: Use an indexed heap with decrease-key
         :return: Distance map and predecessor map
         """
-        return operations.shortest_path_dijkstra(self.graph, source)
+        if decrease_key:
+            return operations.shortest_path_dijkstra(self.graph, source, target, True)
+
+        cached = self._dijkstra_cache.get(source)
+        if cached is not None:
+            return cached
+
+        index_of = self._index_of
+        if source not in index_of:
+            return operations.shortest_path_dijkstra(self.graph, source, target)
+
+        indptr, indices, weights = self._freeze()
+        distance, previous = operations.shortest_path_dijkstra_csr(
+            indptr, indices, weights, index_of[source], index_of.get(target)
+        )
+
+        result = self._label_paths(distance, previous)
+        if target is None:
+            self._dijkstra_cache[source] = result
+        return result
+
+    def shortest_path_dijkstra_fast(self, source):
+        """
+        Compute shortest path distances from source in compiled code.
+
+        Uses SciPy's `csgraph.dijkstra` on a sparse matrix built from the
+        CSR snapshot and cached until the next mutation; distances are
+        then floats. Falls back to `shortest_path_dijkstra` when SciPy is
+        not installed.
+
+        :param source: Source vertex
+        :return: Distance map and predecessor map
+        """
+        if source not in self._index_of:
+            return self.shortest_path_dijkstra(source)
+
+        if self._sparse is None:
+            self._sparse = operations.to_sparse_matrix(*self._freeze())
+        if self._sparse is None:
+            return self.shortest_path_dijkstra(source)
+
+        distance, previous = operations.shortest_path_dijkstra_sparse(
+            self._sparse, self._index_of[source]
+        )
+        return self._label_paths(distance, previous)
+
+    def shortest_path_dijkstra_jit(self, source):
+        """
+        Compute shortest path distances from source with a Numba kernel.
+
+        Runs a compiled Dijkstra over typed copies of the CSR snapshot,
+        cached until the next mutation; distances are then floats. Pays
+        off for many queries on a static graph, since the first call
+        compiles the kernel. Falls back to `shortest_path_dijkstra` when
+        Numba is not installed.
+
+        :param source: Source vertex
+        :return: Distance map and predecessor map
+        """
+        if source not in self._index_of:
+            return self.shortest_path_dijkstra(source)
+
+        if self._typed_arrays is None:
+            self._typed_arrays = operations.to_typed_arrays(*self._freeze())
+        if self._typed_arrays is None:
+            return self.shortest_path_dijkstra(source)
+
+        distance, previous = operations.shortest_path_dijkstra_jit(
+            self._typed_arrays, self._index_of[source]
+        )
+        return self._label_paths(distance, previous)
+
+    def shortest_path_dial(self, source):
+        """
+        Compute shortest path distances from source using Dial's bucket queue.
+
+        Faster than Dijkstra's heap when weights are small non-negative
+        integers; other weights fall back to Dijkstra.
+
+        :param source: Source vertex
+        :return: Distance map and predecessor map
+        """
+        return operations.shortest_path_dial(self.graph, source)
 
     def shortest_path_to(self, source, destination):
         """
         Compute shortest directed path from source to destination.
 
+        Runs a full Dijkstra from `source` on the first query and reuses
+        the cached predecessor map for later destinations.
+
         :param source: Source vertex
         :param destination: Destination vertex
         :return: Shortest path as list of vertices
         """
-        return operations.shortest_path_to(self.graph, source, destination)
+        _, previous = self.shortest_path_dijkstra(source)
+        return operations.shortest_path_to(self.graph, source, destination, previous)
 
     # ------------------------------------------------------------------
     # Utilities
@@ -98,6 +98,7 @@ def main() -> None:
     print(f"BFS (Recursive) from A : {graph.bfs_recursive('A')}")
     print(f"DFS (Iterative) from A : {graph.dfs_iterative('A')}")
     print(f"DFS (Recursive) from A : {graph.dfs_recursive('A')}")
+    print(f"BFS (Hybrid) from A    : {graph.bfs_direction_optimizing('A')}")
     print("-" * 60)
 
     print(" Graph Properties ".center(60, "-"))
@@ -114,6 +115,7 @@ def main() -> None:
     print(" Shortest Path (Dijkstra) ".center(60, "-"))
     distance, previous = graph.shortest_path_dijkstra("A")
     print(f"Distances from A : {distance}")
+    print(f"Distances (Dial) : {graph.shortest_path_dial('A')[0]}")
 
     destination = "D"
     shortest_path = graph.shortest_path_to("A", destination)
@@ -21,36 +21,92 @@ Responsibilities
 Design Notes
 ------------------------------------------------------------------------------------
 - All functions operate on adjacency-list dictionary (`Graph.graph`)
-- Adjacency list format: vertex -> List[(neighbor, weight)]
+- Adjacency list format: vertex -> Dict[neighbor, weight]
+- Each edge is stored in both endpoints' dicts; insert, update, lookup
+  and removal are O(1) dict operations
 - Traversals ignore weights
+- `bfs_direction_optimizing` switches between top-down and bottom-up
+  levels, which cuts edge checks on small-diameter graphs
+- Traversals track visited vertices in a set and keep the output order
+  in a separate list; on graphs whose vertices are dense non-negative
+  integers they use a bytearray mask indexed by vertex instead
+- Dijkstra uses Dial's bucket queue instead of a heap when every weight
+  is a small non-negative integer
+- SciPy is an optional dependency: when it is installed,
+  `shortest_path_dijkstra_csr` and `get_connected_components_csr` run in
+  compiled code on a CSR sparse matrix built from the adjacency list;
+  the `to_csr` snapshot is built only once that path is taken
+- Numba is an optional dependency: when it is installed,
+  `shortest_path_dijkstra` runs a compiled kernel over the same CSR
+  arrays for large graphs with numeric weights
+- Functions that build derived structures (CSR arrays, typed arrays)
+  accept an optional `cache` dict owned by the Graph schema; entries
+  are built on first use and the schema clears the dict on mutation
 - Graph schema is treated as a data container only
 ------------------------------------------------------------------------------------
 """
 
 import heapq
+import sys
+from array import array
 from collections import deque
-from typing import Any, List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Set, TextIO, Tuple, Optional
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components as csgraph_connected_components
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+except ImportError:  # SciPy is optional
+    csr_matrix = None
+    csgraph_connected_components = None
+    csgraph_dijkstra = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional
+    np = None
+    njit = None
+
+# Below this many vertices, building the CSR arrays costs more than
+# the pure-Python search they replace
+_CSR_MIN_VERTICES = 1024
+
+# Shared read-only stand-in for a missing vertex's neighbor dict, so a
+# lookup is one `graph.get` instead of a membership test plus indexing
+_EMPTY: Dict[Any, Any] = {}
+
+# Direction-optimizing BFS heuristic (Beamer et al.): switch to pulling
+# once the frontier's edges exceed 1/_PULL_ALPHA of the unexplored edges,
+# and back to push once it holds fewer than 1/_PUSH_BETA of all vertices
+_PULL_ALPHA = 14
+_PUSH_BETA = 24
+
+# Largest edge weight for which Dijkstra switches to Dial's bucket queue;
+# the queue cycles through max_weight + 1 buckets, so larger weights mean
+# more empty buckets to step over
+_DIAL_MAX_WEIGHT = 256
 
 
 # --------------------------------------------------------------------------
 # Core Operations
 # --------------------------------------------------------------------------
-def insert_vertex(graph: Dict[Any, List[Tuple[Any, Any]]], vertex: Any) -> None:
+def insert_vertex(graph: Dict[Any, Dict[Any, Any]], vertex: Any) -> None:
     """
     Add a vertex to the graph if it does not already exist.
 
     :param graph: Adjacency list representation of the graph
-    :type graph: Dict[Any, List[Tuple[Any, Any]]]
+    :type graph: Dict[Any, Dict[Any, Any]]
     :param vertex: Vertex identifier
     :type vertex: Any
     :return: None
     """
     if vertex not in graph:
-        graph[vertex] = []
+        graph[vertex] = {}
 
 
 def insert_edge(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         from_vertex: Any,
         to_vertex: Any,
         weight: Any
@@ -64,28 +120,15 @@ def insert_edge(
     :param weight: Weight associated with the edge
     :return: None
     """
-    if from_vertex not in graph:
-        graph[from_vertex] = []
+    from_neighbors = graph.setdefault(from_vertex, {})
+    to_neighbors = graph.setdefault(to_vertex, {})
 
-    if to_vertex not in graph:
-        graph[to_vertex] = []
-
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            if wgt == weight:
-                return
-            graph[from_vertex].remove((vtx, wgt))
-            graph[to_vertex].remove((from_vertex, wgt))
-            graph[from_vertex].append((to_vertex, weight))
-            graph[to_vertex].append((from_vertex, weight))
-            return
-
-    graph[from_vertex].append((to_vertex, weight))
-    graph[to_vertex].append((from_vertex, weight))
+    from_neighbors[to_vertex] = weight
+    to_neighbors[from_vertex] = weight
 
 
 def update_edge_weight(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         from_vertex: Any,
         to_vertex: Any,
         weight: Any
@@ -102,22 +145,12 @@ def update_edge_weight(
     if from_vertex not in graph or to_vertex not in graph:
         return
 
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            if wgt == weight:
-                return
-            graph[from_vertex].remove((vtx, wgt))
-            graph[to_vertex].remove((from_vertex, wgt))
-            graph[from_vertex].append((to_vertex, weight))
-            graph[to_vertex].append((from_vertex, weight))
-            return
-
-    graph[from_vertex].append((to_vertex, weight))
-    graph[to_vertex].append((from_vertex, weight))
+    graph[from_vertex][to_vertex] = weight
+    graph[to_vertex][from_vertex] = weight
 
 
 def get_edge_weight(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         from_vertex: Any,
         to_vertex: Any
 ) -> Optional[Any]:
@@ -129,18 +162,11 @@ def get_edge_weight(
     :param to_vertex: Other endpoint of the edge
     :return: Edge weight if present, otherwise None
     """
-    if from_vertex not in graph or to_vertex not in graph:
-        return None
-
-    for vtx, wgt in graph[from_vertex]:
-        if vtx == to_vertex:
-            return wgt
-
-    return None
+    return graph.get(from_vertex, _EMPTY).get(to_vertex)
 
 
 def remove_vertex(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         vertex: Any
 ) -> None:
     """
@@ -153,18 +179,14 @@ def remove_vertex(
     if vertex not in graph:
         return
 
-    neighbors = list(graph[vertex])
-
-    for neighbor, _ in neighbors:
-        graph[neighbor] = [
-            (n, w) for n, w in graph[neighbor] if n != vertex
-        ]
-
-    del graph[vertex]
+    # Only the vertex's own neighbors hold a back-reference to it
+    for neighbor in graph.pop(vertex):
+        if neighbor != vertex:
+            del graph[neighbor][vertex]
 
 
 def remove_edge(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         from_vertex: Any,
         to_vertex: Any
 ) -> None:
@@ -176,135 +198,254 @@ def remove_edge(
     :param to_vertex: Other endpoint
     :return: None
     """
-    if from_vertex in graph:
-        graph[from_vertex] = [
-            (n, w) for n, w in graph[from_vertex] if n != to_vertex
-        ]
+    if to_vertex not in graph.get(from_vertex, _EMPTY):
+        return
 
-    if to_vertex in graph:
-        graph[to_vertex] = [
-            (n, w) for n, w in graph[to_vertex] if n != from_vertex
-        ]
+    # Edges are stored symmetrically, so the reverse entry exists too;
+    # for a self-loop the first delete already removed it
+    del graph[from_vertex][to_vertex]
+    graph[to_vertex].pop(from_vertex, None)
 
 
 # ----------------------------------------------------------------------
 # BFS Traversal (weight-agnostic)
 # ----------------------------------------------------------------------
 def bfs_iterative(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
-        start_vertex: Any
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any,
+        cache: Optional[Dict[str, Any]] = None
 ) -> List[Any]:
     """
     Perform iterative Breadth-First Search (BFS).
 
     :param graph: Adjacency list representation
     :param start_vertex: Starting vertex
+    :param cache: Graph-owned dict of derived structures
     :return: BFS traversal order
     """
-    visited = []
-    neighbor_queue = deque()
-    current = start_vertex
-
-    while True:
-        if current not in visited:
-            visited.append(current)
-
-        for neighbor, _ in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_queue:
-                neighbor_queue.append(neighbor)
+    mask = _visited_mask(graph, start_vertex, cache)
+    if mask is not None:
+        return _bfs_iterative_dense(graph, start_vertex, mask)
 
-        if not neighbor_queue:
-            break
+    visited = {start_vertex}
+    order = [start_vertex]
+    neighbor_queue = deque([start_vertex])
 
+    # Vertices are marked visited when enqueued, so the queue never
+    # holds duplicates and needs no membership scan
+    while neighbor_queue:
         current = neighbor_queue.popleft()
 
-    return visited
+        for neighbor in graph[current]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                order.append(neighbor)
+                neighbor_queue.append(neighbor)
+
+    return order
 
 
 def bfs_recursive(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         level_vertices: List[Any],
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive BFS (level-based).
 
+    Implemented as a level-by-level loop, so deep graphs do not
+    hit Python's recursion limit. Vertices are marked on discovery,
+    so each level list holds every vertex at most once.
+
     :param graph: Adjacency list representation
     :param level_vertices: Current BFS frontier
-    :param visited: Visited vertices
+    :param visited: Visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: BFS traversal order
     """
-    if not level_vertices:
-        return visited
-
-    next_level = []
+    if visited_set is None:
+        visited_set = set(visited)
 
+    level = []
     for vertex in level_vertices:
-        if vertex not in visited:
-            visited.append(vertex)
+        if vertex not in visited_set:
+            visited_set.add(vertex)
+            level.append(vertex)
 
-        for neighbor, _ in graph[vertex]:
-            if neighbor not in visited:
-                next_level.append(neighbor)
+    # Each pass of the loop processes one level, replacing the
+    # per-level recursive call
+    while level:
+        visited.extend(level)
+        next_level = []
 
-    return bfs_recursive(graph, next_level, visited)
+        for vertex in level:
+            for neighbor in graph[vertex]:
+                if neighbor not in visited_set:
+                    visited_set.add(neighbor)
+                    next_level.append(neighbor)
+
+        level = next_level
+
+    return visited
+
+
+def bfs_direction_optimizing(
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any
+) -> List[Any]:
+    """
+    Perform level-synchronous BFS that switches between top-down and
+    bottom-up expansion.
+
+    Top-down (push) levels scan each frontier vertex's neighbors, as
+    `bfs_iterative` does. When the frontier's edges exceed 1/_PULL_ALPHA
+    of the edges still unexplored, the level runs bottom-up (pull)
+    instead: each unvisited vertex scans its own neighbors and stops at
+    the first one in the frontier. Pulling continues until the frontier
+    shrinks below 1/_PUSH_BETA of all vertices.
+
+    The output lists vertices level by level, so every vertex appears
+    after all vertices closer to the start. Push levels keep the
+    `bfs_iterative` order; pull levels list their vertices in adjacency
+    list order.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :return: BFS traversal order
+    """
+    vertex_count = len(graph)
+    visited = {start_vertex}
+    order = [start_vertex]
+    frontier = [start_vertex]
+    frontier_edges = len(graph[start_vertex])
+    unexplored_edges = sum(map(len, graph.values())) - frontier_edges
+    unvisited = None
+    pulling = False
+
+    while frontier:
+        if pulling:
+            pulling = len(frontier) * _PUSH_BETA >= vertex_count
+        else:
+            pulling = frontier_edges * _PULL_ALPHA > unexplored_edges
+
+        next_frontier = []
+
+        if pulling:
+            # Built on the first pull level only, then filtered in place
+            if unvisited is None:
+                unvisited = [vertex for vertex in graph if vertex not in visited]
+            else:
+                unvisited = [vertex for vertex in unvisited if vertex not in visited]
+
+            in_frontier = set(frontier)
+            for vertex in unvisited:
+                for neighbor in graph[vertex]:
+                    if neighbor in in_frontier:
+                        next_frontier.append(vertex)
+                        break
+
+            visited.update(next_frontier)
+        else:
+            for current in frontier:
+                for neighbor in graph[current]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+
+        order.extend(next_frontier)
+        frontier = next_frontier
+        frontier_edges = sum([len(graph[vertex]) for vertex in frontier])
+        unexplored_edges -= frontier_edges
+
+    return order
 
 
 # ----------------------------------------------------------------------
 # DFS Traversals (weight-agnostic)
 # ----------------------------------------------------------------------
 def dfs_iterative(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
-        start_vertex: Any
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any,
+        cache: Optional[Dict[str, Any]] = None
 ) -> List[Any]:
     """
     Perform iterative Depth-First Search (DFS).
 
     :param graph: Adjacency list representation
     :param start_vertex: Starting vertex
+    :param cache: Graph-owned dict of derived structures
     :return: DFS traversal order
     """
-    visited = []
+    mask = _visited_mask(graph, start_vertex, cache)
+    if mask is not None:
+        return _dfs_iterative_dense(graph, start_vertex, mask)
+
+    visited = set()
+    order = []
     neighbor_stack = []
+    stacked = set()
     current = start_vertex
 
+    # `stacked` mirrors `neighbor_stack`, so a vertex already waiting on
+    # the stack is not pushed again
     while True:
         if current not in visited:
-            visited.append(current)
+            visited.add(current)
+            order.append(current)
 
-        for neighbor, _ in graph[current]:
-            if neighbor not in visited and neighbor not in neighbor_stack:
+        for neighbor in graph[current]:
+            if neighbor not in visited and neighbor not in stacked:
+                stacked.add(neighbor)
                 neighbor_stack.append(neighbor)
 
         if not neighbor_stack:
             break
 
         current = neighbor_stack.pop()
+        stacked.discard(current)
 
-    return visited
+    return order
 
 
 def dfs_recursive(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         vertex: Any,
-        visited: List[Any]
+        visited: List[Any],
+        visited_set: Optional[Set[Any]] = None
 ) -> List[Any]:
     """
     Perform recursive Depth-First Search (DFS).
 
+    Implemented with an explicit stack of neighbor iterators that mirrors
+    the recursive call stack, preserving recursive visiting order
+    without Python frames or recursion-depth limits.
+
     :param graph: Adjacency list representation
     :param vertex: Current vertex
-    :param visited: Visited vertices
+    :param visited: Visited vertices (traversal order)
+    :param visited_set: Set mirror of `visited` for O(1) membership checks
     :return: DFS traversal order
     """
+    if visited_set is None:
+        visited_set = set(visited)
+
     if vertex is None:
         return visited
 
+    visited_set.add(vertex)
     visited.append(vertex)
+    stack = [iter(graph[vertex])]
 
-    for neighbor, _ in graph[vertex]:
-        if neighbor not in visited:
-            dfs_recursive(graph, neighbor, visited)
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited_set:
+                visited_set.add(neighbor)
+                visited.append(neighbor)
+                stack.append(iter(graph[neighbor]))
+                break
+        else:
+            stack.pop()
 
     return visited
 
@@ -313,47 +454,56 @@ def dfs_recursive(
 # Graph Properties
 # ----------------------------------------------------------------------
 def get_connected_components(
-        graph: Dict[Any, List[Tuple[Any, Any]]]
+        graph: Dict[Any, Dict[Any, Any]]
 ) -> int:
     """
     Compute number of connected components.
 
+    Uses a disjoint-set (Union-Find) forest with path compression and
+    union by rank in a single sweep over the edges: every successful
+    union merges two components, so the count is the number of
+    vertices minus the number of merges.
+
     :param graph: Adjacency list representation
     :return: Count of connected components
     """
-    covered = list(graph.keys())
-    connected_count = 0
+    parent = {vertex: vertex for vertex in graph}
+    rank = dict.fromkeys(graph, 0)
+    merges = 0
 
-    while covered:
-        visited = bfs_recursive(graph, [covered[0]], [])
-        for vertex in visited:
-            covered.remove(vertex)
-        connected_count += 1
+    for vertex, neighbors in graph.items():
+        for neighbor in neighbors:
+            if _union(parent, rank, vertex, neighbor):
+                merges += 1
 
-    return connected_count
+    return len(graph) - merges
 
 
 def detect_cycle(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
-        start_vertex: Any
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any,
+        cache: Optional[Dict[str, Any]] = None
 ) -> bool:
     """
     Detect cycle in undirected graph using DFS with parent tracking.
 
     :param graph: Adjacency list representation
     :param start_vertex: Starting vertex
+    :param cache: Graph-owned dict of derived structures
     :return: True if cycle exists
     """
-    visited = []
+    mask = _visited_mask(graph, start_vertex, cache)
+    if mask is not None:
+        return _detect_cycle_dense(graph, start_vertex, mask)
+
+    visited = set()
     stack = [(start_vertex, None)]
 
     while stack:
         current, parent = stack.pop()
+        visited.add(current)
 
-        if current not in visited:
-            visited.append(current)
-
-        for neighbor, _ in graph[current]:
+        for neighbor in graph[current]:
             if neighbor not in visited:
                 stack.append((neighbor, current))
             elif neighbor != parent:
@@ -366,7 +516,7 @@ def detect_cycle(
 # Weight-Aware Algorithms
 # ----------------------------------------------------------------------
 def get_path_cost(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         path: List[Any]
 ) -> Optional[Any]:
     """
@@ -378,11 +528,9 @@ def get_path_cost(
     """
     total_cost = 0
 
-    for index in range(len(path) - 1):
-        from_vertex = path[index]
-        to_vertex = path[index + 1]
-
-        weight = get_edge_weight(graph, from_vertex, to_vertex)
+    # Direct adjacency lookups: one hash probe per hop, no helper call
+    for from_vertex, to_vertex in zip(path, path[1:]):
+        weight = graph.get(from_vertex, _EMPTY).get(to_vertex)
         if weight is None:
             return None
 
@@ -391,44 +539,638 @@ def get_path_cost(
     return total_cost
 
 
+def _sift_up(heap: List[Any], position: Dict[Any, int], key: Dict[Any, Any], index: int) -> None:
+    """
+    Move the vertex at `index` up an indexed min-heap until ordered.
+
+    :param heap: Heap of vertices
+    :param position: Vertex → index in `heap`
+    :param key: Vertex → priority
+    :param index: Index of the vertex to move
+    :return: None
+    """
+    vertex = heap[index]
+    vertex_key = key[vertex]
+
+    while index > 0:
+        parent_index = (index - 1) >> 1
+        parent = heap[parent_index]
+        if key[parent] <= vertex_key:
+            break
+        heap[index] = parent
+        position[parent] = index
+        index = parent_index
+
+    heap[index] = vertex
+    position[vertex] = index
+
+
+def _sift_down(heap: List[Any], position: Dict[Any, int], key: Dict[Any, Any], index: int) -> None:
+    """
+    Move the vertex at `index` down an indexed min-heap until ordered.
+
+    :param heap: Heap of vertices
+    :param position: Vertex → index in `heap`
+    :param key: Vertex → priority
+    :param index: Index of the vertex to move
+    :return: None
+    """
+    size = len(heap)
+    vertex = heap[index]
+    vertex_key = key[vertex]
+
+    while True:
+        child_index = 2 * index + 1
+        if child_index >= size:
+            break
+        if child_index + 1 < size and key[heap[child_index + 1]] < key[heap[child_index]]:
+            child_index += 1
+        child = heap[child_index]
+        if key[child] >= vertex_key:
+            break
+        heap[index] = child
+        position[child] = index
+        index = child_index
+
+    heap[index] = vertex
+    position[vertex] = index
+
+
+def _shortest_path_dijkstra_indexed(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        target: Optional[Any]
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Dijkstra's algorithm on an indexed binary heap with decrease-key.
+
+    Each vertex is in the heap at most once; an improved distance moves
+    its existing entry up instead of pushing a duplicate, so the heap
+    never exceeds V entries and no stale entries are popped.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :param target: Optional vertex at which to stop early
+    :return: Distance map and predecessor map
+    """
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
+
+    distance[source] = 0
+    heap = [source]
+    position = {source: 0}
+
+    while heap:
+        current_vertex = heap[0]
+        last = heap.pop()
+        del position[current_vertex]
+        if heap:
+            heap[0] = last
+            _sift_down(heap, position, distance, 0)
+
+        if current_vertex == target:
+            break
+
+        current_distance = distance[current_vertex]
+        for neighbor, weight in graph[current_vertex].items():
+            alt_distance = current_distance + weight
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current_vertex
+
+                index = position.get(neighbor)
+                if index is None:
+                    index = len(heap)
+                    heap.append(neighbor)
+                _sift_up(heap, position, distance, index)
+
+    return distance, previous
+
+
 def shortest_path_dijkstra(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
-        source: Any
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        target: Optional[Any] = None,
+        decrease_key: bool = False,
+        cache: Optional[Dict[str, Any]] = None
 ) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
     """
     Compute shortest paths from source using Dijkstra's algorithm.
 
+    Large graphs (at least `_CSR_MIN_VERTICES` vertices) with numeric
+    weights are handed to a Numba-compiled kernel when Numba is
+    installed; the result has the same shape and, for integer weights,
+    the same integer distances. Otherwise, when every weight is a
+    non-negative integer no larger than `_DIAL_MAX_WEIGHT`, Dial's
+    bucket queue replaces the heap (see `shortest_path_dial`), and
+    graphs whose vertices are dense non-negative integers use flat
+    lists indexed by vertex instead of dicts for distances and
+    predecessors.
+
+    When `target` is given the search stops as soon as the target is
+    popped, since its distance is final at that point. Only the target
+    and vertices popped before it are then guaranteed to hold final
+    distances and predecessors. The compiled kernel ignores `target`
+    and always settles every vertex. Checking whether Dial applies
+    scans every weight, so without a `cache` to keep the answer a
+    target query skips that check rather than undo its early exit.
+
+    With `decrease_key` set, an indexed binary heap is used instead:
+    each vertex has at most one entry, which is moved up in place when
+    its distance improves, keeping the heap at most V entries. This
+    saves memory on dense graphs with many relaxations.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :param target: Optional vertex at which to stop early
+    :param decrease_key: Use the indexed heap with decrease-key
+    :param cache: Graph-owned dict of derived structures, reused across
+        calls until the graph changes
+    :return: Distance map and predecessor map
+    """
+    if decrease_key:
+        return _shortest_path_dijkstra_indexed(graph, source, target)
+
+    if _dijkstra_jit is not None and len(graph) >= _CSR_MIN_VERTICES and source in graph:
+        csr = _cached(cache, "csr", to_csr, graph)
+        typed_arrays = _cached(cache, "typed_arrays", to_typed_arrays, csr)
+        if typed_arrays is not None:
+            return _shortest_path_dijkstra_jit(csr, typed_arrays, source)
+
+    if source in graph and (target is None or cache is not None):
+        max_weight = _cached(cache, "max_int_weight", _small_int_max_weight, graph)
+        if max_weight is not None and max_weight <= _DIAL_MAX_WEIGHT:
+            return _shortest_path_dial(graph, source, target, max_weight)
+
+    if source in graph:
+        bound = _cached(cache, "dense_bound", _dense_vertex_bound, graph)
+        if bound:
+            return _shortest_path_dijkstra_dense(graph, source, target, bound)
+
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
+
+    distance[source] = 0
+    priority_queue = [(0, source)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while priority_queue:
+        current_distance, current_vertex = heappop(priority_queue)
+
+        # Stale entry: a shorter distance was pushed after this one
+        if current_distance > distance[current_vertex]:
+            continue
+
+        if current_vertex == target:
+            break
+
+        for neighbor, weight in graph[current_vertex].items():
+            alt_distance = current_distance + weight
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current_vertex
+                heappush(priority_queue, (alt_distance, neighbor))
+
+    return distance, previous
+
+
+def _dense_vertex_bound(graph: Dict[Any, Dict[Any, Any]]) -> int:
+    """
+    Size of a list indexed directly by vertex, if the vertices allow it.
+
+    Vertices qualify when all are non-negative ints below 2 * V.
+
+    :param graph: Adjacency list representation
+    :return: Largest vertex + 1, or 0 if the vertices do not qualify
+    """
+    if not graph:
+        return 0
+
+    for vertex in graph:
+        if type(vertex) is not int:
+            return 0
+
+    largest = max(graph)
+    return largest + 1 if min(graph) >= 0 and largest < 2 * len(graph) else 0
+
+
+def _shortest_path_dijkstra_dense(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: int,
+        target: Optional[Any] = None,
+        size: Optional[int] = None
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Dijkstra for graphs whose vertices are dense non-negative integers.
+
+    Distances and predecessors live in flat containers indexed by the
+    vertex itself, so relaxation is an indexed load/store rather than a
+    dict probe, and heap entries are (distance, int) pairs. Results are
+    converted back to vertex-keyed maps on return.
+
     :param graph: Adjacency list representation
     :param source: Source vertex
+    :param target: Optional vertex at which to stop early
+    :param size: Largest vertex + 1 (from `_dense_vertex_bound`); computed if not given
     :return: Distance map and predecessor map
     """
-    distance = {vertex: float("inf") for vertex in graph}
-    previous = {vertex: None for vertex in graph}
+    if size is None:
+        size = max(graph) + 1
+    distance = [float("inf")] * size
+    previous = array("l", [-1]) * size
 
     distance[source] = 0
     priority_queue = [(0, source)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
 
     while priority_queue:
-        current_distance, current_vertex = heapq.heappop(priority_queue)
+        current_distance, current_vertex = heappop(priority_queue)
 
+        # Stale entry: a shorter distance was pushed after this one
         if current_distance > distance[current_vertex]:
             continue
 
-        for neighbor, weight in graph[current_vertex]:
-            alt_distance = distance[current_vertex] + weight
+        if current_vertex == target:
+            break
+
+        for neighbor, weight in graph[current_vertex].items():
+            alt_distance = current_distance + weight
 
             if alt_distance < distance[neighbor]:
                 distance[neighbor] = alt_distance
                 previous[neighbor] = current_vertex
-                heapq.heappush(priority_queue, (alt_distance, neighbor))
+                heappush(priority_queue, (alt_distance, neighbor))
+
+    return (
+        {vertex: distance[vertex] for vertex in graph},
+        {vertex: previous[vertex] if previous[vertex] >= 0 else None for vertex in graph},
+    )
+
+
+def to_csr(
+        graph: Dict[Any, Dict[Any, Any]]
+) -> Tuple[Dict[Any, int], List[Any], array, array, List[Any]]:
+    """
+    Build a weighted Compressed Sparse Row (CSR) view of the graph.
+
+    Vertices are numbered 0..V-1 in insertion order. The neighbors of
+    vertex `i` are `indices[indptr[i]:indptr[i + 1]]`, with matching
+    weights in the same slice of `weights`. Both directions of each
+    undirected edge are included.
+
+    :param graph: Adjacency list representation
+    :return: (vertex → index map, index → vertex list, indptr, indices, weights)
+    """
+    labels = list(graph)
+    index_of = {vertex: index for index, vertex in enumerate(labels)}
+    indptr = array("i", [0])
+    indices = array("i")
+    weights = []
+
+    for neighbors in graph.values():
+        indices.extend([index_of[neighbor] for neighbor in neighbors])
+        weights.extend(neighbors.values())
+        indptr.append(len(indices))
+
+    return index_of, labels, indptr, indices, weights
+
+
+def shortest_path_dijkstra_csr(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        cache: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Compute shortest paths from source with SciPy's compiled Dijkstra.
+
+    Converts the adjacency list to a `scipy.sparse.csr_matrix` and runs
+    `scipy.sparse.csgraph.dijkstra` on it; distances are then floats.
+    Falls back to `shortest_path_dijkstra` when SciPy is not installed,
+    for graphs too small for the conversion to pay off, and for a
+    source that is not in the graph.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :param cache: Graph-owned dict of derived structures; the `to_csr`
+        snapshot is reused from it
+    :return: Distance map and predecessor map
+    """
+    if csr_matrix is None or len(graph) < _CSR_MIN_VERTICES or source not in graph:
+        return shortest_path_dijkstra(graph, source, cache=cache)
+
+    index_of, labels, indptr, indices, weights = _cached(cache, "csr", to_csr, graph)
+    vertex_count = len(labels)
+    matrix = csr_matrix((weights, indices, indptr), shape=(vertex_count, vertex_count))
+    distances, predecessors = csgraph_dijkstra(
+        matrix, directed=True, indices=index_of[source], return_predecessors=True
+    )
+
+    distance = dict(zip(labels, distances.tolist()))
+    previous = {
+        vertex: labels[parent] if parent >= 0 else None
+        for vertex, parent in zip(labels, predecessors.tolist())
+    }
+    return distance, previous
+
+
+def get_connected_components_csr(
+        graph: Dict[Any, Dict[Any, Any]],
+        cache: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Compute number of connected components with SciPy's compiled search.
+
+    Runs `scipy.sparse.csgraph.connected_components` on an unweighted
+    CSR matrix of the graph. Falls back to `get_connected_components`
+    when SciPy is not installed and for graphs too small for the
+    conversion to pay off.
+
+    :param graph: Adjacency list representation
+    :param cache: Graph-owned dict of derived structures; the `to_csr`
+        snapshot is reused from it
+    :return: Count of connected components
+    """
+    if csr_matrix is None or len(graph) < _CSR_MIN_VERTICES:
+        return get_connected_components(graph)
+
+    _, labels, indptr, indices, _ = _cached(cache, "csr", to_csr, graph)
+    vertex_count = len(labels)
+
+    # Only connectivity matters, so every stored edge gets weight 1
+    matrix = csr_matrix(([1] * len(indices), indices, indptr), shape=(vertex_count, vertex_count))
+    return int(csgraph_connected_components(matrix, directed=False, return_labels=False))
+
+
+def _dijkstra_kernel(
+        indptr: Any,
+        indices: Any,
+        weights: Any,
+        source: int,
+        distance: Any,
+        previous: Any,
+        heap_keys: Any,
+        heap_ids: Any
+) -> None:
+    """
+    Dijkstra over CSR arrays with a hand-written binary heap.
+
+    Written for Numba's nopython mode: it only indexes flat buffers
+    allocated by the caller, and keeps the heap as two parallel arrays
+    (distance keys and vertex ids) instead of using `heapq`. Improved
+    distances push a new entry and stale entries are skipped when
+    popped, so the heap buffers need room for E + 1 entries.
+
+    :param indptr: CSR row pointer array
+    :param indices: CSR neighbor index array
+    :param weights: Edge weights aligned with `indices`
+    :param source: Index of the source vertex
+    :param distance: Output distances, pre-filled with infinity
+    :param previous: Output predecessor indices, pre-filled with -1
+    :param heap_keys: Scratch buffer for heap distances
+    :param heap_ids: Scratch buffer for heap vertex indices
+    :return: None
+    """
+    distance[source] = 0.0
+    heap_keys[0] = 0.0
+    heap_ids[0] = source
+    size = 1
+
+    while size > 0:
+        current_distance = heap_keys[0]
+        current = heap_ids[0]
+        size -= 1
+
+        # Move the last entry to the root and sift it down
+        if size > 0:
+            key = heap_keys[size]
+            vertex = heap_ids[size]
+            position = 0
+            while True:
+                child = 2 * position + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                    child += 1
+                if heap_keys[child] >= key:
+                    break
+                heap_keys[position] = heap_keys[child]
+                heap_ids[position] = heap_ids[child]
+                position = child
+            heap_keys[position] = key
+            heap_ids[position] = vertex
+
+        if current_distance > distance[current]:
+            continue
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            alt_distance = current_distance + weights[edge]
+
+            if alt_distance < distance[neighbor]:
+                distance[neighbor] = alt_distance
+                previous[neighbor] = current
+
+                # Append the new entry and sift it up
+                position = size
+                size += 1
+                while position > 0:
+                    parent = (position - 1) // 2
+                    if heap_keys[parent] <= alt_distance:
+                        break
+                    heap_keys[position] = heap_keys[parent]
+                    heap_ids[position] = heap_ids[parent]
+                    position = parent
+                heap_keys[position] = alt_distance
+                heap_ids[position] = neighbor
+
+
+_dijkstra_jit = njit(cache=True)(_dijkstra_kernel) if njit is not None else None
+
+
+def to_typed_arrays(
+        csr: Tuple[Dict[Any, int], List[Any], array, array, List[Any]]
+) -> Optional[Tuple[Any, Any, Any, bool]]:
+    """
+    Copy a weighted CSR snapshot into NumPy arrays for the compiled kernel.
+
+    :param csr: Snapshot from `to_csr(graph)`
+    :return: (indptr, indices, weights, integral) with int64/int64/float64
+        arrays and whether every weight is an int, or None if Numba is
+        not installed or any weight is not an int or float
+    """
+    if _dijkstra_jit is None:
+        return None
+
+    _, _, indptr, indices, weights = csr
+
+    # Classify the weights once per distinct type rather than per edge;
+    # map/set run the scan in C
+    weight_types = set(map(type, weights))
+    for weight_type in weight_types:
+        if not issubclass(weight_type, (int, float)):
+            return None
+    integral = all(issubclass(weight_type, int) for weight_type in weight_types)
+
+    return (
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+        integral,
+    )
+
+
+def _shortest_path_dijkstra_jit(
+        csr: Tuple[Dict[Any, int], List[Any], array, array, List[Any]],
+        typed_arrays: Tuple[Any, Any, Any, bool],
+        source: Any
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Run the Numba-compiled Dijkstra kernel on prebuilt typed arrays.
+
+    :param csr: Snapshot from `to_csr(graph)`, for the vertex labels
+    :param typed_arrays: Arrays from `to_typed_arrays(csr)`
+    :param source: Source vertex (must be in the graph)
+    :return: Distance map and predecessor map
+    """
+    index_of, labels, _, _, _ = csr
+    indptr, indices, weights, integral = typed_arrays
+
+    vertex_count = len(labels)
+    distances = np.full(vertex_count, np.inf)
+    predecessors = np.full(vertex_count, -1, dtype=np.int64)
+    heap_keys = np.empty(len(indices) + 1, dtype=np.float64)
+    heap_ids = np.empty(len(indices) + 1, dtype=np.int64)
+
+    _dijkstra_jit(indptr, indices, weights, index_of[source], distances, predecessors, heap_keys, heap_ids)
+
+    distance = dict(zip(labels, distances.tolist()))
+    if integral:
+        for vertex, value in distance.items():
+            if value != float("inf"):
+                distance[vertex] = int(value)
+
+    previous = {
+        vertex: labels[parent] if parent >= 0 else None
+        for vertex, parent in zip(labels, predecessors.tolist())
+    }
+    return distance, previous
+
+
+def shortest_path_dial(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        cache: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Compute shortest paths from source using Dial's bucket queue.
+
+    Suited to small non-negative integer weights. Vertices wait in
+    buckets indexed by tentative distance; with maximum weight C only
+    C + 1 buckets are ever live, so they are reused circularly. Each
+    push and pop is a plain list operation with no log factor, giving
+    O(V * C + E) overall. Entries whose distance improved after they
+    were queued are skipped when popped.
+
+    Falls back to `shortest_path_dijkstra` if any weight is not a
+    non-negative integer.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex
+    :param cache: Graph-owned dict of derived structures; the maximum
+        weight is kept in it
+    :return: Distance map and predecessor map
+    """
+    max_weight = _cached(cache, "max_int_weight", _small_int_max_weight, graph)
+    if max_weight is None or source not in graph:
+        return shortest_path_dijkstra(graph, source, cache=cache)
+
+    return _shortest_path_dial(graph, source, None, max_weight)
+
+
+def _small_int_max_weight(graph: Dict[Any, Dict[Any, Any]]) -> Optional[int]:
+    """
+    Find the largest edge weight if all weights suit a bucket queue.
+
+    :param graph: Adjacency list representation
+    :return: Maximum weight (0 for an edgeless graph), or None if any
+        weight is not a non-negative int
+    """
+    max_weight = 0
+    for neighbors in graph.values():
+        for weight in neighbors.values():
+            if type(weight) is not int or weight < 0:
+                return None
+            if weight > max_weight:
+                max_weight = weight
+
+    return max_weight
+
+
+def _shortest_path_dial(
+        graph: Dict[Any, Dict[Any, Any]],
+        source: Any,
+        target: Optional[Any],
+        max_weight: int
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Dial's algorithm: Dijkstra on a circular array of buckets.
+
+    Distances only grow as buckets are drained, so the bucket for the
+    current distance is final once emptied and no heap is needed.
+
+    :param graph: Adjacency list representation
+    :param source: Source vertex (must be in the graph)
+    :param target: Optional vertex at which to stop early
+    :param max_weight: Largest edge weight in the graph
+    :return: Distance map and predecessor map
+    """
+    distance = dict.fromkeys(graph, float("inf"))
+    previous = dict.fromkeys(graph)
+
+    distance[source] = 0
+    bucket_count = max_weight + 1
+    buckets = [[] for _ in range(bucket_count)]
+    buckets[0].append(source)
+    pending = 1
+    current_distance = 0
+
+    while pending:
+        bucket = buckets[current_distance % bucket_count]
+
+        while bucket:
+            current_vertex = bucket.pop()
+            pending -= 1
+
+            # Stale entry: the vertex was queued again at a shorter distance
+            if distance[current_vertex] != current_distance:
+                continue
+
+            if current_vertex == target:
+                return distance, previous
+
+            for neighbor, weight in graph[current_vertex].items():
+                alt_distance = current_distance + weight
+
+                if alt_distance < distance[neighbor]:
+                    distance[neighbor] = alt_distance
+                    previous[neighbor] = current_vertex
+                    buckets[alt_distance % bucket_count].append(neighbor)
+                    pending += 1
+
+        current_distance += 1
 
     return distance, previous
 
 
 def shortest_path_to(
-        graph: Dict[Any, List[Tuple[Any, Any]]],
+        graph: Dict[Any, Dict[Any, Any]],
         source: Any,
-        destination: Any
+        destination: Any,
+        cache: Optional[Dict[str, Any]] = None
 ) -> List[Any]:
     """
     Reconstruct shortest path between two vertices.
@@ -436,9 +1178,10 @@ def shortest_path_to(
     :param graph: Adjacency list representation
     :param source: Source vertex
     :param destination: Destination vertex
+    :param cache: Graph-owned dict of derived structures
     :return: Shortest path as list of vertices
     """
-    _, previous = shortest_path_dijkstra(graph, source)
+    _, previous = shortest_path_dijkstra(graph, source, destination, cache=cache)
     path = []
     current = destination
 
@@ -453,16 +1196,198 @@ def shortest_path_to(
 # ----------------------------------------------------------------------
 # Utilities
 # ----------------------------------------------------------------------
-def print_graph(graph: Dict[Any, List[Tuple[Any, Any]]]) -> None:
+def print_graph(graph: Dict[Any, Dict[Any, Any]], file: Optional[TextIO] = None) -> None:
     """
     Print adjacency list of weighted graph.
 
+    The listing is assembled with a single join over a generator and
+    emitted with one write call.
+
     :param graph: Adjacency list representation
+    :param file: Output stream (defaults to sys.stdout)
     :return: None
     """
     width = 50
     title = " Undirected Weighted Graph "
-    print(title.center(width, "="))
-    for vertex, neighbors in graph.items():
-        print(f"\tGraph [{vertex}] → {neighbors}")
-    print("=" * width)
+    header = title.center(width, "=")
+    footer = "=" * width
+
+    body = "\n".join(
+        f"\tGraph [{vertex}] → {list(neighbors.items())}"
+        for vertex, neighbors in graph.items()
+    )
+    listing = f"{header}\n{body}\n{footer}\n" if body else f"{header}\n{footer}\n"
+
+    (sys.stdout if file is None else file).write(listing)
+
+
+def _cached(cache: Optional[Dict[str, Any]], key: str, build: Any, *args: Any) -> Any:
+    """
+    Return `build(*args)`, reusing the entry stored under `key` in `cache`.
+
+    The schema clears `cache` on every mutation, so a present entry is
+    always current; entries may legitimately be None.
+
+    :param cache: Graph-owned dict of derived structures, or None
+    :param key: Name of the structure in `cache`
+    :param build: Callable building the structure
+    :param args: Arguments for `build`
+    :return: Cached or freshly built structure
+    """
+    if cache is None:
+        return build(*args)
+    if key not in cache:
+        cache[key] = build(*args)
+    return cache[key]
+
+
+def _find_root(parent: Dict[Any, Any], vertex: Any) -> Any:
+    """
+    Find the representative of a vertex's set, compressing the path.
+
+    :param parent: Union-Find parent pointers
+    :param vertex: Vertex identifier
+    :return: Root vertex of the set
+    """
+    root = vertex
+    while parent[root] != root:
+        root = parent[root]
+
+    # Second pass points every vertex on the path straight at the root
+    while parent[vertex] != root:
+        parent[vertex], vertex = root, parent[vertex]
+
+    return root
+
+
+def _union(parent: Dict[Any, Any], rank: Dict[Any, int], first: Any, second: Any) -> bool:
+    """
+    Merge the sets containing two vertices, attaching by rank.
+
+    :param parent: Union-Find parent pointers
+    :param rank: Upper bound on each root's tree height
+    :param first: First vertex
+    :param second: Second vertex
+    :return: True if the sets were distinct and got merged, otherwise False
+    """
+    first_root = _find_root(parent, first)
+    second_root = _find_root(parent, second)
+
+    if first_root == second_root:
+        return False
+
+    if rank[first_root] < rank[second_root]:
+        first_root, second_root = second_root, first_root
+
+    parent[second_root] = first_root
+    if rank[first_root] == rank[second_root]:
+        rank[first_root] += 1
+
+    return True
+
+
+def _visited_mask(
+        graph: Dict[Any, Dict[Any, Any]],
+        start_vertex: Any,
+        cache: Optional[Dict[str, Any]] = None
+) -> Optional[bytearray]:
+    """
+    Allocate a byte-per-vertex visited mask for dense integer graphs.
+
+    Deciding whether the vertices qualify is an O(V) scan, so the
+    answer is kept in `cache` until the graph changes; allocating the
+    zeroed mask itself runs in C.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex of the traversal
+    :param cache: Graph-owned dict of derived structures
+    :return: Zeroed bytearray indexed by vertex, or None if the vertices
+        are not dense non-negative integers or the start is not a vertex
+    """
+    if start_vertex not in graph:
+        return None
+
+    bound = _cached(cache, "dense_bound", _dense_vertex_bound, graph)
+    return bytearray(bound) if bound else None
+
+
+def _bfs_iterative_dense(graph: Dict[Any, Dict[Any, Any]], start_vertex: int, visited: bytearray) -> List[int]:
+    """
+    `bfs_iterative` with a bytearray visited mask.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :param visited: Zeroed mask from `_visited_mask`
+    :return: BFS traversal order
+    """
+    visited[start_vertex] = 1
+    order = [start_vertex]
+    neighbor_queue = deque([start_vertex])
+
+    while neighbor_queue:
+        current = neighbor_queue.popleft()
+
+        for neighbor in graph[current]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                order.append(neighbor)
+                neighbor_queue.append(neighbor)
+
+    return order
+
+
+def _dfs_iterative_dense(graph: Dict[Any, Dict[Any, Any]], start_vertex: int, state: bytearray) -> List[int]:
+    """
+    `dfs_iterative` with a bytearray vertex-state mask.
+
+    Each vertex is 0 (unseen), 1 (waiting on the stack) or 2 (visited),
+    which replaces both the visited and the stacked sets.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :param state: Zeroed mask from `_visited_mask`
+    :return: DFS traversal order
+    """
+    state[start_vertex] = 2
+    order = [start_vertex]
+    neighbor_stack = []
+    current = start_vertex
+
+    while True:
+        for neighbor in graph[current]:
+            if not state[neighbor]:
+                state[neighbor] = 1
+                neighbor_stack.append(neighbor)
+
+        if not neighbor_stack:
+            break
+
+        current = neighbor_stack.pop()
+        state[current] = 2
+        order.append(current)
+
+    return order
+
+
+def _detect_cycle_dense(graph: Dict[Any, Dict[Any, Any]], start_vertex: int, visited: bytearray) -> bool:
+    """
+    `detect_cycle` with a bytearray visited mask.
+
+    :param graph: Adjacency list representation
+    :param start_vertex: Starting vertex
+    :param visited: Zeroed mask from `_visited_mask`
+    :return: True if cycle exists
+    """
+    stack = [(start_vertex, None)]
+
+    while stack:
+        current, parent = stack.pop()
+        visited[current] = 1
+
+        for neighbor in graph[current]:
+            if not visited[neighbor]:
+                stack.append((neighbor, current))
+            elif neighbor != parent:
+                return True
+
+    return False
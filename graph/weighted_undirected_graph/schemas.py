@@ -29,7 +29,10 @@ Design Notes
 ------------------------------------------------------------------------------------
 - Graph holds state only (adjacency list)
 - Adjacency list format:
-    vertex -> List[(neighbor, weight)]
+    vertex -> Dict[neighbor, weight]
+- Structures derived from the adjacency list (CSR snapshot, typed
+  arrays, ...) are cached in `_cache`, built only by the code path that
+  uses them; every mutation drops them
 - All algorithms and mutations are implemented externally
 ------------------------------------------------------------------------------------
 """
@@ -51,25 +54,52 @@ class Graph:
 
         Adjacency list format:
         {
-            A: [(B, 4), (C, 2)],
-            B: [(A, 4)]
+            A: {B: 4, C: 2},
+            B: {A: 4},
+            C: {A: 2}
         }
+
+        `_cache` holds structures the operations derive from the graph
+        on first use (the CSR snapshot returned by `freeze`, the compiled
+        Dijkstra's typed arrays, ...). Every mutating operation clears it.
         """
         self.graph = {}
+        self._cache = {}
+
+    def _invalidate(self):
+        """
+        Drop cached structures derived from the adjacency list.
+
+        :return: None
+        """
+        self._cache.clear()
+
+    def freeze(self):
+        """
+        Return the CSR snapshot of the graph, building it if needed.
+
+        :return: (vertex → index map, index → vertex list, indptr, indices, weights)
+        """
+        if "csr" not in self._cache:
+            self._cache["csr"] = operations.to_csr(self.graph)
+        return self._cache["csr"]
 
     # ------------------------------------------------------------------
     # Core Operations (REUSED)
     # ------------------------------------------------------------------
     def insert_vertex(self, vertex):
         """Add a vertex to the graph."""
+        self._invalidate()
         return operations.insert_vertex(self.graph, vertex)
 
     def remove_vertex(self, vertex):
         """Remove a vertex and all its incident edges."""
+        self._invalidate()
         return operations.remove_vertex(self.graph, vertex)
 
     def remove_edge(self, from_vertex, to_vertex):
         """Remove an undirected edge between two vertices."""
+        self._invalidate()
         return operations.remove_edge(self.graph, from_vertex, to_vertex)
 
     # ------------------------------------------------------------------
@@ -79,12 +109,14 @@ class Graph:
         """
         Add or update an undirected weighted edge (u ↔ v, w).
         """
+        self._invalidate()
         return operations.insert_edge(self.graph, from_vertex, to_vertex, weight)
 
     def update_edge_weight(self, from_vertex, to_vertex, weight):
         """
         Update weight of an existing edge.
         """
+        self._invalidate()
         return operations.update_edge_weight(self.graph, from_vertex, to_vertex, weight)
 
     def get_edge_weight(self, from_vertex, to_vertex):
@@ -97,16 +129,19 @@ class Graph:
     # Traversals (REUSED – weight-agnostic)
     # ------------------------------------------------------------------
     def bfs_iterative(self, start_vertex):
-        return operations.bfs_iterative(self.graph, start_vertex)
+        return operations.bfs_iterative(self.graph, start_vertex, self._cache)
 
     def bfs_recursive(self, start_vertex):
-        return operations.bfs_recursive(self.graph, [start_vertex], [])
+        return operations.bfs_recursive(self.graph, [start_vertex], [], set())
+
+    def bfs_direction_optimizing(self, start_vertex):
+        return operations.bfs_direction_optimizing(self.graph, start_vertex)
 
     def dfs_iterative(self, start_vertex):
-        return operations.dfs_iterative(self.graph, start_vertex)
+        return operations.dfs_iterative(self.graph, start_vertex, self._cache)
 
     def dfs_recursive(self, start_vertex):
-        return operations.dfs_recursive(self.graph, start_vertex, [])
+        return operations.dfs_recursive(self.graph, start_vertex, [], set())
 
     # ------------------------------------------------------------------
     # Graph Properties (REUSED)
@@ -114,8 +149,11 @@ class Graph:
     def get_connected_components(self):
         return operations.get_connected_components(self.graph)
 
+    def get_connected_components_csr(self):
+        return operations.get_connected_components_csr(self.graph, self._cache)
+
     def detect_cycle(self, start_vertex):
-        return operations.detect_cycle(self.graph, start_vertex)
+        return operations.detect_cycle(self.graph, start_vertex, self._cache)
 
     # ------------------------------------------------------------------
     # Shortest Path / Weight Logic (NEW)
@@ -126,21 +164,33 @@ class Graph:
         """
         return operations.get_path_cost(self.graph, path)
 
-    def shortest_path_dijkstra(self, source):
+    def shortest_path_dijkstra(self, source, target=None, decrease_key=False):
+        """
+        Compute shortest path distances from source, optionally stopping at target.
+        """
+        return operations.shortest_path_dijkstra(self.graph, source, target, decrease_key, self._cache)
+
+    def shortest_path_dial(self, source):
+        """
+        Compute shortest path distances from source with Dial's bucket queue.
+        """
+        return operations.shortest_path_dial(self.graph, source, self._cache)
+
+    def shortest_path_dijkstra_csr(self, source):
         """
-        Compute shortest path distances from source to all vertices.
+        Compute shortest path distances with SciPy on large graphs.
         """
-        return operations.shortest_path_dijkstra(self.graph, source)
+        return operations.shortest_path_dijkstra_csr(self.graph, source, self._cache)
 
     def shortest_path_to(self, source, destination):
         """
         Compute shortest path and cost from source to destination.
         """
-        return operations.shortest_path_to(self.graph, source, destination)
+        return operations.shortest_path_to(self.graph, source, destination, self._cache)
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
-    def print_graph(self):
+    def print_graph(self, file=None):
         """Print the adjacency list representation."""
-        return operations.print_graph(self.graph)
+        return operations.print_graph(self.graph, file)
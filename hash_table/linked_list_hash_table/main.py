@@ -31,19 +31,25 @@ Sample Output
 ------------------------------------------------------------------------------------
 
 ============================= Hash Table =============================
-Bucket 0 → (2025-12-18, 95.75) → None
-Bucket 1 → (2025-12-19, 180.5) → None
+Bucket 0 → None
+Bucket 1 → (2025-12-20, 260.0) → (2025-12-18, 95.75) → (2025-12-16, 310.25) → None
 Bucket 2 → None
-Bucket 3 → (2025-12-20, 260.0) → (2025-12-16, 310.25) → None
-Bucket 4 → (2025-12-17, 420.0) → None
+Bucket 3 → (2025-12-17, 420.0) → None
+Bucket 4 → None
+Bucket 5 → None
+Bucket 6 → None
+Bucket 7 → (2025-12-19, 180.5) → None
 --------------------------------------------------------------------
 Hash Table Details:
-Hash Function      → hash(key) = (∑ ascii(chars)) % table size
+Hash Function      → hash(key) & (table size - 1)
 Num elements       → 5
-Size of hash table → 5
-Load Factor        → 1.00
+Size of hash table → 8
+Load Factor        → 0.62
 ====================================================================
 
+String hashing is salted per process (PYTHONHASHSEED), so bucket placement
+differs between runs; the output above was produced with PYTHONHASHSEED=0.
+
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
@@ -24,7 +24,7 @@ Responsibilities
 - Insert, lookup, and delete operations at hash-table level
 - Resize decision and rehash orchestration
 - Load factor management
-- Invariant validation
+- Invariant validation (debug-gated on mutations)
 
 ------------------------------------------------------------------------------------
 Public Functions
@@ -32,6 +32,7 @@ Public Functions
 - insert_element
 - lookup_element
 - delete_element
+- validate
 - print_hash_table
 
 ------------------------------------------------------------------------------------
@@ -45,51 +46,64 @@ Internal / Helper Functions
 Design Notes
 ------------------------------------------------------------------------------------
 - Functions expect a HashTable instance as the first argument
+- A table created with `fast=True` keeps its entries in one built-in dict;
+  insert/lookup/delete go straight to it and bypass the buckets
 - All linked list manipulation is delegated to linked_list_operations
+- Invariant sweeps walk every node, so mutations only run them when the
+  table's `_debug` flag is set; `validate` runs them unconditionally
 - No direct node manipulation occurs here
-- This module contains no I/O except optional debug utilities
+- This module contains no I/O except optional debug utilities; the resize
+  summary goes to this module's logger at DEBUG level, independent of the
+  `_debug` invariant switch
 
 ------------------------------------------------------------------------------------
 """
 
+import logging
+
 import hash_table.linked_list_hash_table.operations.linked_list_operations as linked_list_operations
 
-def insert_element(ht, key, value, _rehashing = False):
+logger = logging.getLogger(__name__)
+
+def insert_element(ht, key, value):
     """
     Purpose: Insert or update a key-value pair in the hash table
     :param ht: HashTable instance containing buckets and metadata
-    :param _rehashing: True if resize is triggered else False
     :param key: Node(Key & Value associated with the key)
     :param value: Node(Key & Value associated with the key)
     :return: Result of insert operation
     """
-    if not _rehashing:
-        num_elements = ht.get_num_elements()
-        table_size = ht.get_size()
-        alpha = (num_elements + 1) / table_size
-
-        if alpha >= ht.get_resize_threshold():
-            _resize_hash_table(ht)
-            print(
-                "Resizing complete"
-                f"\nNew Table details:"
-                f"\n\tSize = {ht.get_size()}, "
-                f"\n\tNumber of elements = {ht.get_num_elements()}"
-                f"\t\tLoad Factor = {ht.get_load_factor():.2f}"
-            )
-
-    index = _generate_index(ht, key)
+    entries = ht._entries
+    if entries is not None:
+        entries[key] = value
+        ht._num_elements = len(entries)
+        return True
+
+    # hash once; only the mask changes if a resize happens below
+    key_hash = hash(key)
+
+    num_elements = ht.get_num_elements()
+    table_size = ht.get_size()
+    alpha = (num_elements + 1) / table_size
+
+    if alpha >= ht.get_resize_threshold():
+        _resize_hash_table(ht)
+        logger.debug(
+            "Resizing complete: size=%d, num_elements=%d, load_factor=%.2f",
+            ht.get_size(), ht.get_num_elements(), ht.get_load_factor()
+        )
+
+    index = key_hash & (ht.get_size() - 1)
     bucket = ht._buckets[index]
     bucket_size = bucket._size
 
-    linked_list_operations.insert_node(bucket, key, value)
+    linked_list_operations.insert_node(bucket, key, value, ht._debug)
     # increment hast table num of elements for insert only
     # for overwrite bucket size will remain same
     # diff between old and updated value dynamically increment num of elements
     ht._num_elements += (bucket._size - bucket_size)
 
-    if not _rehashing:
-        _check_invariants(ht)
+    _check_invariants(ht)
     return True
 
 def lookup_element(ht, key):
@@ -99,6 +113,9 @@ def lookup_element(ht, key):
     :param key: Key to look up
     :return: Value associated with the key
     """
+    if ht._entries is not None:
+        return ht._entries[key]
+
     index = _generate_index(ht, key)
     bucket = ht._buckets[index]
 
@@ -111,10 +128,16 @@ def delete_element(ht, key):
     :param key: Key to delete
     :return: Result of delete operation
     """
+    entries = ht._entries
+    if entries is not None:
+        del entries[key]
+        ht._num_elements = len(entries)
+        return True
+
     index = _generate_index(ht, key)
     bucket = ht._buckets[index]
 
-    linked_list_operations.delete_node(bucket, key)
+    linked_list_operations.delete_node(bucket, key, ht._debug)
     ht._num_elements -= 1
 
     _check_invariants(ht)
@@ -127,11 +150,12 @@ def _generate_index(ht, key):
     :param key: Key to be hashed
     :return: Computed bucket index
 
-    hash(key)= (∑ ascii(each char in key)) % table size
+    index = hash(key) & (table size - 1)
+
+    The table size is always a power of two, so masking the low bits of
+    the built-in hash is equivalent to `hash(key) % table size`.
     """
-    ascii_sum = sum([ord(char) for char in key])
-    index = ascii_sum % ht.get_size()
-    return index
+    return hash(key) & (ht.get_size() - 1)
 
 def _resize_hash_table(ht):
     """
@@ -142,54 +166,91 @@ def _resize_hash_table(ht):
     old_hash_table = ht._buckets
     old_size = ht.get_size()
     new_size = old_size * 2
-    ht._buckets = ht._create_buckets(new_size)
-    ht._num_elements = 0
+    new_buckets = ht._create_buckets(new_size)
+    mask = new_size - 1
 
+    # keys are already unique and bucket order is irrelevant, so existing
+    # nodes are spliced onto the head of their new bucket: no allocation,
+    # duplicate search or tail walk per entry
     for bucket in old_hash_table:
         curr_node = bucket._head
         while curr_node:
-            print(f"key -> {curr_node._key} & value -> {curr_node._value}")
-            insert_element(ht, curr_node._key, curr_node._value, _rehashing = True)
-            curr_node = curr_node._next
+            next_node = curr_node._next
+            new_bucket = new_buckets[hash(curr_node._key) & mask]
+            linked_list_operations.push_node(new_bucket, curr_node)
+            curr_node = next_node
+
+    ht._buckets = new_buckets
     _check_invariants(ht)
     return True
 
-def _check_invariants(ht):
+def validate(ht):
     """
     Purpose: Validate structural and metadata invariants of the hash table
     :param ht: HashTable instance to validate
-    :return: Nothing
+    :return: True if every invariant holds (raises AssertionError otherwise)
+
+    Checks raise explicitly rather than use `assert`, so they still run
+    under `python -O`.
     """
+    # dict-backed tables only have the element count to keep in step
+    if ht._entries is not None:
+        if len(ht._entries) != ht.get_num_elements():
+            raise AssertionError(
+                f"Invariant violated: num_elements={ht.get_num_elements()}, "
+                f"but actual stored elements={len(ht._entries)}.")
+        return True
+
     # hash table size must be greater than 0
-    assert ht.get_size() > 0, "Invariant violated: Hash table size must be > 0."
+    if ht.get_size() <= 0:
+        raise AssertionError("Invariant violated: Hash table size must be > 0.")
 
     actual_num_elements = 0
     keys = set()
     # buckets must be linked lists
     for index, bucket in enumerate(ht._buckets):
-        assert hasattr(bucket, "_head") and hasattr(bucket, "_size"), \
-            f"Invariant violated: Bucket at index {index} "\
-            f"is not a linked list (found {type(bucket).__name__})."
+        if not (hasattr(bucket, "_head") and hasattr(bucket, "_size")):
+            raise AssertionError(
+                f"Invariant violated: Bucket at index {index} "
+                f"is not a linked list (found {type(bucket).__name__}).")
 
         # key must belong to computed bucket
         curr_node = bucket._head
         while curr_node:
             computed_index = _generate_index(ht, curr_node._key)
-            assert computed_index == index,\
-                f"Invariant violated: Key '{curr_node._key}' is stored in bucket {index}, "\
-                f"but computed index is {computed_index}."
+            if computed_index != index:
+                raise AssertionError(
+                    f"Invariant violated: Key '{curr_node._key}' is stored in bucket {index}, "
+                    f"but computed index is {computed_index}.")
 
             # keys must be unique
-            assert curr_node._key not in keys,\
-                f"Invariant violated: Duplicate key '{curr_node._key}' found in hash table."
+            if curr_node._key in keys:
+                raise AssertionError(
+                    f"Invariant violated: Duplicate key '{curr_node._key}' found in hash table.")
             actual_num_elements += 1
             keys.add(curr_node._key)
             curr_node = curr_node._next
 
+        linked_list_operations._check_invariants(bucket)
+
     # number of elements should match actual num elements
-    assert actual_num_elements == ht.get_num_elements(),\
-        f"Invariant violated: num_elements={ht.get_num_elements()}, "\
-        f"but actual stored elements={actual_num_elements}."
+    if actual_num_elements != ht.get_num_elements():
+        raise AssertionError(
+            f"Invariant violated: num_elements={ht.get_num_elements()}, "
+            f"but actual stored elements={actual_num_elements}.")
+    return True
+
+def _check_invariants(ht):
+    """
+    Purpose: Run the full invariant sweep after a mutation when debugging
+    :param ht: HashTable instance to validate
+    :return: Nothing
+
+    The sweep is O(N), so it is skipped unless `ht._debug` is set
+    (and always under `python -O`).
+    """
+    if __debug__ and ht._debug:
+        validate(ht)
 
 def _get_bucket_as_strings(ht) -> list:
     """
@@ -197,6 +258,12 @@ def _get_bucket_as_strings(ht) -> list:
     :param ht: HashTable instance containing internal storage
     :return: list of strings
     """
+    if ht._entries is not None:
+        body_str = "Entries → "
+        for key, value in ht._entries.items():
+            body_str += f"({key}, {value}) → "
+        return [body_str + "None"]
+
     bucket_bodies = []
     for idx, bucket in enumerate(ht._buckets):
         body_str = f"Bucket {idx} → "
@@ -214,8 +281,9 @@ def _get_metadata_strings(ht) -> list:
     :param ht: HashTable instance containing internal storage
     :return:
     """
+    hash_function = "built-in dict" if ht._entries is not None else "hash(key) & (table size - 1)"
     meta_lines = [
-        ("Hash Function", "hash(key) = (∑ ascii(chars)) % table size"),
+        ("Hash Function", hash_function),
         ("Num elements", f"{ht.get_num_elements()}"),
         ("Size of hash table", f"{ht.get_size()}"),
         ("Load Factor", f"{ht.get_load_factor():.2f}")
@@ -223,8 +291,8 @@ def _get_metadata_strings(ht) -> list:
     return meta_lines
 
 def _compute_max_width(bucket_bodies, meta_lines) -> int:
-    max_meta_line_widths = max([len(left + right) + 3 for left, right in meta_lines])
-    max_bucket_bodies_widths = max([len(body) for body in bucket_bodies])
+    max_meta_line_widths = max(len(left) + len(right) + 3 for left, right in meta_lines)
+    max_bucket_bodies_widths = max(map(len, bucket_bodies))
     tab_width = 8
     width = max(max_bucket_bodies_widths, max_meta_line_widths) + tab_width
     return width
@@ -242,7 +310,7 @@ def print_hash_table(ht):
     meta_lines = _get_metadata_strings(ht)
 
     # --------------- calculate widths ----------------------------------------------
-    max_left_widths = max([len(left) for left, _ in meta_lines])
+    max_left_widths = max(len(left) for left, _ in meta_lines)
     width = _compute_max_width(bucket_bodies, meta_lines)
 
     # --------------- header and footer lines ------------------------------------------
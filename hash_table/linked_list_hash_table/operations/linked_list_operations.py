@@ -28,6 +28,7 @@ Responsibilities
 Public Functions
 ------------------------------------------------------------------------------------
 - insert_node
+- push_node
 - search_node
 - delete_node
 ------------------------------------------------------------------------------------
@@ -35,39 +36,50 @@ Internal / Helper Functions
 ------------------------------------------------------------------------------------
 - _check_invariants
 - _is_empty
+- _node_class
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
 - Functions expect a LinkedList instance as the first argument
 - Node creation is handled outside this module
+- Invariant checks after insert/delete run only when `debug` is passed
 - No hash table metadata is accessed here
 - No I/O is performed
 ------------------------------------------------------------------------------------
 """
 from typing import Any
 
-def insert_node(linked_list, key, value) -> str:
+# Node lives in schemas, which imports the operations package, so it is
+# resolved once on first use instead of at import time or on every insert
+_Node = None
+
+def insert_node(linked_list, key, value, debug = False) -> str:
     """
     Purpose: Insert a node at the tail of the linked list
     :param linked_list: LinkedList instance representing a bucket
     :param key: Node(Key & Value associated with the key)
     :param value: Node(Key & Value associated with the key)
+    :param debug: True to validate the linked list after the insert
     :return: Result of insert operation
     """
-    from hash_table.linked_list_hash_table.schemas import Node
-    new_node = Node(key, value)
+    # a single walk finds either the matching node or the tail
     curr_node = linked_list._head
     prev_node = None
-    while curr_node and curr_node._key != new_node._key:
+    while curr_node and curr_node._key != key:
         prev_node = curr_node
         curr_node = curr_node._next
 
     # overwrite if key is found
     if curr_node:
-        curr_node._value = new_node._value
-        _check_invariants(linked_list)
+        curr_node._value = value
+        if debug:
+            _check_invariants(linked_list)
         return True
 
+    # only a new key needs a node
+    node_class = _Node or _node_class()
+    new_node = node_class(key, value)
+
     # insert at head if bucket is empty else insert at tail
     if linked_list._head == None:
         linked_list._head = new_node
@@ -77,7 +89,23 @@ def insert_node(linked_list, key, value) -> str:
     new_node._next = None
     linked_list._size += 1
 
-    _check_invariants(linked_list)
+    if debug:
+        _check_invariants(linked_list)
+    return True
+
+def push_node(linked_list, node) -> bool:
+    """
+    Purpose: Splice an existing node onto the head of the linked list
+    :param linked_list: LinkedList instance representing a bucket
+    :param node: Node to relink; its key must not already be in the list
+    :return: Result of push operation
+
+    O(1): the node is relinked, not copied, and no duplicate search is
+    done. Used when rehashing, where every key is already unique.
+    """
+    node._next = linked_list._head
+    linked_list._head = node
+    linked_list._size += 1
     return True
 
 def search_node(linked_list, key) -> Any:
@@ -99,11 +127,12 @@ def search_node(linked_list, key) -> Any:
 
     return curr_node._value
 
-def delete_node(linked_list, key) -> bool:
+def delete_node(linked_list, key, debug = False) -> bool:
     """
     Purpose: Delete a node from the linked list by key
     :param linked_list: LinkedList instance representing a bucket
     :param key: Key identifying the node to delete
+    :param debug: True to validate the linked list after the delete
     :return: Result of delete operation
     """
     if _is_empty(linked_list):
@@ -125,7 +154,8 @@ def delete_node(linked_list, key) -> bool:
     curr_node._next = None
     linked_list._size -= 1
 
-    _check_invariants(linked_list)
+    if debug:
+        _check_invariants(linked_list)
     return True
 
 def _check_invariants(linked_list):
@@ -138,14 +168,14 @@ def _check_invariants(linked_list):
     key, value = None, None
     curr_node = linked_list._head
     while curr_node:
-        assert curr_node._key is not None and curr_node._value is not None, \
-            "Invariant violated: hash table entry must have both key and value."
+        if curr_node._key is None or curr_node._value is None:
+            raise AssertionError("Invariant violated: hash table entry must have both key and value.")
 
         temp_size += 1
         curr_node = curr_node._next
 
-    assert temp_size == linked_list._size,\
-        "Invariant violated: linked list size is incorrect."
+    if temp_size != linked_list._size:
+        raise AssertionError("Invariant violated: linked list size is incorrect.")
 
 def _is_empty(linked_list):
     """
@@ -155,4 +185,14 @@ def _is_empty(linked_list):
     """
     if linked_list._size == 0 and linked_list._head == None:
         return True
-    return False
\ No newline at end of file
+    return False
+
+def _node_class():
+    """
+    Purpose: Import and cache the Node class from schemas on first use
+    :return: Node class
+    """
+    global _Node
+    from hash_table.linked_list_hash_table.schemas import Node
+    _Node = Node
+    return _Node
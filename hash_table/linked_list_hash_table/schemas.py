@@ -25,6 +25,8 @@ Design Principles
 - Internal state protected via naming conventions (`_` prefix)
 - HashTable is the only public entry point
 - LinkedList acts as a pure state holder
+- Node and LinkedList declare `__slots__`: one of each exists per entry
+  and per bucket, so they carry no per-instance `__dict__`
 
 ------------------------------------------------------------------------------------
 Data Structures
@@ -51,6 +53,7 @@ HashTable
 - __setitem__ -> Insert or update a key-value pair
 - __getitem__ -> Retrieve value for a given key
 - __delitem__ -> Delete a key-value pair
+- validate -> Run the full invariant sweep over every bucket
 - print_hash_table -> Print internal hash table structure
 
 ------------------------------------------------------------------------------------
@@ -63,6 +66,8 @@ from hash_table.linked_list_hash_table.operations import hash_operations
 # Node
 # ================================================================================
 class Node:
+    __slots__ = ("_key", "_value", "_next")
+
     def __init__(self, key, value):
         """
         Purpose: Initialize a linked list node with a key-value pair
@@ -78,6 +83,8 @@ class Node:
 # LinkedList (Bucket State Holder)
 # ================================================================================
 class LinkedList:
+    __slots__ = ("_head", "_size")
+
     def __init__(self):
         """
         Purpose: Initialize an empty linked list bucket
@@ -108,20 +115,30 @@ class HashTable:
     Internal details such as hashing strategy, collision handling, resizing,
     and invariant enforcement are intentionally hidden from users.
 
+    Passing `fast=True` swaps the buckets for a single built-in dict
+    (`_entries`); the dictionary-style API is unchanged.
+
     Invariants:
-    - `_buckets` is a fixed-size list of LinkedList instances
+    - `_buckets` is a fixed-size list of LinkedList instances (empty when fast)
     - `_num_elements` accurately reflects total stored key-value pairs
     - Load factor is derived as num_elements / number of buckets
     - No duplicate keys exist across buckets
     """
-    def __init__(self):
+    def __init__(self, fast = False):
         """
         Purpose: Initialize an empty hash table with linked list buckets
+        :param fast: True to store entries in a built-in dict instead of
+            linked list buckets (same API, no chaining internals)
         :return: Nothing
         """
-        self._buckets = self._create_buckets(5)
+        # power-of-two bucket count, kept by doubling on resize, so the
+        # bucket index is a bitmask of hash(key)
+        self._buckets = [] if fast else self._create_buckets(8)
+        self._entries = {} if fast else None
         self._num_elements = 0
         self.resize_threshold = 1.2
+        # full invariant sweeps after every mutation (O(N) each)
+        self._debug = False
 
 # ============== operations =================================================================
     # --------------------------------------------------------------------------
@@ -158,6 +175,9 @@ class HashTable:
         Purpose: Compute the current load factor of the hash table
         :return: Load factor calculated as num_elements / table size
         """
+        # dict-backed tables have no buckets
+        if not self.get_size():
+            return 0.0
         return self.get_num_elements() / self.get_size()
 
     def get_resize_threshold(self) -> float:
@@ -196,6 +216,14 @@ class HashTable:
         """
         return hash_operations.delete_element(self, key)
 
+    def validate(self) -> bool:
+        """
+        Purpose: Check every hash table and bucket invariant, regardless of `_debug`
+        (also under `python -O`)
+        :return: True if the hash table is consistent (raises AssertionError otherwise)
+        """
+        return hash_operations.validate(self)
+
     def print_hash_table(self) -> None:
         """
         Purpose: Print the internal structure of the hash table for inspection
@@ -0,0 +1,332 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: hash_operations
+------------------------------------------------------------------------------------
+This module implements **hash table–level operational logic** for a HashTable
+that uses **open addressing with linear probing** for collision resolution.
+
+It acts as the execution layer for the HashTable schema, which only holds the
+two parallel slot lists and metadata.
+
+This module is responsible for:
+- Computing home slots and probe sequences
+- Inserting, finding and deleting keys in place
+- Maintaining hash table metadata (element and tombstone counts)
+- Enforcing hash table invariants
+- Handling resizing and rehashing
+
+No schema definitions are declared here.
+------------------------------------------------------------------------------------
+Responsibilities
+------------------------------------------------------------------------------------
+- Hash computation and linear probing
+- Insert, lookup, and delete operations at hash-table level
+- Tombstone handling for deletes
+- Resize decision and rehash orchestration
+- Invariant validation (debug-gated on mutations)
+
+------------------------------------------------------------------------------------
+Public Functions
+------------------------------------------------------------------------------------
+- insert_element
+- lookup_element
+- delete_element
+- validate
+- print_hash_table
+
+------------------------------------------------------------------------------------
+Internal / Helper Functions
+------------------------------------------------------------------------------------
+- _probe
+- _resize_hash_table
+- _check_invariants
+
+------------------------------------------------------------------------------------
+Design Notes
+------------------------------------------------------------------------------------
+- Functions expect a HashTable instance as the first argument
+- Keys and values live in two flat lists indexed by slot, so a probe
+  walks contiguous list storage instead of following node pointers
+- The home slot is `hash(key) & (table size - 1)`; collisions move to the
+  next slot, wrapping around
+- Deleting leaves a `DELETED` tombstone: probes continue past it, inserts
+  may reuse it
+- Tombstones count towards the resize threshold, and a resize drops them
+- Invariant sweeps walk every slot, so mutations only run them when the
+  table's `_debug` flag is set; `validate` runs them unconditionally
+- This module contains no I/O except optional debug utilities
+
+------------------------------------------------------------------------------------
+"""
+
+# slot markers; compared by identity, so any key value (even None) can be stored
+EMPTY = object()
+DELETED = object()
+
+def insert_element(ht, key, value):
+    """
+    Purpose: Insert or update a key-value pair in the hash table
+    :param ht: HashTable instance containing slots and metadata
+    :param key: Key to insert or update
+    :param value: Value associated with the key
+    :return: Result of insert operation
+    """
+    index, free = _probe(ht, key)
+
+    # overwrite if key is found
+    if index >= 0:
+        ht._values[index] = value
+        return True
+
+    # reusing a tombstone leaves the empty slots as they are; taking an
+    # empty slot may first need a rebuild so probes stay short
+    if ht._keys[free] is DELETED:
+        ht._num_deleted -= 1
+    else:
+        occupied = ht._num_elements + ht._num_deleted + 1
+        if occupied / ht.get_size() > ht.get_resize_threshold():
+            _resize_hash_table(ht)
+            _, free = _probe(ht, key)
+
+    ht._keys[free] = key
+    ht._values[free] = value
+    ht._num_elements += 1
+
+    _check_invariants(ht)
+    return True
+
+def lookup_element(ht, key):
+    """
+    Purpose: Retrieve the value associated with a given key from the hash table
+    :param ht: HashTable instance containing slots
+    :param key: Key to look up
+    :return: Value associated with the key
+    """
+    index, _ = _probe(ht, key)
+    if index < 0:
+        raise KeyError(f"Lookup failed: key {key} is not in hash table.")
+
+    return ht._values[index]
+
+def delete_element(ht, key):
+    """
+    Purpose: Remove a key-value pair from the hash table
+    :param ht: HashTable instance containing slots and metadata
+    :param key: Key to delete
+    :return: Result of delete operation
+    """
+    index, _ = _probe(ht, key)
+    if index < 0:
+        raise KeyError(f"Delete failed: key {key} is not in hash table.")
+
+    # tombstone keeps keys further along the probe sequence reachable
+    ht._keys[index] = DELETED
+    ht._values[index] = None
+    ht._num_elements -= 1
+    ht._num_deleted += 1
+
+    _check_invariants(ht)
+    return True
+
+def _probe(ht, key):
+    """
+    Purpose: Walk the linear probe sequence of a key
+    :param ht: HashTable instance containing slots
+    :param key: Key to look for
+    :return: (slot holding the key or -1, first reusable slot on the way)
+
+    The walk stops at the key or at the first EMPTY slot; the table always
+    keeps at least one, so it terminates.
+    """
+    keys = ht._keys
+    mask = len(keys) - 1
+    index = hash(key) & mask
+    free = -1
+
+    while True:
+        slot_key = keys[index]
+        if slot_key is EMPTY:
+            return -1, (index if free < 0 else free)
+        if slot_key is DELETED:
+            if free < 0:
+                free = index
+        elif slot_key is key or slot_key == key:
+            return index, free
+        index = (index + 1) & mask
+
+def _resize_hash_table(ht):
+    """
+    Purpose: Rebuild the slot lists, dropping tombstones, and rehash all elements
+    :param ht: HashTable instance to be resized
+    :return: Result of resize operation
+
+    The size doubles when the stored keys (plus the one being inserted)
+    fill more than half the threshold; when the pressure came mostly
+    from tombstones the size stays the same and only they are dropped.
+    """
+    old_keys = ht._keys
+    old_values = ht._values
+    new_size = ht.get_size()
+    if (ht._num_elements + 1) / new_size > ht.get_resize_threshold() / 2:
+        new_size *= 2
+
+    new_keys = ht._create_slots(new_size, EMPTY)
+    new_values = ht._create_slots(new_size, None)
+    mask = new_size - 1
+
+    # keys are unique and the new table has no tombstones, so each key
+    # goes into the first empty slot of its probe sequence
+    for key, value in zip(old_keys, old_values):
+        if key is EMPTY or key is DELETED:
+            continue
+        index = hash(key) & mask
+        while new_keys[index] is not EMPTY:
+            index = (index + 1) & mask
+        new_keys[index] = key
+        new_values[index] = value
+
+    ht._keys = new_keys
+    ht._values = new_values
+    ht._num_deleted = 0
+    _check_invariants(ht)
+    return True
+
+def validate(ht):
+    """
+    Purpose: Validate structural and metadata invariants of the hash table
+    :param ht: HashTable instance to validate
+    :return: True if every invariant holds (raises AssertionError otherwise)
+
+    Checks raise explicitly rather than use `assert`, so they still run
+    under `python -O`.
+    """
+    size = ht.get_size()
+    # slot count must be a positive power of two
+    if size <= 0 or size & (size - 1):
+        raise AssertionError(
+            f"Invariant violated: Hash table size must be a power of two (found {size}).")
+    if len(ht._values) != size:
+        raise AssertionError("Invariant violated: key and value slot lists differ in length.")
+
+    actual_num_elements = 0
+    actual_num_deleted = 0
+    keys = set()
+    for index, key in enumerate(ht._keys):
+        if key is EMPTY:
+            continue
+        if key is DELETED:
+            actual_num_deleted += 1
+            continue
+
+        # key must be reachable from its home slot
+        found, _ = _probe(ht, key)
+        if found != index:
+            raise AssertionError(
+                f"Invariant violated: Key '{key}' is stored in slot {index}, "
+                f"but probing finds slot {found}.")
+
+        # keys must be unique
+        if key in keys:
+            raise AssertionError(f"Invariant violated: Duplicate key '{key}' found in hash table.")
+        keys.add(key)
+        actual_num_elements += 1
+
+    # metadata must match slot contents
+    if actual_num_elements != ht.get_num_elements():
+        raise AssertionError(
+            f"Invariant violated: num_elements={ht.get_num_elements()}, "
+            f"but actual stored elements={actual_num_elements}.")
+    if actual_num_deleted != ht._num_deleted:
+        raise AssertionError(
+            f"Invariant violated: num_deleted={ht._num_deleted}, "
+            f"but actual tombstones={actual_num_deleted}.")
+
+    # probes terminate only if an empty slot exists
+    if actual_num_elements + actual_num_deleted >= size:
+        raise AssertionError("Invariant violated: no empty slot left.")
+    return True
+
+def _check_invariants(ht):
+    """
+    Purpose: Run the full invariant sweep after a mutation when debugging
+    :param ht: HashTable instance to validate
+    :return: Nothing
+
+    The sweep is O(N), so it is skipped unless `ht._debug` is set
+    (and always under `python -O`).
+    """
+    if __debug__ and ht._debug:
+        validate(ht)
+
+def _get_slots_as_strings(ht) -> list:
+    """
+    Purpose: traverses slots and creates string representation
+    :param ht: HashTable instance containing internal storage
+    :return: list of strings
+    """
+    slot_bodies = []
+    for idx, (key, value) in enumerate(zip(ht._keys, ht._values)):
+        if key is EMPTY:
+            body_str = f"Slot {idx} → None"
+        elif key is DELETED:
+            body_str = f"Slot {idx} → <deleted>"
+        else:
+            body_str = f"Slot {idx} → ({key}, {value})"
+        slot_bodies.append(body_str)
+    return slot_bodies
+
+def _get_metadata_strings(ht) -> list:
+    """
+    Purpose: create metadata strings from hash table metadata
+    :param ht: HashTable instance containing internal storage
+    :return: list of (label, value) pairs
+    """
+    meta_lines = [
+        ("Hash Function", "hash(key) & (table size - 1)"),
+        ("Probing", "linear (next slot, wrapping)"),
+        ("Num elements", f"{ht.get_num_elements()}"),
+        ("Deleted slots", f"{ht._num_deleted}"),
+        ("Size of hash table", f"{ht.get_size()}"),
+        ("Load Factor", f"{ht.get_load_factor():.2f}")
+    ]
+    return meta_lines
+
+def _compute_max_width(slot_bodies, meta_lines) -> int:
+    max_meta_line_widths = max(len(left) + len(right) + 3 for left, right in meta_lines)
+    max_slot_bodies_widths = max(map(len, slot_bodies))
+    tab_width = 8
+    width = max(max_slot_bodies_widths, max_meta_line_widths) + tab_width
+    return width
+
+def print_hash_table(ht):
+    """
+    Purpose: Print the internal structure of the hash table for inspection
+    :param ht: HashTable instance containing internal storage
+    :return: Nothing
+    """
+    # -------------- preparing strings to be printed -----------------------
+    slot_bodies = _get_slots_as_strings(ht)
+
+    # -------------- meta lines for hash table metadata -----------------------
+    meta_lines = _get_metadata_strings(ht)
+
+    # --------------- calculate widths ----------------------------------------------
+    max_left_widths = max(len(left) for left, _ in meta_lines)
+    width = _compute_max_width(slot_bodies, meta_lines)
+
+    # --------------- header and footer lines ------------------------------------------
+    title = "Hash Table"
+    header = f"{title.center(width, '=')}"
+    footer = "=" * width
+    feed_row = "-" * width
+
+    # --------------- print hash table ----------------------------------------------
+    print(header)
+    for body in slot_bodies:
+        print(body)
+
+    print(feed_row)
+    print("Hash Table Details:")
+    for left, right in meta_lines:
+        print(f"{left.ljust(max_left_widths)} → {right}")
+    print(footer)
@@ -0,0 +1,178 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: open_addressing_hash_table_schemas
+------------------------------------------------------------------------------------
+
+This module defines the **schema layer** for a Hash Table implementation that
+uses **open addressing with linear probing** for collision handling.
+
+The module is intentionally limited to **state representation and public API
+exposure**, with all operational logic delegated to the operations module.
+
+It provides:
+- HashTable abstraction exposing dictionary-style access
+
+Entries live directly in two flat, parallel slot lists (keys and values);
+there are no bucket or node objects.
+
+------------------------------------------------------------------------------------
+Design Principles
+------------------------------------------------------------------------------------
+- No business logic in schema classes
+- No direct slot manipulation outside operations layer
+- Internal state protected via naming conventions (`_` prefix)
+- HashTable is the only public entry point
+
+------------------------------------------------------------------------------------
+Data Structures
+------------------------------------------------------------------------------------
+- HashTable -> Hash table abstraction backed by parallel key/value slot lists
+
+------------------------------------------------------------------------------------
+Public Functions / Methods
+------------------------------------------------------------------------------------
+HashTable
+- __init__ -> Initialize hash table with empty slots
+- get_num_elements -> Return total stored elements
+- get_size -> Return number of slots
+- get_load_factor -> Compute current load factor
+- __setitem__ -> Insert or update a key-value pair
+- __getitem__ -> Retrieve value for a given key
+- __delitem__ -> Delete a key-value pair
+- validate -> Run the full invariant sweep over every slot
+- print_hash_table -> Print internal hash table structure
+
+------------------------------------------------------------------------------------
+"""
+
+from typing import Any
+from hash_table.open_addressing_hash_table.operations import hash_operations
+
+# ================================================================================
+# HashTable (Public Interface)
+# ================================================================================
+class HashTable:
+    """
+    Hash table implementation using open addressing with linear probing.
+
+    This class represents the public interface and state holder for the hash
+    table. It exposes dictionary-style access for inserting, retrieving, and
+    deleting key-value pairs while delegating all operational logic to the
+    `hash_operations` module.
+
+    A key is stored in the first free slot at or after `hash(key)`, scanning
+    forward one slot at a time. Deleted slots hold a tombstone marker so
+    later keys on the same probe sequence stay reachable.
+
+    Invariants:
+    - `_keys` and `_values` have the same power-of-two length
+    - Every slot key is a stored key, `EMPTY` or `DELETED`
+    - `_num_elements` / `_num_deleted` count stored keys / tombstones
+    - At least one slot is always `EMPTY`, so every probe terminates
+    - No duplicate keys exist across slots
+    """
+    def __init__(self):
+        """
+        Purpose: Initialize an empty hash table with open-addressed slots
+        :return: Nothing
+        """
+        # power-of-two slot count, kept by doubling on resize, so the
+        # home slot is a bitmask of hash(key)
+        self._keys = self._create_slots(8, hash_operations.EMPTY)
+        self._values = self._create_slots(8, None)
+        self._num_elements = 0
+        self._num_deleted = 0
+        # resize once stored keys plus tombstones would exceed this fraction
+        self.resize_threshold = 0.7
+        # full invariant sweeps after every mutation (O(N) each)
+        self._debug = False
+
+# ============== operations =================================================================
+    # --------------------------------------------------------------------------
+    # Internal helpers
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _create_slots(size, fill):
+        """
+        Purpose: create a slot list of provided size
+        :param size: number of slots
+        :param fill: initial content of every slot
+        :return: slot list
+        """
+        return [fill] * size
+
+    # --------------------------------------------------------------------------
+    # Metadata accessors
+    # --------------------------------------------------------------------------
+    def get_num_elements(self) -> int:
+        """
+        Purpose: Return the total number of key-value pairs stored in the hash table
+        :return: Number of elements in the hash table
+        """
+        return self._num_elements
+
+    def get_size(self) -> int:
+        """
+        Purpose: Return the number of slots in the hash table
+        :return: Hash table slot count
+        """
+        return len(self._keys)
+
+    def get_load_factor(self) -> float:
+        """
+        Purpose: Compute the current load factor of the hash table
+        :return: Load factor calculated as num_elements / table size
+        """
+        return self.get_num_elements() / self.get_size()
+
+    def get_resize_threshold(self) -> float:
+        """
+        Purpose: return resize_threshold variable
+        :return: resize_threshold
+        """
+        return self.resize_threshold
+
+    # --------------------------------------------------------------------------
+    # Public dictionary-style API
+    # --------------------------------------------------------------------------
+    def __setitem__(self, key, value) -> Any:
+        """
+        Purpose: Insert or update a key-value pair in the hash table
+        :param key: Key to insert or update
+        :param value: Value associated with the key
+        :return: Result of insert operation
+        """
+        return hash_operations.insert_element(self, key, value)
+
+    def __getitem__(self, key) -> Any:
+        """
+        Purpose: Retrieve the value associated with a given key
+        :param key: Key to look up
+        :return: Value associated with the key
+        """
+        return hash_operations.lookup_element(self, key)
+
+    def __delitem__(self, key) -> Any:
+        """
+        Purpose: Delete a key-value pair from the hash table
+        :param key: Key to delete
+        :return: Result of delete operation
+        """
+        return hash_operations.delete_element(self, key)
+
+    def validate(self) -> bool:
+        """
+        Purpose: Check every hash table invariant, regardless of `_debug`
+        (also under `python -O`)
+        :return: True if the hash table is consistent (raises AssertionError otherwise)
+        """
+        return hash_operations.validate(self)
+
+    def print_hash_table(self) -> None:
+        """
+        Purpose: Print the internal structure of the hash table for inspection
+        :return: Nothing
+        """
+        return hash_operations.print_hash_table(self)
+
+#============================================================================================